@@ -73,6 +73,10 @@ def schedule_summary_job(user_id: str, summary_range: str) -> None:  # pragma: n
     # Schedule the job
     job_table.put_job(job)  # pragma: no cover
 
+    # Make sure an idle job poller, in this process or another, picks the job up promptly
+    job_table.signal_new_jobs()  # pragma: no cover
+    get_scheduler().reset_job_polling_backoff()  # pragma: no cover
+
 
 def create_app(
     log_store: LogStore | None = None, llm: LLMClient | None = None, *, enable_scheduler: bool = True
@@ -145,7 +145,8 @@ def run_job_worker(  # pragma: no cover
                     click.echo(f'Processed {processed_count} jobs')  # pragma: no cover
                     logger.info('Processed %d jobs', processed_count)  # pragma: no cover
 
-                time.sleep(poll_interval_seconds)  # pragma: no cover
+                # Sleep until the next job is due, but never longer than the poll interval
+                time.sleep(worker.get_poll_delay(poll_interval_seconds))  # pragma: no cover
 
             except KeyboardInterrupt:  # pragma: no cover
                 raise  # pragma: no cover
@@ -8,6 +8,9 @@ from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, Field
 
+from companion_memory.summarizer import get_user_timezone
+from companion_memory.user_ids import parse_user_ids
+
 if TYPE_CHECKING:  # pragma: no cover
     from companion_memory.deduplication import DeduplicationIndex
     from companion_memory.job_table import JobTable
@@ -77,7 +80,7 @@ def schedule_daily_summaries(
         now_utc: Current time in UTC (for testing), defaults to datetime.now(UTC)
 
     """
-    from companion_memory.job_models import ScheduledJob
+    from companion_memory.job_models import ScheduledJob, make_job_sk
 
     # Get current time
     if now_utc is None:
@@ -88,7 +91,7 @@ def schedule_daily_summaries(
     if not daily_summary_users:
         return
 
-    user_ids = [user_id.strip() for user_id in daily_summary_users.split(',') if user_id.strip()]
+    user_ids = parse_user_ids(daily_summary_users)
 
     for user_id in user_ids:
         # Get user's timezone from settings, default to UTC if not found
@@ -114,22 +117,22 @@ def schedule_daily_summaries(
         local_7am = next_7am_utc.astimezone(user_tz)
         local_date = local_7am.date().isoformat()
 
-        # Try to reserve this job (deduplication)
-        if deduplication_index.try_reserve(logical_job_id, local_date, 'job', f'scheduled#{next_7am_utc.isoformat()}'):
-            # Create the scheduled job
-            job = ScheduledJob(
-                job_id=uuid.uuid4(),  # Generate a new UUID for the actual job
-                job_type='daily_summary',
-                payload={'user_id': user_id},
-                scheduled_for=next_7am_utc,
-                status='pending',
-                attempts=0,
-                locked_by=None,
-                lock_expires_at=None,
-                created_at=now_utc,
-            )
-
-            # Store the job
+        # Create the scheduled job
+        job = ScheduledJob(
+            job_id=uuid.uuid4(),  # Generate a new UUID for the actual job
+            job_type='daily_summary',
+            payload={'user_id': user_id},
+            scheduled_for=next_7am_utc,
+            status='pending',
+            attempts=0,
+            locked_by=None,
+            lock_expires_at=None,
+            created_at=now_utc,
+        )
+
+        # Try to reserve this job (deduplication), then store it
+        job_sk = make_job_sk(next_7am_utc, job.job_id_str)
+        if deduplication_index.try_reserve(logical_job_id, local_date, 'job', job_sk):
             job_table.put_job(job)
 
 
@@ -165,10 +168,8 @@ class DailySummaryHandler:
             import logging
             from datetime import datetime
 
-            from companion_memory.summarizer import _get_user_timezone
-
             logger = logging.getLogger(__name__)
-            user_tz = _get_user_timezone(payload.user_id)
+            user_tz = get_user_timezone(payload.user_id)
             now_user_tz = datetime.now(user_tz)
 
             logger.info('Would send daily summary to user %s for %s', payload.user_id, now_user_tz.date())
@@ -1,15 +1,22 @@
 """Deduplication index for preventing duplicate job scheduling."""
 
-from typing import TYPE_CHECKING
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import boto3
 from botocore.exceptions import ClientError
 
+from companion_memory.exceptions import SchedulerLockLostError
 from companion_memory.job_models import ScheduledJob, make_job_sk
 
 if TYPE_CHECKING:  # pragma: no cover
     from companion_memory.job_table import JobTable
 
+# Most items DynamoDB accepts in a single TransactWriteItems request
+TRANSACT_WRITE_MAX_ITEMS = 100
+
 
 class DeduplicationIndex:
     """DynamoDB-based deduplication index for job scheduling."""
@@ -28,6 +35,44 @@ class DeduplicationIndex:
         region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
         self._dynamodb = boto3.resource('dynamodb', region_name=region)
         self._table = self._dynamodb.Table(table_name)
+        # Per-thread reservation list and fence, active only inside track_reservations() and fenced_by()
+        self._local = threading.local()
+
+    @contextmanager
+    def track_reservations(self) -> Iterator[list[tuple[str, str, str]]]:
+        """Record the reservations made by this thread while the block is active.
+
+        Yields:
+            List that collects (logical_id, date, job_sk) for each successful reservation
+
+        """
+        reservations: list[tuple[str, str, str]] = []
+        self._local.reservations = reservations
+        try:
+            yield reservations
+        finally:
+            self._local.reservations = None
+
+    @contextmanager
+    def fenced_by(self, condition_check: dict[str, Any]) -> Iterator[None]:
+        """Make this thread's reservations conditional on another item, such as a lock's fencing token.
+
+        While the block is active, every reservation is written in a transaction
+        together with the given condition check. If the check fails, nothing is
+        reserved and SchedulerLockLostError is raised.
+
+        Args:
+            condition_check: TransactWriteItems ConditionCheck, with plain Python attribute values
+
+        Yields:
+            None
+
+        """
+        self._local.fence = condition_check
+        try:
+            yield
+        finally:
+            self._local.fence = None
 
     def create_table_for_testing(self) -> None:
         """Create DynamoDB table for testing purposes only."""
@@ -60,12 +105,10 @@ class DeduplicationIndex:
             True if reservation succeeded, False if already reserved
 
         """
-        item = {
-            'PK': f'scheduled-job#{logical_id}',
-            'SK': date,
-            'job_pk': job_pk,
-            'job_sk': job_sk,
-        }
+        if getattr(self._local, 'fence', None) is not None:
+            return self.try_reserve_many([(logical_id, date, job_pk, job_sk)])[0]
+
+        item = self._reservation_item(logical_id, date, job_pk, job_sk)
 
         try:
             # Use conditional write to prevent duplicates
@@ -76,8 +119,128 @@ class DeduplicationIndex:
                 return False
             raise  # Re-raise other errors
         else:
+            self._record_reservation(logical_id, date, job_sk)
             return True
 
+    def try_reserve_many(self, reservations: Sequence[tuple[str, str, str, str]]) -> list[bool]:
+        """Try to reserve several deduplication slots with as few requests as possible.
+
+        Reservations are written together in one transaction. A transaction is
+        all-or-nothing, so when some slots are already reserved it is retried
+        with only the remaining ones.
+
+        Args:
+            reservations: (logical_id, date, job_pk, job_sk) for each slot; each slot may appear only once
+
+        Returns:
+            For each reservation in order, True if it succeeded, False if already reserved
+
+        """
+        # A fence takes one of the transaction's item slots
+        fence = getattr(self._local, 'fence', None)
+        batch_size = TRANSACT_WRITE_MAX_ITEMS - (fence is not None)
+        results = [False] * len(reservations)
+        for start in range(0, len(reservations), batch_size):
+            pending = list(range(start, min(start + batch_size, len(reservations))))
+            while pending:
+                conflicted = self._transact_reserve([reservations[index] for index in pending])
+                if not conflicted:
+                    for index in pending:
+                        results[index] = True
+                        logical_id, date, _, job_sk = reservations[index]
+                        self._record_reservation(logical_id, date, job_sk)
+                    break
+                pending = [index for position, index in enumerate(pending) if position not in conflicted]
+        return results
+
+    def _transact_reserve(self, reservations: Sequence[tuple[str, str, str, str]]) -> set[int]:
+        """Write reservations in a single transaction, only if none of them exists yet.
+
+        Args:
+            reservations: (logical_id, date, job_pk, job_sk) for each slot
+
+        Returns:
+            Positions of the reservations that already existed; empty if all were written
+
+        Raises:
+            SchedulerLockLostError: If the transaction was fenced and the fence's condition failed
+            ClientError: If the transaction failed for any other reason
+
+        """
+        transact_items = [
+            {
+                'Put': {
+                    'TableName': self._table_name,
+                    'Item': self._reservation_item(*reservation),
+                    'ConditionExpression': 'attribute_not_exists(PK)',
+                }
+            }
+            for reservation in reservations
+        ]
+        fence = getattr(self._local, 'fence', None)
+        if fence is not None:
+            transact_items.append({'ConditionCheck': fence})
+        try:
+            # The resource's client converts attribute values from plain Python types
+            self._dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'TransactionCanceledException':
+                raise
+            reasons = e.response.get('CancellationReasons', [])
+            conflicted = {
+                position for position, reason in enumerate(reasons) if reason.get('Code') == 'ConditionalCheckFailed'
+            }
+            if fence is not None and len(reservations) in conflicted:
+                raise SchedulerLockLostError('Reservations were fenced by a lock that is no longer held') from e
+            if not conflicted:
+                # Cancelled for another reason, such as a conflicting concurrent transaction
+                raise
+            return conflicted
+        return set()
+
+    def _reservation_item(self, logical_id: str, date: str, job_pk: str, job_sk: str) -> dict[str, Any]:
+        """Build the DynamoDB item for a reservation.
+
+        Args:
+            logical_id: Logical identifier for the job
+            date: Date string for the reservation
+            job_pk: Job partition key to reference
+            job_sk: Job sort key to reference
+
+        Returns:
+            DynamoDB item dictionary
+
+        """
+        return {
+            'PK': f'scheduled-job#{logical_id}',
+            'SK': date,
+            'job_pk': job_pk,
+            'job_sk': job_sk,
+        }
+
+    def _record_reservation(self, logical_id: str, date: str, job_sk: str) -> None:
+        """Record a successful reservation if this thread is tracking them.
+
+        Args:
+            logical_id: Logical identifier for the job
+            date: Date string of the reservation
+            job_sk: Sort key of the job the reservation references
+
+        """
+        reservations = getattr(self._local, 'reservations', None)
+        if reservations is not None:
+            reservations.append((logical_id, date, job_sk))
+
+    def release(self, logical_id: str, date: str) -> None:
+        """Release a reservation so the logical job can be scheduled again.
+
+        Args:
+            logical_id: Logical identifier for the job
+            date: Date string of the reservation
+
+        """
+        self._table.delete_item(Key={'PK': f'scheduled-job#{logical_id}', 'SK': date})
+
     def schedule_if_needed(self, job: ScheduledJob, job_table: 'JobTable', logical_id: str, date: str) -> bool:
         """Schedule a job only if not already scheduled for the given logical ID and date.
 
@@ -11,3 +11,11 @@ class LLMConfigurationError(CompanionMemoryError):
 
 class LLMGenerationError(CompanionMemoryError):
     """Exception raised when there's an error generating LLM completions."""
+
+
+class LLMUnavailableError(LLMGenerationError):
+    """Exception raised when LLM calls are skipped because recent calls kept failing."""
+
+
+class SchedulerLockLostError(CompanionMemoryError):
+    """Exception raised when a write fenced by the scheduler lock is made after the lock was lost."""
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 JobStatus = Literal['pending', 'in_progress', 'completed', 'failed', 'dead_letter', 'cancelled']
 
@@ -31,13 +31,28 @@ class ScheduledJob(BaseModel):
     created_at: datetime = Field(description='Job creation time')
     completed_at: datetime | None = Field(default=None, description='Job completion time')
 
+    _job_id_str: tuple[UUID, str] | None = PrivateAttr(default=None)
 
-def make_job_sk(scheduled_for: datetime, job_id: UUID) -> str:
+    @property
+    def job_id_str(self) -> str:
+        """Get the canonical string form of the job ID, formatted once per job ID.
+
+        The cached string is keyed on the ``job_id`` it was formatted from, so it
+        stays correct when ``job_id`` is reassigned or replaced via ``model_copy``.
+        """
+        cached = self._job_id_str
+        if cached is None or cached[0] is not self.job_id:
+            cached = (self.job_id, str(self.job_id))
+            self._job_id_str = cached
+        return cached[1]
+
+
+def make_job_sk(scheduled_for: datetime, job_id: UUID | str) -> str:
     """Generate DynamoDB sort key for a scheduled job.
 
     Args:
         scheduled_for: When the job should run (UTC)
-        job_id: Unique identifier for the job
+        job_id: Unique identifier for the job (UUID or its string form)
 
     Returns:
         Sort key in format: scheduled#<ISO8601 timestamp>#<UUID>
@@ -1,5 +1,8 @@
 """DynamoDB client for job queue operations."""
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -7,7 +10,13 @@ from uuid import UUID
 import boto3
 from boto3.dynamodb.conditions import Attr, Key
 
-from companion_memory.job_models import ScheduledJob, make_job_sk
+from companion_memory.job_models import ScheduledJob, make_job_sk, parse_job_sk
+
+# Most items DynamoDB accepts in a single BatchWriteItem request
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Item holding a counter that is bumped whenever jobs are enqueued for idle pollers to pick up
+NEW_JOBS_SIGNAL_KEY = {'PK': 'job-poller', 'SK': 'new-jobs'}
 
 
 class JobTable:
@@ -27,6 +36,54 @@ class JobTable:
         region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
         self._dynamodb = boto3.resource('dynamodb', region_name=region)
         self._table = self._dynamodb.Table(table_name)
+        # Per-thread (buffer, written sort keys), active only inside batch_writes()
+        self._local = threading.local()
+
+    @contextmanager
+    def batch_writes(self) -> Iterator[set[str]]:
+        """Buffer put_job calls from this thread into BatchWriteItem requests.
+
+        Jobs are flushed in batches of up to 25 items, and any remainder is
+        flushed when the block exits. Calls from other threads are unaffected.
+        A failed flush raises its error and drops the jobs it had not written,
+        so the yielded set shows exactly which jobs reached the table.
+
+        Yields:
+            Set collecting the sort key of every job the batch wrote
+
+        """
+        buffer: list[dict[str, Any]] = []
+        written: set[str] = set()
+        self._local.batch = (buffer, written)
+        try:
+            yield written
+        finally:
+            self._local.batch = None
+            self._flush_batch(buffer, written)
+
+    def _flush_batch(self, buffer: list[dict[str, Any]], written: set[str]) -> None:
+        """Write buffered job items with BatchWriteItem requests, emptying the buffer.
+
+        Items DynamoDB leaves unprocessed are resubmitted.
+
+        Args:
+            buffer: Job items waiting to be written
+            written: Set the sort key of each written job is added to
+
+        """
+        while buffer:
+            pending = [{'PutRequest': {'Item': item}} for item in buffer[:BATCH_WRITE_MAX_ITEMS]]
+            del buffer[:BATCH_WRITE_MAX_ITEMS]
+            while pending:
+                response = self._dynamodb.batch_write_item(RequestItems={self._table_name: pending})
+                unprocessed = response.get('UnprocessedItems', {}).get(self._table_name, [])
+                unprocessed_sks = {request['PutRequest']['Item']['SK'] for request in unprocessed}
+                written.update(
+                    request['PutRequest']['Item']['SK']
+                    for request in pending
+                    if request['PutRequest']['Item']['SK'] not in unprocessed_sks
+                )
+                pending = unprocessed
 
     def create_table_for_testing(self) -> None:
         """Create DynamoDB table for testing purposes only."""
@@ -53,10 +110,11 @@ class JobTable:
             job: The scheduled job to store
 
         """
+        job_id_str = job.job_id_str
         item = {
             'PK': 'job',
-            'SK': make_job_sk(job.scheduled_for, job.job_id),
-            'job_id': str(job.job_id),
+            'SK': make_job_sk(job.scheduled_for, job_id_str),
+            'job_id': job_id_str,
             'job_type': job.job_type,
             'payload': job.payload,
             'scheduled_for': job.scheduled_for.isoformat(),
@@ -75,7 +133,33 @@ class JobTable:
         if job.completed_at is not None:
             item['completed_at'] = job.completed_at.isoformat()
 
-        self._table.put_item(Item=item)
+        batch = getattr(self._local, 'batch', None)
+        if batch is None:
+            self._table.put_item(Item=item)
+            return
+        buffer, written = batch
+        buffer.append(item)
+        if len(buffer) >= BATCH_WRITE_MAX_ITEMS:
+            self._flush_batch(buffer, written)
+
+    def signal_new_jobs(self) -> None:
+        """Tell job pollers in any process that new jobs were enqueued."""
+        self._table.update_item(
+            Key=NEW_JOBS_SIGNAL_KEY,
+            UpdateExpression='ADD #count :one',
+            ExpressionAttributeNames={'#count': 'count'},
+            ExpressionAttributeValues={':one': 1},
+        )
+
+    def get_new_jobs_signal(self) -> int:
+        """Read the counter that signal_new_jobs bumps.
+
+        Returns:
+            Number of signals sent so far, which changes whenever new jobs are signalled
+
+        """
+        response = self._table.get_item(Key=NEW_JOBS_SIGNAL_KEY, ConsistentRead=True)
+        return int(response.get('Item', {}).get('count', 0))
 
     def get_job_by_id(self, job_id: UUID, scheduled_for: datetime) -> ScheduledJob | None:
         """Get a job by its ID and scheduled_for time.
@@ -129,6 +213,33 @@ class JobTable:
 
         return jobs
 
+    def get_next_scheduled_time(self, now: datetime) -> datetime | None:
+        """Get the scheduled time of the soonest job due after the given time.
+
+        Args:
+            now: Current time to compare against
+
+        Returns:
+            When the next future job is scheduled to run, or None if there is none
+
+        """
+        # Start just past every SK for timestamps <= now (see get_due_jobs)
+        query_sk = f'scheduled#{now.isoformat()}#z'
+
+        response = self._table.query(
+            KeyConditionExpression=Key('PK').eq('job') & Key('SK').gt(query_sk),
+            ProjectionExpression='SK',
+            ScanIndexForward=True,
+            Limit=1,
+        )
+
+        items = response.get('Items', [])
+        if not items:
+            return None
+
+        scheduled_for, _ = parse_job_sk(items[0]['SK'])
+        return scheduled_for
+
     def update_job_status(self, job_id: UUID, scheduled_for: datetime, status: str, **kwargs: str | int | None) -> None:
         """Update the status of a job.
 
@@ -210,10 +321,11 @@ class JobTable:
             List of ScheduledJob instances with the given job_id
 
         """
+        job_id_str = str(job_id)
         response = self._table.query(
             KeyConditionExpression=Key('PK').eq('job'),
         )
-        return [self._item_to_job(item) for item in response.get('Items', []) if item.get('job_id') == str(job_id)]
+        return [self._item_to_job(item) for item in response.get('Items', []) if item.get('job_id') == job_id_str]
 
     def cleanup_old_jobs(self, older_than_days: int = 7) -> int:
         """Clean up old completed, failed, and dead_letter jobs.
@@ -1,8 +1,10 @@
 """Job worker for polling and processing scheduled jobs."""
 
 import logging
+import time
 import traceback
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
@@ -17,6 +19,92 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Maximum length of error text persisted on a job item
+MAX_ERROR_MESSAGE_LENGTH = 2048
+
+
+def _format_error(error: Exception, *, include_traceback: bool, limit: int = MAX_ERROR_MESSAGE_LENGTH) -> str:
+    """Format an exception for storage on a job item.
+
+    Only the exception summary is formatted unless a full traceback is requested,
+    since walking and formatting the stack is comparatively expensive. Sentry
+    receives the full traceback separately via ``capture_exception``.
+
+    Args:
+        error: The exception to format
+        include_traceback: Whether to include the full traceback of the exception being handled
+        limit: Maximum length of the returned message
+
+    Returns:
+        Formatted error message, truncated to its last ``limit`` characters so
+        the innermost frames and exception line survive
+
+    """
+    message = ''.join(traceback.format_exception_only(error)).rstrip('\n')
+    if include_traceback:
+        message = f'{message}\n{traceback.format_exc().rstrip()}'
+    if len(message) > limit:
+        message = '…' + message[-(limit - 1) :]
+    return message
+
+
+class FailureReportThrottle:
+    """Rate limiter that suppresses repeated reports of like failures.
+
+    Failures are grouped by a fingerprint (e.g. job type and exception class).
+    Only the first failure for a fingerprint within each window is reported;
+    the number of suppressed failures is handed back with the next report.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        max_fingerprints: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the throttle.
+
+        Args:
+            window_seconds: Length of the suppression window for each fingerprint
+            max_fingerprints: Maximum number of fingerprints to track at once
+            clock: Monotonic clock returning seconds
+
+        """
+        self._window_seconds = window_seconds
+        self._max_fingerprints = max_fingerprints
+        self._clock = clock
+        # Fingerprint -> (window start, failures suppressed within the window)
+        self._windows: dict[tuple[str, str], tuple[float, int]] = {}
+
+    def acquire(self, fingerprint: tuple[str, str]) -> int | None:
+        """Check whether a failure with the given fingerprint should be reported.
+
+        Args:
+            fingerprint: Key grouping like failures together
+
+        Returns:
+            Number of failures suppressed since the last report if this failure
+            should be reported, or None if it should be suppressed
+
+        """
+        now = self._clock()
+        window = self._windows.get(fingerprint)
+
+        if window is not None:
+            window_start, suppressed_count = window
+            if now - window_start < self._window_seconds:
+                self._windows[fingerprint] = (window_start, suppressed_count + 1)
+                return None
+            del self._windows[fingerprint]
+        else:
+            suppressed_count = 0
+            if len(self._windows) >= self._max_fingerprints:
+                # Evict the oldest tracked fingerprint to bound memory
+                del self._windows[next(iter(self._windows))]
+
+        self._windows[fingerprint] = (now, 0)
+        return suppressed_count
+
 
 class JobWorker:
     """Worker for polling and processing scheduled jobs."""
@@ -29,6 +117,7 @@ class JobWorker:
         lock_timeout_minutes: int = 10,
         max_attempts: int = 5,
         base_delay_seconds: int = 60,
+        sentry_report_window_seconds: float = 60.0,
     ) -> None:
         """Initialize the job worker.
 
@@ -39,6 +128,7 @@ class JobWorker:
             lock_timeout_minutes: How long to hold job locks
             max_attempts: Maximum retry attempts before dead letter
             base_delay_seconds: Base delay for exponential backoff
+            sentry_report_window_seconds: Window during which like failures are reported to Sentry only once
 
         """
         self._job_table = job_table
@@ -47,6 +137,7 @@ class JobWorker:
         self._lock_timeout = timedelta(minutes=lock_timeout_minutes)
         self._dispatcher = JobDispatcher()
         self._retry_policy = RetryPolicy(base_delay_seconds, max_attempts)
+        self._sentry_throttle = FailureReportThrottle(sentry_report_window_seconds)
 
     def register_handler(self, job_type: str, handler_class: type[BaseJobHandler]) -> None:
         """Register a handler for a specific job type.
@@ -110,6 +201,30 @@ class JobWorker:
 
         return processed_count
 
+    def get_poll_delay(self, max_delay_seconds: float, now: datetime | None = None) -> float:
+        """Calculate how long to wait before the next poll.
+
+        Waits until the soonest scheduled future job is due, capped at
+        ``max_delay_seconds`` so jobs enqueued in the meantime are still picked up.
+
+        Args:
+            max_delay_seconds: Longest delay to return
+            now: Current time (defaults to datetime.now(UTC))
+
+        Returns:
+            Number of seconds to wait before polling again
+
+        """
+        if now is None:
+            now = datetime.now(UTC)
+
+        next_scheduled_for = self._job_table.get_next_scheduled_time(now)
+        if next_scheduled_for is None:
+            return max_delay_seconds
+
+        seconds_until_due = (next_scheduled_for - now).total_seconds()
+        return max(0.0, min(max_delay_seconds, seconds_until_due))
+
     def _claim_and_run(self, job: ScheduledJob, now: datetime) -> bool:
         """Claim a job and run it, handling both success and failure.
 
@@ -210,7 +325,6 @@ class JobWorker:
             now: Current time
 
         """
-        error_message = f'{type(error).__name__}: {error}\n{traceback.format_exc()}'
         new_attempts = job.attempts + 1
 
         # Job failure (debug logging removed)
@@ -223,11 +337,13 @@ class JobWorker:
             # Calculate next run time with exponential backoff
             next_run = self._retry_policy.calculate_next_run(now, new_attempts)
 
-            # Reschedule the job for later
+            # Reschedule the job for later, recording only the exception summary
+            error_message = _format_error(error, include_traceback=False)
             self._reschedule_job(job, next_run, new_attempts, error_message)
         else:
             # Job dead letter (debug logging removed)
-            # Job has exceeded max attempts, send to dead letter
+            # Job has exceeded max attempts, send to dead letter with the full traceback
+            error_message = _format_error(error, include_traceback=True)
             self._job_table.update_job_status(
                 job.job_id,
                 job.scheduled_for,
@@ -277,22 +393,30 @@ class JobWorker:
     def _report_to_sentry(self, job: ScheduledJob, error: Exception) -> None:
         """Report job failure to Sentry with full context.
 
+        Like failures (same job type and exception class) are reported at most
+        once per throttle window; the count of suppressed failures is attached
+        to the next report.
+
         Args:
             job: The failed job
             error: The exception that occurred
 
         """
-        # Set job context for Sentry
-        sentry_sdk.set_context(
-            'job',
-            {
-                'job_id': str(job.job_id),
-                'job_type': job.job_type,
-                'attempts': job.attempts,
-                'payload': job.payload,
-                'scheduled_for': job.scheduled_for.isoformat(),
-            },
-        )
-
-        # Capture the exception
-        sentry_sdk.capture_exception(error)
+        suppressed_count = self._sentry_throttle.acquire((job.job_type, type(error).__name__))
+        if suppressed_count is None:
+            return
+
+        context = {
+            'job_id': job.job_id_str,
+            'job_type': job.job_type,
+            'attempts': job.attempts,
+            'payload': job.payload,
+            'scheduled_for': job.scheduled_for.isoformat(),
+        }
+        if suppressed_count:
+            context['suppressed_failures'] = suppressed_count
+
+        # Use an isolated scope so job context doesn't leak into other events
+        with sentry_sdk.new_scope():
+            sentry_sdk.set_context('job', context)
+            sentry_sdk.capture_exception(error)
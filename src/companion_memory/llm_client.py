@@ -2,14 +2,111 @@
 
 import logging
 import os
+import threading
+import time
 
 import backoff
 import llm
 
-from companion_memory.exceptions import LLMConfigurationError, LLMGenerationError
+from companion_memory.exceptions import LLMConfigurationError, LLMGenerationError, LLMUnavailableError
 
 logger = logging.getLogger(__name__)
 
+# Consecutive failed completions after which further calls fail fast
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+
+# How long calls fail fast before a single trial call is let through
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 60.0
+
+
+class CircuitBreaker:
+    """Fails calls fast once a run of consecutive calls has failed.
+
+    After ``failure_threshold`` consecutive failures the breaker opens. While
+    it is open, one trial call is allowed per cooldown period. A success
+    closes the breaker, and a failure keeps it open for another cooldown.
+    """
+
+    __slots__ = ('_consecutive_failures', '_cooldown_seconds', '_failure_threshold', '_lock', '_opened_at')
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float) -> None:
+        """Initialize a closed circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown_seconds: Seconds between trial calls while the breaker is open
+
+        """
+        self._failure_threshold = failure_threshold
+        self._cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    def allow_request(self) -> bool:
+        """Determine whether a call may be attempted now.
+
+        Returns:
+            True if the breaker is closed or a trial call is due, False to fail fast
+
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self._cooldown_seconds:
+                return False
+            # Only this caller gets the trial; everyone else waits out a fresh cooldown
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Close the breaker and forget earlier failures."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker once the threshold is reached."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+# Shared by every client, since they all call the same provider
+_llm_circuit_breaker = CircuitBreaker(CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN_SECONDS)
+
+
+class CachedResponse:
+    """Wrapper around an llm response that memoizes its text.
+
+    ``llm.Response.text()`` performs the API call lazily, so calling it again
+    after it has succeeded would re-issue the request. Only successful results
+    are cached; a call that raised is re-issued on the next attempt.
+    """
+
+    def __init__(self, response: 'llm.Response') -> None:
+        """Initialize the wrapper.
+
+        Args:
+            response: The LLM response object to wrap
+
+        """
+        self._response = response
+        self._text: str | None = None
+
+    def text(self) -> str:
+        """Get the response text, calling the underlying response at most once on success.
+
+        Returns:
+            Generated completion text
+
+        """
+        if self._text is None:
+            self._text = self._response.text()
+        return self._text
+
 
 class LLMLClient:
     """Concrete implementation of LLMClient using the llm library."""
@@ -37,8 +134,13 @@ class LLMLClient:
         Raises:
             LLMConfigurationError: If the model is not found or not properly configured
             LLMGenerationError: If there's an error generating the completion
+            LLMUnavailableError: If recent completions kept failing and the call was skipped
 
         """
+        if not _llm_circuit_breaker.allow_request():
+            logger.warning('Skipping LLM call after %d consecutive failures', CIRCUIT_BREAKER_FAILURE_THRESHOLD)
+            raise LLMUnavailableError('LLM calls are failing; skipped until the cooldown passes')
+
         try:
             logger.debug('Getting model: %s', self._model_name)
             model = llm.get_model(self._model_name)
@@ -53,13 +155,15 @@ class LLMLClient:
 
         try:
             logger.debug('Generating completion for prompt: %s...', prompt[:100])
-            response = model.prompt(prompt)
+            response = CachedResponse(model.prompt(prompt))
             result = self._get_response_text_with_retry(response)
             logger.debug('Generated completion: %s...', result[:100])
         except Exception as exc:
             logger.exception('Error generating completion')
+            _llm_circuit_breaker.record_failure()
             raise LLMGenerationError('Error generating completion') from exc
         else:
+            _llm_circuit_breaker.record_success()
             return result
 
     @backoff.on_exception(
@@ -73,11 +177,11 @@ class LLMLClient:
         ),
         giveup=lambda e: 'overloaded' not in str(e).lower(),
     )
-    def _get_response_text_with_retry(self, response: 'llm.Response') -> str:
+    def _get_response_text_with_retry(self, response: CachedResponse) -> str:
         """Get response text with retry logic for overloaded API errors.
 
         Args:
-            response: The LLM response object
+            response: The cached LLM response wrapper
 
         Returns:
             Generated completion text
@@ -1,24 +1,54 @@
 """Retry policy and exponential backoff implementation."""
 
+import random
 from datetime import datetime, timedelta
 
 
 class RetryPolicy:
-    """Policy for retrying failed jobs with exponential backoff."""
+    """Policy for retrying failed jobs with exponential backoff and full jitter."""
 
-    def __init__(self, base_delay_seconds: int = 60, max_attempts: int = 5) -> None:
+    __slots__ = ('_backoff_bounds', '_base_delay_seconds', '_max_attempts', '_max_delay_seconds', '_rng')
+
+    def __init__(
+        self,
+        base_delay_seconds: int = 60,
+        max_attempts: int = 5,
+        max_delay_seconds: int = 3600,
+        rng: random.Random | None = None,
+    ) -> None:
         """Initialize retry policy.
 
         Args:
             base_delay_seconds: Base delay for exponential backoff
             max_attempts: Maximum number of retry attempts
+            max_delay_seconds: Upper bound on the backoff delay
+            rng: Random number generator for jitter (defaults to a new instance)
 
         """
         self._base_delay_seconds = base_delay_seconds
         self._max_attempts = max_attempts
+        self._max_delay_seconds = max_delay_seconds
+        self._rng = rng or random.Random()  # noqa: S311
+        # Capped backoff bounds for every attempt that can be retried, computed once
+        self._backoff_bounds = tuple(self._backoff_bound(attempts) for attempts in range(1, max_attempts + 1))
+
+    def _backoff_bound(self, attempts: int) -> int:
+        """Compute the capped exponential backoff bound for an attempt.
+
+        Args:
+            attempts: Number of attempts (1-based)
+
+        Returns:
+            Upper bound of the backoff delay in seconds
+
+        """
+        return min(self._base_delay_seconds << (attempts - 1), self._max_delay_seconds)
 
     def calculate_delay(self, attempts: int) -> timedelta:
-        """Calculate exponential backoff delay.
+        """Calculate exponential backoff delay with full jitter.
+
+        The delay is drawn uniformly between zero and the capped exponential
+        backoff, so workers that failed together don't retry in lockstep.
 
         Args:
             attempts: Number of attempts (1-based)
@@ -26,9 +56,18 @@ class RetryPolicy:
         Returns:
             Delay timedelta for the given attempt
 
+        Raises:
+            ValueError: If attempts is less than 1
+
         """
-        delay_seconds = self._base_delay_seconds * (2 ** (attempts - 1))
-        return timedelta(seconds=delay_seconds)
+        if attempts < 1:
+            msg = f'attempts must be at least 1, got {attempts}'
+            raise ValueError(msg)
+        if attempts <= len(self._backoff_bounds):
+            backoff_seconds = self._backoff_bounds[attempts - 1]
+        else:
+            backoff_seconds = self._backoff_bound(attempts)
+        return timedelta(seconds=self._rng.uniform(0, backoff_seconds))
 
     def calculate_next_run(self, now: datetime, attempts: int) -> datetime:
         """Calculate when a failed job should run next.
@@ -41,8 +80,7 @@ class RetryPolicy:
             When the job should be retried
 
         """
-        delay = self.calculate_delay(attempts)
-        return now + delay
+        return now + self.calculate_delay(attempts)
 
     def should_retry(self, attempts: int) -> bool:
         """Determine if a job should be retried.
@@ -1,30 +1,75 @@
 """Distributed scheduler for coordinating background tasks across workers."""
 
 import contextlib
+import functools
 import logging
 import os
+import ssl
+import threading
 import time
-import uuid
 from collections.abc import Callable
 from typing import Any
 
 import boto3
 from apscheduler.schedulers.background import BackgroundScheduler
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from slack_sdk import WebClient
+from slack_sdk.http_retry import RateLimitErrorRetryHandler, default_retry_handlers
 
+from companion_memory.daily_summary_scheduler import schedule_daily_summaries
+from companion_memory.deduplication import DeduplicationIndex
+from companion_memory.job_table import JobTable
+from companion_memory.job_worker import JobWorker
 from companion_memory.storage import LogStore
 from companion_memory.summarizer import LLMClient
+from companion_memory.user_settings import DynamoUserSettingsStore
 from companion_memory.user_sync import sync_user_timezone
+from companion_memory.work_sampling_scheduler import schedule_work_sampling_jobs
 
 logger = logging.getLogger(__name__)
 
 # Configure APScheduler logging to reduce verbosity
 logging.getLogger('apscheduler.executors.default').setLevel(logging.WARNING)
 
+# Fail fast on lock operations: a stuck connection must not outlive the lock's
+# 60-second staleness window, so use short timeouts and let retries recover.
+LOCK_CLIENT_CONFIG = Config(
+    connect_timeout=1,
+    read_timeout=2,
+    retries={'mode': 'standard', 'max_attempts': 3},
+    tcp_keepalive=True,
+    max_pool_connections=10,
+)
+
+# Jobs that only the lock holder runs; removed again when the lock is lost
+LOCK_HOLDER_JOB_IDS = ('user_timezone_sync', 'hourly_job_scheduler', 'job_worker_poller', 'job_cleanup')
+
+
+@functools.lru_cache(maxsize=8)
+def _get_lock_client(region: str) -> Any:  # noqa: ANN401
+    """Get a low-level DynamoDB client for lock operations, shared per region.
+
+    Building a boto3 client parses the service model and walks the credential
+    chain, so it is done once per process rather than once per lock.
+
+    Args:
+        region: AWS region name
+
+    Returns:
+        DynamoDB client
+
+    """
+    return boto3.client('dynamodb', region_name=region, config=LOCK_CLIENT_CONFIG)
+
 
 class SchedulerLock:
-    """DynamoDB-based distributed lock for scheduler coordination."""
+    """DynamoDB-based distributed lock for scheduler coordination.
+
+    Uses the low-level DynamoDB client with attribute values serialized up
+    front, since the lock item is small and its shape never changes.
+    """
 
     def __init__(self, table_name: str = 'CompanionMemory') -> None:
         """Initialize the scheduler lock using existing single table.
@@ -36,16 +81,24 @@ class SchedulerLock:
         self.table_name = table_name
         self.partition_key = 'system#scheduler'
         self.sort_key = 'lock#main'
-        self.process_id = f'{os.getpid()}-{uuid.uuid4()}'
+        # 64 random bits are plenty to tell lock holders apart, and keep conditional writes small
+        self.process_id = f'{os.getpid()}-{os.urandom(8).hex()}'
         # Use specified region or default to us-east-1 for testing
         region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
-        self.dynamodb = boto3.resource('dynamodb', region_name=region)
-        self.table = self.dynamodb.Table(table_name)
+        self.client = _get_lock_client(region)
         self.lock_acquired = False
+        # Fencing token of the current holding, set on acquire
+        self.epoch: int | None = None
+        self._epoch_value: dict[str, str] = {}
 
         # Get instance metadata for debugging
         self.instance_info = self._get_instance_info()
 
+        # Pre-serialized attribute values reused by every lock operation
+        self._key = {'PK': {'S': self.partition_key}, 'SK': {'S': self.sort_key}}
+        self._process_id_value = {'S': self.process_id}
+        self._instance_info_value = TypeSerializer().serialize(self.instance_info)
+
     def _get_instance_info(self) -> dict[str, Any]:
         """Get instance information for debugging and monitoring."""
         info = {
@@ -67,6 +120,13 @@ class SchedulerLock:
     def acquire(self) -> bool:
         """Attempt to acquire the distributed scheduler lock.
 
+        Each successful acquisition atomically increments the lock item's
+        ``epoch``, which serves as a fencing token. Refreshes and releases are
+        conditioned on it, and so are the hourly pass's job reservations (see
+        ``fencing_check``), so a paused former holder cannot enqueue jobs
+        after losing the lock. Jobs are run under their own per-job claims,
+        which keep a former holder from running a job another worker owns.
+
         Returns:
             True if lock was acquired, False otherwise
 
@@ -75,21 +135,27 @@ class SchedulerLock:
         stale_time = current_time - 60  # Consider locks older than 60 seconds stale
 
         try:
-            # Try to acquire lock with conditional write using single table keys
-            self.table.put_item(
-                Item={
-                    'PK': self.partition_key,
-                    'SK': self.sort_key,
-                    'process_id': self.process_id,
-                    'timestamp': current_time,
-                    'ttl': current_time + 300,  # Auto-expire after 5 minutes
-                    'instance_info': self.instance_info,
-                    'lock_type': 'scheduler',  # For future different lock types
-                },
+            # Take over the lock item with a single conditional update, bumping the epoch.
+            # The item is never deleted (no TTL), so epochs increase monotonically.
+            response = self.client.update_item(
+                TableName=self.table_name,
+                Key=self._key,
+                UpdateExpression=(
+                    'SET process_id = :process_id, #ts = :current_time, instance_info = :info, '
+                    'lock_type = :lock_type ADD epoch :one REMOVE #ttl'
+                ),
                 # Only succeed if no lock exists OR existing lock is stale
                 ConditionExpression='attribute_not_exists(PK) OR #ts < :stale_time',
-                ExpressionAttributeNames={'#ts': 'timestamp'},
-                ExpressionAttributeValues={':stale_time': stale_time},
+                ExpressionAttributeNames={'#ts': 'timestamp', '#ttl': 'ttl'},
+                ExpressionAttributeValues={
+                    ':process_id': self._process_id_value,
+                    ':current_time': {'N': str(current_time)},
+                    ':info': self._instance_info_value,
+                    ':lock_type': {'S': 'scheduler'},  # For future different lock types
+                    ':one': {'N': '1'},
+                    ':stale_time': {'N': str(stale_time)},
+                },
+                ReturnValues='UPDATED_NEW',
             )
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
@@ -98,9 +164,25 @@ class SchedulerLock:
             # Re-raise other errors
             raise
         else:
+            self.epoch = int(response['Attributes']['epoch']['N'])
+            self._epoch_value = {'N': str(self.epoch)}
             self.lock_acquired = True
             return True
 
+    def fencing_check(self) -> dict[str, Any]:
+        """Build a TransactWriteItems condition that holds only while this holding is current.
+
+        Returns:
+            ConditionCheck on the lock item's holder and epoch, with plain Python attribute values
+
+        """
+        return {
+            'TableName': self.table_name,
+            'Key': {'PK': self.partition_key, 'SK': self.sort_key},
+            'ConditionExpression': 'process_id = :process_id AND epoch = :epoch',
+            'ExpressionAttributeValues': {':process_id': self.process_id, ':epoch': self.epoch},
+        }
+
     def refresh(self) -> bool:
         """Refresh the lock to indicate we're still alive.
 
@@ -114,17 +196,18 @@ class SchedulerLock:
         current_time = int(time.time())
 
         try:
-            # Update timestamp only if we still hold the lock
-            self.table.update_item(
-                Key={'PK': self.partition_key, 'SK': self.sort_key},
-                UpdateExpression='SET #ts = :current_time, #ttl = :ttl, instance_info = :info',
-                ConditionExpression='process_id = :process_id',
-                ExpressionAttributeNames={'#ts': 'timestamp', '#ttl': 'ttl'},
+            # Update timestamp only if we still hold the lock at our epoch; instance_info
+            # is written once on acquire, so keep the heartbeat payload minimal
+            self.client.update_item(
+                TableName=self.table_name,
+                Key=self._key,
+                UpdateExpression='SET #ts = :current_time',
+                ConditionExpression='process_id = :process_id AND epoch = :epoch',
+                ExpressionAttributeNames={'#ts': 'timestamp'},
                 ExpressionAttributeValues={
-                    ':current_time': current_time,
-                    ':ttl': current_time + 300,
-                    ':process_id': self.process_id,
-                    ':info': self.instance_info,
+                    ':current_time': {'N': str(current_time)},
+                    ':process_id': self._process_id_value,
+                    ':epoch': self._epoch_value,
                 },
             )
         except ClientError as e:
@@ -138,16 +221,27 @@ class SchedulerLock:
             return True
 
     def release(self) -> None:
-        """Release the scheduler lock."""
+        """Release the scheduler lock.
+
+        The lock item is kept (to preserve the epoch) but marked stale so
+        another process can acquire it immediately.
+        """
         if not self.lock_acquired:
             return
 
         try:
-            # Delete lock only if we hold it
-            self.table.delete_item(
-                Key={'PK': self.partition_key, 'SK': self.sort_key},
-                ConditionExpression='process_id = :process_id',
-                ExpressionAttributeValues={':process_id': self.process_id},
+            # Expire the lock only if we still hold it at our epoch
+            self.client.update_item(
+                TableName=self.table_name,
+                Key=self._key,
+                UpdateExpression='SET #ts = :released',
+                ConditionExpression='process_id = :process_id AND epoch = :epoch',
+                ExpressionAttributeNames={'#ts': 'timestamp'},
+                ExpressionAttributeValues={
+                    ':released': {'N': '0'},
+                    ':process_id': self._process_id_value,
+                    ':epoch': self._epoch_value,
+                },
             )
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
@@ -167,12 +261,15 @@ class SchedulerLock:
 
         """
         try:
-            response = self.table.get_item(Key={'PK': self.partition_key, 'SK': self.sort_key})
+            response = self.client.get_item(TableName=self.table_name, Key=self._key)
             item = response.get('Item')
         except ClientError:
             return None
         else:
-            return item if item is not None else None
+            if item is None:
+                return None
+            deserializer = TypeDeserializer()
+            return {name: deserializer.deserialize(value) for name, value in item.items()}
 
 
 class DistributedScheduler:
@@ -189,12 +286,22 @@ class DistributedScheduler:
         self.lock = SchedulerLock(table_name)
         self.started = False
         self._lock_check_interval = 30  # Check lock every 30 seconds
+        self._lock_thread: threading.Thread | None = None  # Dedicated lock management thread
+        self._stop_event = threading.Event()  # Signals the lock management thread to exit
         self._jobs_added = False  # Track if we've added active jobs
         self._log_store: LogStore | None = None  # Will be injected by Flask app
         self._llm: LLMClient | None = None  # Will be injected by Flask app
         self._job_worker_enabled = True  # Enable job worker by default
         self._job_worker_polling_interval = 30  # Poll for jobs every 30 seconds
-        self._job_worker: Any = None  # Will be lazily initialized
+        self._job_worker_max_idle_interval = 300  # Back off to at most 5 minutes when idle
+        self._job_worker_idle_polls = 0  # Consecutive polls that found no work
+        self._new_jobs_signal: int | None = None  # Last new-jobs signal count the poller saw
+        self._next_job_poll_at = 0.0  # Monotonic time before which idle polls are skipped
+        self._job_worker: JobWorker | None = None  # Will be lazily initialized
+        # DynamoDB-backed collaborators, built once on first use by the scheduled jobs
+        self._job_table: JobTable | None = None
+        self._user_settings_store: DynamoUserSettingsStore | None = None
+        self._deduplication_index: DeduplicationIndex | None = None
 
     def start(self) -> bool:
         """Start the scheduler and begin competing for the distributed lock.
@@ -215,21 +322,33 @@ class DistributedScheduler:
         self.scheduler.start()
         self.started = True
 
-        # Add the lock management job that runs on all workers
-        self.scheduler.add_job(
-            self._manage_lock, 'interval', seconds=self._lock_check_interval, id='lock_manager', max_instances=1
-        )
-
         # Try to acquire lock immediately and add jobs if successful
         self._attempt_lock_acquisition()
 
+        # Manage the lock on all workers from a plain daemon thread; it only
+        # needs a fixed-interval tick, not a trigger and executor per wakeup
+        self._stop_event.clear()
+        self._lock_thread = threading.Thread(target=self._lock_loop, name='scheduler-lock-manager', daemon=True)
+        self._lock_thread.start()
+
         return True
 
+    def _lock_loop(self) -> None:
+        """Run lock management every lock check interval until shutdown."""
+        while not self._stop_event.wait(self._lock_check_interval):
+            try:
+                self._manage_lock()
+            except Exception:
+                logger.exception('Error managing scheduler lock')
+
     def _manage_lock(self) -> None:
         """Manage the distributed lock - refresh if held, attempt to acquire if not held."""
         if self.lock.lock_acquired:
-            # We have the lock - try to refresh it
-            if not self.lock.refresh():
+            # We have the lock - try to refresh it. The refresh doubles as the
+            # heartbeat, so liveness is logged locally rather than written separately.
+            if self.lock.refresh():
+                logger.debug('Scheduler heartbeat - process %s holds lock', self.lock.process_id)
+            else:
                 # We lost the lock - remove active jobs but keep trying to reacquire
                 logger.warning('Lost scheduler lock, removing jobs but continuing to compete for lock')
                 self._remove_active_jobs()
@@ -251,14 +370,9 @@ class DistributedScheduler:
         # Schedule user time zone sync every 6 hours
         self.scheduler.add_job(sync_user_timezone, 'interval', hours=6, id='user_timezone_sync', max_instances=1)
 
-        # Schedule daily summary scheduling job (runs hourly)
-        self.scheduler.add_job(
-            self._schedule_daily_summaries, 'interval', hours=1, id='daily_summary_scheduler', max_instances=1
-        )
-
-        # Schedule work sampling prompt scheduling job (runs hourly)
+        # Schedule daily summary and work sampling jobs in a single hourly pass
         self.scheduler.add_job(
-            self._schedule_work_sampling_jobs, 'interval', hours=1, id='work_sampling_scheduler', max_instances=1
+            self._schedule_hourly_jobs, 'interval', hours=1, id='hourly_job_scheduler', max_instances=1
         )
 
         # Schedule job worker polling if enabled
@@ -288,48 +402,151 @@ class DistributedScheduler:
         if not self._jobs_added or not self.scheduler:
             return
 
-        # Remove daily summary scheduler
-        with contextlib.suppress(Exception):
-            self.scheduler.remove_job('daily_summary_scheduler')
-
-        # Remove work sampling scheduler
-        with contextlib.suppress(Exception):
-            self.scheduler.remove_job('work_sampling_scheduler')
-
-        # Remove job worker poller
-        with contextlib.suppress(Exception):
-            self.scheduler.remove_job('job_worker_poller')
-
-        # Remove job cleanup
-        with contextlib.suppress(Exception):
-            self.scheduler.remove_job('job_cleanup')
+        for job_id in LOCK_HOLDER_JOB_IDS:
+            with contextlib.suppress(Exception):
+                self.scheduler.remove_job(job_id)
 
         self._jobs_added = False
 
     def _poll_and_process_jobs(self) -> None:
-        """Poll and process scheduled jobs from the job queue."""
+        """Poll and process scheduled jobs from the job queue.
+
+        The poller fires every polling interval, but while the queue is idle
+        polls are skipped with exponential backoff (see ``_record_job_poll``).
+        Every tick reads the shared new-jobs signal, so jobs that another
+        process enqueues still end the backoff within one interval.
+        """
         # Double-check we still have the lock before processing
         if not self.lock.lock_acquired:
             return
 
         try:
-            # Lazy initialize job worker to avoid circular imports
+            # Skip this tick while backing off from an idle queue, unless new jobs were signalled.
+            # The signal is read before polling, so jobs signalled during the poll wake the next tick.
+            new_jobs_signal = self._get_job_table().get_new_jobs_signal()
+            if time.monotonic() < self._next_job_poll_at and new_jobs_signal == self._new_jobs_signal:
+                return
+            self._new_jobs_signal = new_jobs_signal
+
+            # Lazy initialize job worker on first poll
             if self._job_worker is None:  # pragma: no branch
-                from companion_memory.job_table import JobTable
-                from companion_memory.job_worker import JobWorker
-
-                job_table = JobTable()
-                self._job_worker = JobWorker(job_table)
+                self._job_worker = JobWorker(self._get_job_table())
 
                 # Register all handlers with the job worker
                 self._job_worker.register_all_handlers_from_global()
 
             # Poll and process jobs
-            self._job_worker.poll_and_process_jobs()
+            processed_count = self._job_worker.poll_and_process_jobs()
+            self._record_job_poll(processed_count, self._job_worker)
 
         except Exception:
             logger.exception('Error in job worker polling')
 
+    def _record_job_poll(self, processed_count: int, job_worker: JobWorker) -> None:
+        """Update the idle backoff after a job poll.
+
+        Each consecutive empty poll doubles the effective polling interval, up
+        to the idle maximum; any processed job resets it. The backoff never
+        extends past the next scheduled job, so due jobs are not delayed.
+
+        Args:
+            processed_count: Number of jobs processed by the poll
+            job_worker: Job worker used to look up when the next job is due
+
+        """
+        if processed_count:
+            self.reset_job_polling_backoff()
+            return
+
+        idle_interval = min(
+            self._job_worker_polling_interval << (self._job_worker_idle_polls + 1), self._job_worker_max_idle_interval
+        )
+        # Stop counting once the cap is reached, so the shift stays small
+        if idle_interval < self._job_worker_max_idle_interval:
+            self._job_worker_idle_polls += 1
+        # Never skip past the next scheduled job
+        skip_seconds = job_worker.get_poll_delay(idle_interval)
+        # Allow half a tick of slack so the poller isn't skipped by scheduling jitter
+        self._next_job_poll_at = time.monotonic() + skip_seconds - self._job_worker_polling_interval / 2
+
+    def reset_job_polling_backoff(self) -> None:
+        """Resume polling for jobs at the normal interval (e.g. after enqueuing work)."""
+        self._job_worker_idle_polls = 0
+        self._next_job_poll_at = 0.0
+
+    def _get_job_table(self) -> JobTable:
+        """Get the job table, creating it on first use."""
+        if self._job_table is None:
+            self._job_table = JobTable()
+        return self._job_table
+
+    def _ensure_dependencies(self) -> tuple[DynamoUserSettingsStore, JobTable, DeduplicationIndex]:
+        """Get the dependencies shared by the hourly scheduling jobs, creating them on first use.
+
+        Returns:
+            Tuple of (user settings store, job table, deduplication index)
+
+        """
+        if self._user_settings_store is None:
+            self._user_settings_store = DynamoUserSettingsStore()
+        if self._deduplication_index is None:
+            self._deduplication_index = DeduplicationIndex()
+        return self._user_settings_store, self._get_job_table(), self._deduplication_index
+
+    def _schedule_hourly_jobs(self) -> None:
+        """Schedule daily summary and work sampling jobs, batching the job writes.
+
+        Reservations are fenced by the scheduler lock's epoch, so a pass that
+        outlives its lock reserves, and so enqueues, nothing. They are then
+        matched against the jobs the batch reports as
+        written, and any job a failed flush dropped has its reservation
+        released for the next pass. The idle poll backoff is reset afterwards, since it was computed before
+        the newly enqueued jobs existed.
+        """
+        # Double-check we still have the lock before processing
+        if not self.lock.lock_acquired:
+            return
+
+        try:
+            _, job_table, deduplication_index = self._ensure_dependencies()
+            with (
+                deduplication_index.fenced_by(self.lock.fencing_check()),
+                deduplication_index.track_reservations() as reservations,
+            ):
+                written_sks: set[str] = set()
+                try:
+                    with job_table.batch_writes() as written_sks:
+                        self._schedule_daily_summaries()
+                        self._schedule_work_sampling_jobs()
+                finally:
+                    self._release_unwritten_reservations(reservations, written_sks, deduplication_index)
+        except Exception:
+            logger.exception('Error writing hourly scheduled jobs')
+        finally:
+            self.reset_job_polling_backoff()
+
+    def _release_unwritten_reservations(
+        self,
+        reservations: list[tuple[str, str, str]],
+        written_sks: set[str],
+        deduplication_index: DeduplicationIndex,
+    ) -> None:
+        """Release the reservations of jobs that a failed batch flush never wrote.
+
+        Without this, a lost job stays reserved and is never rescheduled. The
+        check is made against the batch's own record, so it costs no reads.
+
+        Args:
+            reservations: (logical_id, date, job_sk) for each reservation made during the batch
+            written_sks: Sort keys of the jobs the batch wrote
+            deduplication_index: Index holding the reservations
+
+        """
+        for logical_id, date, job_sk in reservations:
+            if job_sk not in written_sks:
+                logger.warning('Job %s was not written, releasing reservation %s', job_sk, logical_id)
+                deduplication_index.release(logical_id, date)
+
     def _schedule_daily_summaries(self) -> None:
         """Schedule daily summary jobs for all configured users."""
         # Double-check we still have the lock before processing
@@ -337,16 +554,7 @@ class DistributedScheduler:
             return
 
         try:
-            # Lazy import to avoid circular imports
-            from companion_memory.daily_summary_scheduler import schedule_daily_summaries
-            from companion_memory.deduplication import DeduplicationIndex
-            from companion_memory.job_table import JobTable
-            from companion_memory.user_settings import DynamoUserSettingsStore
-
-            # Set up dependencies
-            user_settings_store = DynamoUserSettingsStore()
-            job_table = JobTable()
-            deduplication_index = DeduplicationIndex()
+            user_settings_store, job_table, deduplication_index = self._ensure_dependencies()
 
             # Schedule daily summaries
             schedule_daily_summaries(
@@ -366,16 +574,7 @@ class DistributedScheduler:
             return
 
         try:
-            # Lazy import to avoid circular imports
-            from companion_memory.deduplication import DeduplicationIndex
-            from companion_memory.job_table import JobTable
-            from companion_memory.user_settings import DynamoUserSettingsStore
-            from companion_memory.work_sampling_scheduler import schedule_work_sampling_jobs
-
-            # Set up dependencies
-            user_settings_store = DynamoUserSettingsStore()
-            job_table = JobTable()
-            deduplication_index = DeduplicationIndex()
+            user_settings_store, job_table, deduplication_index = self._ensure_dependencies()
 
             # Schedule work sampling jobs
             schedule_work_sampling_jobs(
@@ -394,11 +593,7 @@ class DistributedScheduler:
             return
 
         try:
-            # Lazy import to avoid circular imports
-            from companion_memory.job_table import JobTable
-
-            job_table = JobTable()
-            deleted_count = job_table.cleanup_old_jobs(older_than_days=7)
+            deleted_count = self._get_job_table().cleanup_old_jobs(older_than_days=7)
             logger.info('Job cleanup completed: deleted %d old jobs', deleted_count)
 
         except Exception:
@@ -429,6 +624,12 @@ class DistributedScheduler:
 
     def shutdown(self) -> None:
         """Shutdown the scheduler and release the distributed lock."""
+        # Stop lock management first so the lock isn't refreshed or reacquired after release
+        self._stop_event.set()
+        if self._lock_thread is not None:
+            self._lock_thread.join()
+            self._lock_thread = None
+
         if self.scheduler and self.started:
             try:
                 # Remove active jobs first
@@ -455,30 +656,41 @@ class DistributedScheduler:
             'scheduler_started': self.started,
             'lock_acquired': self.lock.lock_acquired,
             'process_id': self.lock.process_id,
+            'lock_epoch': self.lock.epoch,
             'current_lock_holder': current_lock,
             'instance_info': self.lock.instance_info,
         }
 
 
 _scheduler_instance: DistributedScheduler | None = None
+_scheduler_instance_lock = threading.Lock()
 
 
 def get_scheduler() -> DistributedScheduler:
     """Get the distributed scheduler instance.
 
+    The instance is created at most once, even when several threads ask for
+    it concurrently during startup.
+
     Returns:
         DistributedScheduler instance
 
     """
     global _scheduler_instance
+    # Fast path once the singleton exists; only contend for the lock on first use
     if _scheduler_instance is None:
-        _scheduler_instance = DistributedScheduler()
+        with _scheduler_instance_lock:
+            if _scheduler_instance is None:  # pragma: no branch
+                _scheduler_instance = DistributedScheduler()
     return _scheduler_instance
 
 
 def get_slack_client() -> WebClient:
     """Get the Slack client instance.
 
+    The client is shared per bot token, so every caller reuses its SSL
+    context and retry handlers instead of building its own.
+
     Returns:
         WebClient instance configured with bot token from environment
 
@@ -491,4 +703,48 @@ def get_slack_client() -> WebClient:
         msg = 'SLACK_BOT_TOKEN environment variable is required'
         raise ValueError(msg)
 
-    return WebClient(token=bot_token)
+    return _get_cached_slack_client(bot_token)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_cached_slack_client(bot_token: str) -> WebClient:
+    """Build the Slack client for a bot token once per process.
+
+    The client gets its own SSL context; without one, every HTTPS connection
+    the SDK opens builds a fresh default context and reloads the CA bundle.
+    Besides the SDK's default connection error retries, a rate-limited call
+    is retried once after the Retry-After delay Slack asks for.
+
+    Args:
+        bot_token: Slack bot token
+
+    Returns:
+        WebClient instance
+
+    """
+    return WebClient(
+        token=bot_token,
+        ssl=ssl.create_default_context(),
+        retry_handlers=[*default_retry_handlers(), RateLimitErrorRetryHandler(max_retry_count=1)],
+    )
+
+
+_user_message_locks: dict[str, threading.Lock] = {}
+_user_message_locks_lock = threading.Lock()
+
+
+def get_user_message_lock(user_id: str) -> threading.Lock:
+    """Get the lock that serializes Slack messages sent to a user.
+
+    Holding it around chat_postMessage keeps a user's messages in order
+    when several threads send to them.
+
+    Args:
+        user_id: Slack user ID
+
+    Returns:
+        Lock for the user
+
+    """
+    with _user_message_locks_lock:
+        return _user_message_locks.setdefault(user_id, threading.Lock())
@@ -1,8 +1,34 @@
 """Slack authentication and signature validation."""
 
+import functools
 import hashlib
 import hmac
 import os
+import re
+import time
+
+# Slack sends exactly 'v0=' plus the lowercase hex SHA-256 digest
+_SIGNATURE_PATTERN = re.compile(r'v0=[0-9a-f]{64}')
+
+# Requests signed further than this from the current time are rejected as replays
+MAX_REQUEST_AGE_SECONDS = 60 * 5
+
+
+@functools.lru_cache(maxsize=4)
+def _primed_hmac(signing_secret: bytes) -> hmac.HMAC:
+    """Get an HMAC-SHA256 keyed with the signing secret, ready to be copied.
+
+    Keying the HMAC pads and hashes the secret; caching the keyed object lets
+    each validation start from a copy instead of repeating that work.
+
+    Args:
+        signing_secret: Slack signing secret bytes
+
+    Returns:
+        HMAC object with no message data; callers must copy() before updating
+
+    """
+    return hmac.new(signing_secret, digestmod=hashlib.sha256)
 
 
 def validate_slack_signature(
@@ -20,7 +46,7 @@ def validate_slack_signature(
         signing_secret: Slack signing secret (defaults to env var)
 
     Returns:
-        True if signature is valid, False otherwise
+        True if signature is valid and the timestamp is within MAX_REQUEST_AGE_SECONDS of now, False otherwise
 
     """
     if signing_secret is None:
@@ -29,13 +55,24 @@ def validate_slack_signature(
     if not signing_secret:
         return False
 
-    # Create the signature base string
-    sig_basestring = f'v0:{request_timestamp}:{request_body.decode("utf-8")}'
+    # Reject anything but the exact signature format before doing any HMAC work.
+    # fromhex() alone would also accept uppercase digits and embedded whitespace.
+    if _SIGNATURE_PATTERN.fullmatch(request_signature) is None:
+        return False
+    received_digest = bytes.fromhex(request_signature[3:])
+
+    # Slack timestamps are whole epoch seconds; reject stale or replayed requests
+    # without computing the HMAC
+    if not (request_timestamp.isascii() and request_timestamp.isdigit()):
+        return False
+    if abs(time.time() - int(request_timestamp)) > MAX_REQUEST_AGE_SECONDS:
+        return False
 
-    # Create the signature
-    expected_signature = (
-        'v0=' + hmac.new(signing_secret.encode('utf-8'), sig_basestring.encode('utf-8'), hashlib.sha256).hexdigest()
-    )
+    # Sign the base string v0:<timestamp>:<body> from a copy of the keyed HMAC
+    mac = _primed_hmac(signing_secret.encode('utf-8')).copy()
+    mac.update(f'v0:{request_timestamp}:'.encode())
+    mac.update(request_body)
+    expected_digest = mac.digest()
 
     # Compare signatures securely
-    return hmac.compare_digest(expected_signature, request_signature)
+    return hmac.compare_digest(expected_digest, received_digest)
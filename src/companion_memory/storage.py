@@ -1,10 +1,61 @@
 """Storage interfaces and implementations for log data."""
 
-from datetime import UTC, datetime
+import bisect
+import functools
+import logging
+from array import array
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol
 
 import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Keep a warm keep-alive pool shared by all log stores in the process
+LOG_STORE_CLIENT_CONFIG = Config(
+    retries={'mode': 'standard', 'max_attempts': 3},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+)
+
+# Shortest time range DynamoLogStore.fetch_logs gives each concurrent query segment
+MIN_QUERY_SEGMENT_SPAN = timedelta(days=1)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_log_table(table_name: str, region: str) -> Any:  # noqa: ANN401
+    """Get a DynamoDB Table resource for log storage, shared per table and region.
+
+    Args:
+        table_name: Name of the DynamoDB table
+        region: AWS region name
+
+    Returns:
+        DynamoDB Table resource
+
+    """
+    dynamodb = boto3.resource('dynamodb', region_name=region, config=LOG_STORE_CLIENT_CONFIG)
+    return dynamodb.Table(table_name)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_log_client(region: str) -> Any:  # noqa: ANN401
+    """Get a low-level DynamoDB client for log reads and writes, shared per region.
+
+    Unlike resources, boto3 clients are thread-safe, so concurrent queries can share it.
+
+    Args:
+        region: AWS region name
+
+    Returns:
+        DynamoDB client
+
+    """
+    return boto3.client('dynamodb', region_name=region, config=LOG_STORE_CLIENT_CONFIG)
 
 
 class LogStore(Protocol):
@@ -22,6 +73,15 @@ class LogStore(Protocol):
         """
         ...  # pragma: no cover
 
+    def write_logs(self, entries: Iterable[Mapping[str, str]]) -> None:
+        """Write several log entries to storage.
+
+        Args:
+            entries: Log entries, each with user_id, timestamp, text and log_id keys
+
+        """
+        ...  # pragma: no cover
+
     def fetch_logs(self, user_id: str, since: datetime) -> list[dict[str, Any]]:
         """Fetch log entries for a user since a given date.
 
@@ -36,12 +96,25 @@ class LogStore(Protocol):
         ...  # pragma: no cover
 
 
+class _UserLogs:
+    """Log entries for one user, stored as parallel arrays sorted by time."""
+
+    __slots__ = ('epochs', 'log_ids', 'texts', 'timestamps')
+
+    def __init__(self) -> None:
+        """Initialize empty log arrays."""
+        self.epochs = array('d')  # UTC epoch seconds, parsed once at write time
+        self.timestamps: list[str] = []
+        self.texts: list[str] = []
+        self.log_ids: list[str] = []
+
+
 class MemoryLogStore:
     """In-memory implementation of LogStore for testing."""
 
     def __init__(self) -> None:
         """Initialize the memory log store."""
-        self._storage: dict[str, list[dict[str, Any]]] = {}
+        self._storage: dict[str, _UserLogs] = {}
 
     def write_log(self, user_id: str, timestamp: str, text: str, log_id: str) -> None:
         """Write a log entry to memory storage.
@@ -53,16 +126,31 @@ class MemoryLogStore:
             log_id: Unique identifier for the log entry
 
         """
-        if user_id not in self._storage:
-            self._storage[user_id] = []
+        user_logs = self._storage.get(user_id)
+        if user_logs is None:
+            user_logs = self._storage[user_id] = _UserLogs()
 
-        log_entry = {
-            'user_id': user_id,
-            'timestamp': timestamp,
-            'text': text,
-            'log_id': log_id,
-        }
-        self._storage[user_id].append(log_entry)
+        epoch = datetime.fromisoformat(timestamp).timestamp()
+        epochs = user_logs.epochs
+
+        # Logs normally arrive in time order, so appending is the common case
+        index = len(epochs) if not epochs or epoch >= epochs[-1] else bisect.bisect_right(epochs, epoch)
+        epochs.insert(index, epoch)
+        user_logs.timestamps.insert(index, timestamp)
+        user_logs.texts.insert(index, text)
+        user_logs.log_ids.insert(index, log_id)
+
+    def write_logs(self, entries: Iterable[Mapping[str, str]]) -> None:
+        """Write several log entries to memory storage.
+
+        Args:
+            entries: Log entries, each with user_id, timestamp, text and log_id keys
+
+        """
+        for entry in entries:
+            self.write_log(
+                user_id=entry['user_id'], timestamp=entry['timestamp'], text=entry['text'], log_id=entry['log_id']
+            )
 
     def fetch_logs(self, user_id: str, since: datetime) -> list[dict[str, Any]]:
         """Fetch log entries for a user since a given date.
@@ -72,43 +160,47 @@ class MemoryLogStore:
             since: Fetch logs from this date onwards
 
         Returns:
-            List of log entries as dictionaries
+            List of log entries as dictionaries, oldest first
 
         """
-        if user_id not in self._storage:
+        user_logs = self._storage.get(user_id)
+        if user_logs is None:
             return []
 
-        user_logs = self._storage[user_id]
-        filtered_logs = []
-
-        for log_entry in user_logs:
-            # Parse the ISO timestamp string
-            log_timestamp = datetime.fromisoformat(log_entry['timestamp'].replace('Z', '+00:00'))  # noqa: FURB162
-
-            # Filter logs that are at or after the 'since' datetime (ensure both are timezone-aware for comparison)
-            if log_timestamp.astimezone(UTC) >= since.astimezone(UTC):
-                filtered_logs.append(log_entry)
-
-        return filtered_logs
+        # Entries are sorted by epoch seconds, which are independent of the
+        # timestamps' UTC offsets, so the matching logs are a suffix of the arrays
+        start = bisect.bisect_left(user_logs.epochs, since.timestamp())
+        return [
+            {'user_id': user_id, 'timestamp': timestamp, 'text': text, 'log_id': log_id}
+            for timestamp, text, log_id in zip(
+                user_logs.timestamps[start:], user_logs.texts[start:], user_logs.log_ids[start:], strict=True
+            )
+        ]
 
 
 class DynamoLogStore:
     """DynamoDB implementation of LogStore."""
 
-    def __init__(self, table_name: str = 'CompanionMemory') -> None:
+    def __init__(self, table_name: str = 'CompanionMemory', query_segments: int = 1) -> None:
         """Initialize the DynamoDB log store.
 
         Args:
             table_name: Name of the DynamoDB table to use
+            query_segments: Maximum number of time sub-ranges fetch_logs queries concurrently. Windows
+                shorter than ``query_segments * MIN_QUERY_SEGMENT_SPAN`` use fewer segments, down to a
+                single query for windows under ``2 * MIN_QUERY_SEGMENT_SPAN``
 
         """
         import os
 
         self._table_name = table_name
+        self._query_segments = query_segments
         # Use specified region or default to us-east-1 for testing
         region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
-        self._dynamodb = boto3.resource('dynamodb', region_name=region)
-        self._table = self._dynamodb.Table(table_name)
+        # The Table resource backs batch writes; the hot write and query paths use the low-level client
+        self._table = _get_log_table(table_name, region)
+        self._client = _get_log_client(region)
+        self._deserializer = TypeDeserializer()
 
     def _generate_partition_key(self, user_id: str) -> str:
         """Generate partition key for DynamoDB.
@@ -144,7 +236,39 @@ class DynamoLogStore:
             log_id: Unique identifier for the log entry
 
         """
-        item = {
+        # Every attribute is a string, so the low-level item is built directly
+        item = self._build_item(user_id, timestamp, text, log_id)
+        self._client.put_item(TableName=self._table_name, Item={key: {'S': value} for key, value in item.items()})
+
+    def write_logs(self, entries: Iterable[Mapping[str, str]]) -> None:
+        """Write several log entries to DynamoDB with BatchWriteItem.
+
+        Entries are sent 25 at a time, and any unprocessed items are resubmitted.
+
+        Args:
+            entries: Log entries, each with user_id, timestamp, text and log_id keys
+
+        """
+        with self._table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as writer:
+            for entry in entries:
+                writer.put_item(
+                    Item=self._build_item(entry['user_id'], entry['timestamp'], entry['text'], entry['log_id'])
+                )
+
+    def _build_item(self, user_id: str, timestamp: str, text: str, log_id: str) -> dict[str, str]:
+        """Build the DynamoDB item for a log entry.
+
+        Args:
+            user_id: The user identifier
+            timestamp: ISO 8601 timestamp string
+            text: The log content
+            log_id: Unique identifier for the log entry
+
+        Returns:
+            DynamoDB item
+
+        """
+        return {
             'PK': self._generate_partition_key(user_id),
             'SK': self._generate_sort_key(timestamp),
             'user_id': user_id,
@@ -152,7 +276,6 @@ class DynamoLogStore:
             'text': text,
             'log_id': log_id,
         }
-        self._table.put_item(Item=item)
 
     def fetch_logs(self, user_id: str, since: datetime) -> list[dict[str, Any]]:
         """Fetch log entries for a user since a given date.
@@ -168,42 +291,76 @@ class DynamoLogStore:
         # Generate partition key for the user
         partition_key = self._generate_partition_key(user_id)
 
-        # Convert since datetime to UTC, then to ISO string for comparison
+        # Log timestamps are written as UTC ISO strings, so sort key ranges
+        # select logs by time. Long windows are split into sub-ranges queried
+        # concurrently; the last one is open-ended. Short windows stay a single
+        # query, since the thread fan-out would cost more than it saves.
         since_utc = since.astimezone(UTC)
-        since_str = since_utc.isoformat()
-        since_sort_key = self._generate_sort_key(since_str)
+        segment_starts = [since_utc]
+        if self._query_segments > 1:
+            window = datetime.now(UTC) - since_utc
+            segment_count = min(self._query_segments, window // MIN_QUERY_SEGMENT_SPAN)
+            if segment_count > 1:
+                segment_span = window / segment_count
+                segment_starts += [since_utc + segment_span * index for index in range(1, segment_count)]
+
+        queries = []
+        for index, segment_start in enumerate(segment_starts):
+            values = {
+                ':pk': {'S': partition_key},
+                ':lower': {'S': self._generate_sort_key(segment_start.isoformat())},
+            }
+            if index + 1 < len(segment_starts):
+                # Stop just short of the next segment's start so no log is returned twice
+                upper_bound = segment_starts[index + 1] - timedelta(microseconds=1)
+                values[':upper'] = {'S': self._generate_sort_key(upper_bound.isoformat())}
+                queries.append(('PK = :pk AND SK BETWEEN :lower AND :upper', values))
+            else:
+                queries.append(('PK = :pk AND SK >= :lower', values))
+
+        try:
+            if len(queries) == 1:
+                return self._query_all_pages(*queries[0])
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                pages = list(executor.map(lambda query: self._query_all_pages(*query), queries))
+        except Exception:  # noqa: BLE001
+            # Fallback: return empty list if DynamoDB query fails (broad except needed for AWS SDK exceptions)
+            return []
+
+        return [item for page in pages for item in page]
+
+    def _query_all_pages(
+        self, key_condition_expression: str, expression_values: dict[str, dict[str, str]]
+    ) -> list[dict[str, Any]]:
+        """Query every page of logs matching a key condition.
 
-        # Query DynamoDB for logs since the given date with pagination support
-        items = []
-        last_evaluated_key = None
+        Records without a timestamp are dropped server-side, and only the log
+        entry fields are returned.
+
+        Args:
+            key_condition_expression: Key condition expression for the query
+            expression_values: Low-level attribute values referenced by the expression
+
+        Returns:
+            Matching log entries in sort key order
+
+        """
+        items: list[dict[str, Any]] = []
+        query_kwargs: dict[str, Any] = {
+            'TableName': self._table_name,
+            'KeyConditionExpression': key_condition_expression,
+            'FilterExpression': 'attribute_exists(#ts)',
+            'ProjectionExpression': 'user_id, #ts, #txt, log_id',
+            'ExpressionAttributeNames': {'#ts': 'timestamp', '#txt': 'text'},
+            'ExpressionAttributeValues': expression_values,
+        }
+        deserialize = self._deserializer.deserialize
 
         while True:
-            query_kwargs = {'KeyConditionExpression': Key('PK').eq(partition_key) & Key('SK').gte(since_sort_key)}
-
-            if last_evaluated_key:
-                query_kwargs['ExclusiveStartKey'] = last_evaluated_key
-
-            try:
-                response = self._table.query(**query_kwargs)
-                items.extend(response.get('Items', []))
-
-                last_evaluated_key = response.get('LastEvaluatedKey')
-                if not last_evaluated_key:
-                    break
-
-            except Exception:  # noqa: BLE001
-                # Fallback: return empty list if DynamoDB query fails (broad except needed for AWS SDK exceptions)
-                return []
-
-        # Filter items by timestamp (additional filtering beyond sort key)
-        filtered_items = []
-        for item in items:
-            # Skip items missing required timestamp field
-            if 'timestamp' not in item:
-                continue
-            item_timestamp = datetime.fromisoformat(item['timestamp'].replace('Z', '+00:00'))  # noqa: FURB162
-            # Ensure both timestamps are timezone-aware for comparison
-            if item_timestamp.astimezone(UTC) >= since.astimezone(UTC):
-                filtered_items.append(item)
-
-        return filtered_items
+            response = self._client.query(**query_kwargs)
+            items.extend({key: deserialize(value) for key, value in item.items()} for item in response.get('Items', []))
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                return items
+            query_kwargs['ExclusiveStartKey'] = last_evaluated_key
@@ -1,16 +1,135 @@
 """Log summarization functionality using LLM."""
 
+import bisect
+import hashlib
+import itertools
 import logging
+import operator
+import os
+import re
+import threading
+import time
 import zoneinfo
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta, timezone
 from textwrap import dedent
 from typing import Any, Protocol
 
-# Import moved to function level to avoid circular import
 from companion_memory.storage import LogStore
+from companion_memory.user_ids import parse_user_ids
+from companion_memory.user_settings import DynamoUserSettingsStore
+from companion_memory.user_sync import sync_user_timezone_from_slack
 
 logger = logging.getLogger(__name__)
 
+# Extracts the labeled sections of a combined weekly and daily summary response
+_SUMMARY_SECTION_PATTERN = re.compile(r'<(weekly|daily)>\s*(.*?)\s*</\1>', re.DOTALL)
+
+# How long a looked-up user timezone is reused before DynamoDB (and Slack) are asked again
+USER_TIMEZONE_CACHE_TTL_SECONDS = 3600.0
+
+# user_id -> (monotonic time of lookup, timezone)
+_user_timezone_cache: dict[str, tuple[float, timezone | zoneinfo.ZoneInfo]] = {}
+_user_timezone_cache_lock = threading.Lock()
+
+# How long a generated summary is reused for the same user and an identical prompt
+SUMMARY_RESPONSE_CACHE_TTL_SECONDS = 3600.0
+
+# Most generated summaries kept at once; the oldest is dropped first
+SUMMARY_RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# digest of (user_id, prompt) -> (monotonic time of generation, summary)
+_summary_response_cache: dict[bytes, tuple[float, str]] = {}
+_summary_response_cache_lock = threading.Lock()
+
+# Settings store shared by timezone lookups, created on first use
+_settings_store: 'DynamoUserSettingsStore | None' = None
+_settings_store_lock = threading.Lock()
+
+# Prompt and message templates, dedented once at import and filled in with str.format
+_SUMMARY_PROMPT_TEMPLATE = dedent(
+    """
+    You will be acting in the role of an executive assistant for an important executive with limited time.
+
+    Your executive has tasked you with summarizing the executive's work log entries from the {period}.
+
+    Here are the log entries:
+
+    <log-entries>
+    {logs_text}
+    </log-entries>
+
+    Using these log entries, provide a concise summary of the main activities and themes.
+    - Instead of specific times, refer to general times of the day.
+    - Include both the name of the day and the date.
+    - Include any relevant metrics or insights that are relevant to the executive's work.
+    - Use the second person (you), as if you were addressing the executive directly in conversation.
+    - Do not include a preamble, address, or salutation.
+    - Do not invite the executive to respond or follow up.
+    - Do not include any other text than the summary.
+    - Format your summary as a bulleted list.
+    - At the end of the summary, make note of any items that are not yet complete or appear to have been left unaddressed.
+    """
+)
+
+_COMBINED_SUMMARY_PROMPT_TEMPLATE = dedent(
+    """
+    You will be acting in the role of an executive assistant for an important executive with limited time.
+
+    Your executive has tasked you with writing two summaries of the executive's work log entries: one of the
+    past week, and one of the day before.
+
+    Here are the log entries from the past week:
+
+    <week-log-entries>
+    {week_logs_text}
+    </week-log-entries>
+
+    Here are the log entries from the day before:
+
+    <day-log-entries>
+    {day_logs_text}
+    </day-log-entries>
+
+    Using these log entries, provide a concise summary of the main activities and themes for each period.
+    - Instead of specific times, refer to general times of the day.
+    - Include both the name of the day and the date.
+    - Include any relevant metrics or insights that are relevant to the executive's work.
+    - Use the second person (you), as if you were addressing the executive directly in conversation.
+    - Do not include a preamble, address, or salutation.
+    - Do not invite the executive to respond or follow up.
+    - Format each summary as a bulleted list.
+    - At the end of each summary, make note of any items that are not yet complete or appear to have been left unaddressed.
+    - Put the past week's summary inside <weekly></weekly> tags and the day before's summary inside <daily></daily> tags.
+    - Do not include any other text than the two tagged summaries.
+    """
+)
+
+_SUMMARY_MESSAGE_TEMPLATE = dedent(
+    """
+    Here's your activity summary:
+
+    **This Week:**
+    {weekly_summary}
+
+    **Yesterday:**
+    {daily_summary}
+    """
+)
+
+# Summary used for a period without log entries, instead of asking the LLM to summarize nothing
+NO_ACTIVITY_SUMMARY = 'No work log entries were recorded for this period.'
+
+# Default number of users whose daily summaries are generated and sent at once
+DEFAULT_DAILY_SUMMARY_CONCURRENCY = 8
+
+# Default character budget for the log lines in one prompt; the most recent entries are kept
+DEFAULT_SUMMARY_MAX_LOG_CHARS = 40_000
+
+# Fetches both fields a prompt line needs from a log entry in one call
+_get_timestamp_and_text = operator.itemgetter('timestamp', 'text')
+
 
 class LLMClient(Protocol):
     """Protocol for LLM client implementations."""
@@ -31,27 +150,61 @@ class LLMClient(Protocol):
 def _format_log_entries(logs: list[dict[str, Any]], user_tz: timezone | zoneinfo.ZoneInfo | None = None) -> str:
     """Format log entries for inclusion in prompts.
 
+    When the entries exceed the SUMMARY_MAX_LOG_CHARS budget, only the most recent
+    ones that fit are kept, preceded by a line counting the omitted entries.
+
     Args:
-        logs: List of log entry dictionaries
+        logs: List of log entry dictionaries, oldest first
         user_tz: User's timezone for timestamp conversion (defaults to UTC)
 
     Returns:
         Formatted string with log entries
 
     """
-    if user_tz is None:
-        user_tz = UTC
+    return _join_log_lines(_format_log_lines(logs, user_tz or UTC))
+
 
-    log_entries = []
-    for log in logs:
-        # Parse UTC timestamp and convert to user timezone
-        utc_timestamp = datetime.fromisoformat(log['timestamp'])
-        user_timestamp = utc_timestamp.astimezone(user_tz)
-        # Format timestamp in user's timezone (show date and time)
-        formatted_timestamp = user_timestamp.strftime('%Y-%m-%d %H:%M:%S')
-        log_entries.append(f'- {formatted_timestamp}: {log["text"]}')
+def _format_log_lines(logs: list[dict[str, Any]], user_tz: timezone | zoneinfo.ZoneInfo) -> list[str]:
+    """Format each log entry as a prompt line stamped with the user's local time.
 
-    return '\n'.join(log_entries)
+    Args:
+        logs: List of log entry dictionaries
+        user_tz: User's timezone for timestamp conversion
+
+    Returns:
+        One formatted line per log entry, in the same order
+
+    """
+    # Convert each UTC timestamp to the user's timezone, showing date and time.
+    # The first 19 characters of isoformat(' ', 'seconds') match strftime('%Y-%m-%d %H:%M:%S')
+    # at a fraction of the cost. The parser is bound to a local once, so each row
+    # skips the global and attribute lookups.
+    fromisoformat = datetime.fromisoformat
+    return [
+        f'- {fromisoformat(timestamp).astimezone(user_tz).isoformat(" ", "seconds")[:19]}: {text}'
+        for timestamp, text in map(_get_timestamp_and_text, logs)
+    ]
+
+
+def _join_log_lines(lines: list[str]) -> str:
+    """Join formatted log lines, keeping only the most recent ones that fit SUMMARY_MAX_LOG_CHARS.
+
+    Args:
+        lines: Formatted log lines, oldest first
+
+    Returns:
+        Newline-separated log lines, led by an omitted-count line if any were dropped
+
+    """
+    # Joined length of the newest k lines, counting each line's newline separator
+    max_chars = int(os.environ.get('SUMMARY_MAX_LOG_CHARS', DEFAULT_SUMMARY_MAX_LOG_CHARS))
+    tail_lengths = list(itertools.accumulate(len(line) + 1 for line in reversed(lines)))
+    if not tail_lengths or tail_lengths[-1] <= max_chars + 1:
+        return '\n'.join(lines)
+
+    kept_count = bisect.bisect_right(tail_lengths, max_chars + 1)
+    omitted_count = len(lines) - kept_count
+    return '\n'.join([f'- ... [{omitted_count} earlier entries omitted] ...', *lines[omitted_count:]])
 
 
 def _build_summary_prompt(logs_text: str, period: str) -> str:
@@ -65,30 +218,71 @@ def _build_summary_prompt(logs_text: str, period: str) -> str:
         Complete prompt string
 
     """
-    return dedent(
-        f"""
-        You will be acting in the role of an executive assistant for an important executive with limited time.
+    return _SUMMARY_PROMPT_TEMPLATE.format(logs_text=logs_text, period=period)
 
-        Your executive has tasked you with summarizing the executive's work log entries from the {period}.
 
-        Here are the log entries:
+def _build_combined_summary_prompt(week_logs_text: str, day_logs_text: str) -> str:
+    """Build one LLM prompt that asks for both the weekly and the daily summary.
 
-        <log-entries>
-        {logs_text}
-        </log-entries>
+    Args:
+        week_logs_text: Formatted log entries from the past week
+        day_logs_text: Formatted log entries from the day before
 
-        Using these log entries, provide a concise summary of the main activities and themes.
-        - Instead of specific times, refer to general times of the day.
-        - Include both the name of the day and the date.
-        - Include any relevant metrics or insights that are relevant to the executive's work.
-        - Use the second person (you), as if you were addressing the executive directly in conversation.
-        - Do not include a preamble, address, or salutation.
-        - Do not invite the executive to respond or follow up.
-        - Do not include any other text than the summary.
-        - Format your summary as a bulleted list.
-        - At the end of the summary, make note of any items that are not yet complete or appear to have been left unaddressed.
-        """
-    )
+    Returns:
+        Complete prompt string
+
+    """
+    return _COMBINED_SUMMARY_PROMPT_TEMPLATE.format(week_logs_text=week_logs_text, day_logs_text=day_logs_text)
+
+
+def _split_combined_summary(response: str) -> tuple[str, str] | None:
+    """Split a combined summary response into its weekly and daily sections.
+
+    Args:
+        response: LLM response to a prompt from _build_combined_summary_prompt
+
+    Returns:
+        Tuple of (weekly summary, daily summary), or None if either section is missing
+
+    """
+    sections = dict(_SUMMARY_SECTION_PATTERN.findall(response))
+    if 'weekly' not in sections or 'daily' not in sections:
+        return None
+    return sections['weekly'], sections['daily']
+
+
+def _complete_summary_prompt(user_id: str, prompt: str, llm: LLMClient) -> str:
+    """Complete a summary prompt, reusing the user's summary of an identical recent prompt.
+
+    The prompt embeds the period and every formatted log entry, so asking again
+    for the same range with no new entries returns the earlier summary without
+    another LLM call. Failed completions are not cached.
+
+    Args:
+        user_id: The user identifier
+        prompt: Complete summary prompt
+        llm: LLM client for generating summaries
+
+    Returns:
+        Generated summary text
+
+    """
+    key = hashlib.blake2b(f'{user_id}\n{prompt}'.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    with _summary_response_cache_lock:
+        cached = _summary_response_cache.get(key)
+    if cached is not None and now - cached[0] < SUMMARY_RESPONSE_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    summary = llm.complete(prompt)
+
+    with _summary_response_cache_lock:
+        # Re-inserting moves the entry to the end, so the first entry is always the oldest
+        _summary_response_cache.pop(key, None)
+        _summary_response_cache[key] = (now, summary)
+        while len(_summary_response_cache) > SUMMARY_RESPONSE_CACHE_MAX_ENTRIES:
+            del _summary_response_cache[next(iter(_summary_response_cache))]
+    return summary
 
 
 def _summarize_period(user_id: str, log_store: LogStore, llm: LLMClient, days: int, period_name: str) -> str:
@@ -106,20 +300,22 @@ def _summarize_period(user_id: str, log_store: LogStore, llm: LLMClient, days: i
 
     """
     # Get user's timezone for timestamp formatting
-    user_tz = _get_user_timezone(user_id)
+    user_tz = get_user_timezone(user_id)
 
     # Calculate date N days ago
     since = datetime.now(UTC) - timedelta(days=days)
 
     # Fetch logs from the period
     logs = log_store.fetch_logs(user_id, since)
+    if not logs:
+        return NO_ACTIVITY_SUMMARY
 
     # Format logs and build prompt
     logs_text = _format_log_entries(logs, user_tz)
     prompt = _build_summary_prompt(logs_text, period_name)
 
     # Generate summary using LLM
-    return llm.complete(prompt)
+    return _complete_summary_prompt(user_id, prompt, llm)
 
 
 def summarize_week(user_id: str, log_store: LogStore, llm: LLMClient) -> str:
@@ -152,11 +348,12 @@ def summarize_day(user_id: str, log_store: LogStore, llm: LLMClient) -> str:
     return _summarize_period(user_id, log_store, llm, days=1, period_name='past day')
 
 
-def _get_user_timezone(user_id: str) -> timezone | zoneinfo.ZoneInfo:
+def get_user_timezone(user_id: str) -> timezone | zoneinfo.ZoneInfo:
     """Get user's timezone from DynamoDB user settings, with fallback to Slack sync and UTC.
 
     If no user record exists in DynamoDB, attempts to sync timezone from Slack API
-    and create the user record before returning the timezone.
+    and create the user record before returning the timezone. Lookups are cached
+    for USER_TIMEZONE_CACHE_TTL_SECONDS; failed lookups are not cached.
 
     Args:
         user_id: The user identifier
@@ -165,36 +362,150 @@ def _get_user_timezone(user_id: str) -> timezone | zoneinfo.ZoneInfo:
         User's timezone or UTC if unable to determine
 
     """
+    now = time.monotonic()
+    with _user_timezone_cache_lock:
+        cached = _user_timezone_cache.get(user_id)
+    if cached is not None and now - cached[0] < USER_TIMEZONE_CACHE_TTL_SECONDS:
+        return cached[1]
+
     try:
-        from companion_memory.user_settings import DynamoUserSettingsStore
+        user_tz = _load_user_timezone(user_id)
+    except Exception:  # noqa: BLE001
+        # Fall back to UTC if any error occurs with DynamoDB or Slack sync
+        return UTC
 
-        settings_store = DynamoUserSettingsStore()
-        user_settings = settings_store.get_user_settings(user_id)
+    with _user_timezone_cache_lock:
+        _user_timezone_cache[user_id] = (now, user_tz)
+    return user_tz
 
-        # Check if user has timezone setting
-        user_tz_name = user_settings.get('timezone')
 
-        # If no timezone found, try to sync from Slack
-        if not user_tz_name:
-            from companion_memory.user_sync import sync_user_timezone_from_slack
+def invalidate_user_timezone(user_id: str) -> None:
+    """Drop a user's cached timezone so the next lookup reads the stored settings.
 
-            user_tz_name = sync_user_timezone_from_slack(user_id)
-            if not user_tz_name:
-                # Could not sync from Slack, fall back to UTC
-                return UTC
+    Args:
+        user_id: The user identifier
 
-        if user_tz_name == 'UTC':
-            return UTC
+    """
+    with _user_timezone_cache_lock:
+        _user_timezone_cache.pop(user_id, None)
 
-        try:
-            return zoneinfo.ZoneInfo(user_tz_name)
-        except zoneinfo.ZoneInfoNotFoundError:
+
+def _get_settings_store() -> DynamoUserSettingsStore:
+    """Get the user settings store, creating it at most once per process.
+
+    Returns:
+        DynamoUserSettingsStore instance
+
+    """
+    global _settings_store
+    # Fast path once the store exists; only contend for the lock on first use
+    if _settings_store is None:
+        with _settings_store_lock:
+            if _settings_store is None:  # pragma: no branch
+                _settings_store = DynamoUserSettingsStore()
+    return _settings_store
+
+
+def _load_user_timezone(user_id: str) -> timezone | zoneinfo.ZoneInfo:
+    """Look up a user's timezone in DynamoDB user settings, syncing it from Slack if missing.
+
+    Args:
+        user_id: The user identifier
+
+    Returns:
+        User's timezone, or UTC if none is set or syncable
+
+    """
+    user_settings = _get_settings_store().get_user_settings(user_id)
+
+    # Check if user has timezone setting
+    user_tz_name = user_settings.get('timezone')
+
+    # If no timezone found, try to sync from Slack
+    if not user_tz_name:
+        user_tz_name = sync_user_timezone_from_slack(user_id)
+        if not user_tz_name:
+            # Could not sync from Slack, fall back to UTC
             return UTC
 
-    except Exception:  # noqa: BLE001
-        # Fall back to UTC if any error occurs with DynamoDB or Slack sync
+    return _parse_timezone_name(user_tz_name)
+
+
+def _parse_timezone_name(user_tz_name: str) -> timezone | zoneinfo.ZoneInfo:
+    """Convert a stored timezone name to a timezone.
+
+    Args:
+        user_tz_name: IANA timezone name, or 'UTC'
+
+    Returns:
+        The named timezone, or UTC if the name is unknown
+
+    """
+    if user_tz_name == 'UTC':
         return UTC
 
+    try:
+        return zoneinfo.ZoneInfo(user_tz_name)
+    except zoneinfo.ZoneInfoNotFoundError:
+        return UTC
+
+
+def _prime_user_timezone_cache(user_ids: Sequence[str]) -> None:
+    """Cache the stored timezones of uncached users using one batched settings read.
+
+    Users without a stored timezone are left uncached, so their own lookup can
+    still sync it from Slack. A failed batch read is logged and leaves every
+    user to be looked up individually.
+
+    Args:
+        user_ids: The user identifiers
+
+    """
+    now = time.monotonic()
+    with _user_timezone_cache_lock:
+        uncached_user_ids = [
+            user_id
+            for user_id in user_ids
+            if (cached := _user_timezone_cache.get(user_id)) is None
+            or now - cached[0] >= USER_TIMEZONE_CACHE_TTL_SECONDS
+        ]
+    if not uncached_user_ids:
+        return
+
+    try:
+        stored_settings = _get_settings_store().batch_get_user_settings(uncached_user_ids)
+    except Exception:
+        logger.exception('Failed to batch load timezones for %d users', len(uncached_user_ids))
+        return
+
+    loaded = {
+        user_id: (now, _parse_timezone_name(settings['timezone']))
+        for user_id, settings in stored_settings.items()
+        if settings.get('timezone')
+    }
+    with _user_timezone_cache_lock:
+        _user_timezone_cache.update(loaded)
+
+
+def _get_day_range_utc(user_tz: timezone | zoneinfo.ZoneInfo, days_offset: int) -> tuple[datetime, datetime]:
+    """Get the UTC times at which a day started and ended in the user's timezone.
+
+    Args:
+        user_tz: User's timezone
+        days_offset: Number of days to offset from today (0=today, 1=yesterday, etc.)
+
+    Returns:
+        Start of the target day and start of the following day, in UTC
+
+    """
+    # Build local midnights of the target and following dates directly, then convert to UTC for storage queries
+    target_date = datetime.now(user_tz).date() - timedelta(days=days_offset)
+    next_date = target_date + timedelta(days=1)
+    return (
+        datetime(target_date.year, target_date.month, target_date.day, tzinfo=user_tz).astimezone(UTC),
+        datetime(next_date.year, next_date.month, next_date.day, tzinfo=user_tz).astimezone(UTC),
+    )
+
 
 def _summarize_timezone_aware_day(
     user_id: str, log_store: LogStore, llm: LLMClient, days_offset: int, period_name: str
@@ -216,26 +527,24 @@ def _summarize_timezone_aware_day(
 
     """
     # Get user's timezone
-    user_tz = _get_user_timezone(user_id)
-
-    # Get current time in user's timezone
-    now_user_tz = datetime.now(user_tz)
-
-    # Calculate target day's start time in user's timezone
-    target_day_start = now_user_tz.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days_offset)
-
-    # Convert to UTC for storage query
-    target_day_start_utc = target_day_start.astimezone(UTC)
-
-    # Fetch logs from target day
-    logs = log_store.fetch_logs(user_id, target_day_start_utc)
+    user_tz = get_user_timezone(user_id)
+
+    # Fetch logs from target day; fetch_logs has no upper bound, so later entries are dropped here
+    day_start_utc, day_end_utc = _get_day_range_utc(user_tz, days_offset)
+    logs = [
+        log
+        for log in log_store.fetch_logs(user_id, day_start_utc)
+        if datetime.fromisoformat(log['timestamp']) < day_end_utc
+    ]
+    if not logs:
+        return NO_ACTIVITY_SUMMARY
 
     # Format logs and build prompt
     logs_text = _format_log_entries(logs, user_tz)
     prompt = _build_summary_prompt(logs_text, period_name)
 
     # Generate summary using LLM
-    return llm.complete(prompt)
+    return _complete_summary_prompt(user_id, prompt, llm)
 
 
 def summarize_yesterday(user_id: str, log_store: LogStore, llm: LLMClient) -> str:
@@ -285,17 +594,53 @@ def _format_summary_message(weekly_summary: str, daily_summary: str) -> str:
         Formatted message text
 
     """
-    return dedent(
-        f"""
-        Here's your activity summary:
+    return _SUMMARY_MESSAGE_TEMPLATE.format(weekly_summary=weekly_summary, daily_summary=daily_summary)
 
-        **This Week:**
-        {weekly_summary}
 
-        **Yesterday:**
-        {daily_summary}
-        """
-    )
+def _generate_week_and_day_summaries(user_id: str, log_store: LogStore, llm: LLMClient) -> tuple[str, str]:
+    """Generate the weekly and yesterday summaries for a user's summary message.
+
+    Both summaries come from a single LLM call over a single log fetch, since
+    yesterday's logs are a subset of the week's. If the response is missing
+    either section, both summaries are generated separately instead. Periods
+    without any log entries get NO_ACTIVITY_SUMMARY without calling the LLM.
+
+    Args:
+        user_id: The user identifier
+        log_store: Storage implementation for fetching logs
+        llm: LLM client for generating summaries
+
+    Returns:
+        Tuple of the weekly summary and yesterday's summary
+
+    """
+    user_tz = get_user_timezone(user_id)
+    week_logs = log_store.fetch_logs(user_id, datetime.now(UTC) - timedelta(days=7))
+    if not week_logs:
+        return NO_ACTIVITY_SUMMARY, NO_ACTIVITY_SUMMARY
+
+    day_start_utc, day_end_utc = _get_day_range_utc(user_tz, days_offset=1)
+    week_lines = _format_log_lines(week_logs, user_tz)
+    # Yesterday's entries are a subset of the week's, so their formatted lines are reused
+    day_lines = [
+        line
+        for log, line in zip(week_logs, week_lines, strict=True)
+        if day_start_utc <= datetime.fromisoformat(log['timestamp']) < day_end_utc
+    ]
+    if not day_lines:
+        return llm.complete(_build_summary_prompt(_join_log_lines(week_lines), 'past week')), NO_ACTIVITY_SUMMARY
+
+    prompt = _build_combined_summary_prompt(_join_log_lines(week_lines), _join_log_lines(day_lines))
+    sections = _split_combined_summary(llm.complete(prompt))
+    if sections is not None:
+        return sections
+
+    logger.warning('Combined summary for user %s was missing a section, summarizing separately', user_id)
+    # The separate summaries are independent LLM round trips, so they run side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        weekly_future = executor.submit(summarize_week, user_id, log_store, llm)
+        daily_future = executor.submit(summarize_yesterday, user_id, log_store, llm)
+        return weekly_future.result(), daily_future.result()
 
 
 def send_summary_message(user_id: str, log_store: LogStore, llm: LLMClient) -> None:
@@ -307,14 +652,12 @@ def send_summary_message(user_id: str, log_store: LogStore, llm: LLMClient) -> N
         llm: LLM client for generating summaries
 
     """
-    # Generate both weekly and yesterday summaries for morning delivery
-    weekly_summary = summarize_week(user_id, log_store, llm)
-    daily_summary = summarize_yesterday(user_id, log_store, llm)
+    weekly_summary, daily_summary = _generate_week_and_day_summaries(user_id, log_store, llm)
 
     # Format combined message
     message = _format_summary_message(weekly_summary, daily_summary)
 
-    # Send via Slack
+    # Send via Slack; scheduler imports this module, so its import has to wait until first use
     from companion_memory.scheduler import get_slack_client
 
     slack_client = get_slack_client()
@@ -332,15 +675,13 @@ def send_daily_summary_to_users(log_store: LogStore, llm: LLMClient) -> None:
         llm: LLM client for generating summaries
 
     """
-    import os
-
     users_env = os.environ.get('DAILY_SUMMARY_USERS', '')
     if not users_env:
         logger.info('No users configured for daily summaries (DAILY_SUMMARY_USERS not set)')
         return
 
     # Parse comma-separated user IDs
-    user_ids = [user_id.strip() for user_id in users_env.split(',') if user_id.strip()]
+    user_ids = parse_user_ids(users_env)
 
     if not user_ids:
         logger.info('No valid user IDs found in DAILY_SUMMARY_USERS')
@@ -348,12 +689,7 @@ def send_daily_summary_to_users(log_store: LogStore, llm: LLMClient) -> None:
 
     logger.info('Sending daily summaries to %d users: %s', len(user_ids), ', '.join(user_ids))
 
-    for user_id in user_ids:
-        try:
-            send_summary_message(user_id, log_store, llm)
-            logger.info('Successfully sent daily summary to user %s', user_id)
-        except Exception:
-            logger.exception('Failed to send daily summary to user %s', user_id)
+    _send_summaries_concurrently(user_ids, log_store, llm)
 
 
 def check_and_send_daily_summaries(log_store: LogStore, llm: LLMClient) -> None:
@@ -367,14 +703,12 @@ def check_and_send_daily_summaries(log_store: LogStore, llm: LLMClient) -> None:
         llm: LLM client for generating summaries
 
     """
-    import os
-
     users_env = os.environ.get('DAILY_SUMMARY_USERS', '')
     if not users_env:
         return
 
     # Parse comma-separated user IDs
-    user_ids = [user_id.strip() for user_id in users_env.split(',') if user_id.strip()]
+    user_ids = parse_user_ids(users_env)
 
     if not user_ids:
         return
@@ -382,10 +716,17 @@ def check_and_send_daily_summaries(log_store: LogStore, llm: LLMClient) -> None:
     current_utc = datetime.now(UTC)
     users_to_notify = []
 
-    for user_id in user_ids:
+    # Stored timezones come from one batched read; only the rest need their own lookups
+    _prime_user_timezone_cache(user_ids)
+
+    # Each remaining timezone lookup may hit DynamoDB and Slack, so the lookups run concurrently
+    with ThreadPoolExecutor(max_workers=_get_daily_summary_concurrency(len(user_ids))) as executor:
+        timezone_futures = [executor.submit(get_user_timezone, user_id) for user_id in user_ids]
+
+    for user_id, future in zip(user_ids, timezone_futures, strict=True):
         try:
             # Get user's timezone
-            user_tz = _get_user_timezone(user_id)
+            user_tz = future.result()
 
             # Convert current UTC time to user's timezone
             user_local_time = current_utc.astimezone(user_tz)
@@ -404,9 +745,41 @@ def check_and_send_daily_summaries(log_store: LogStore, llm: LLMClient) -> None:
             ', '.join(users_to_notify),
         )
 
-        for user_id in users_to_notify:
+        _send_summaries_concurrently(users_to_notify, log_store, llm)
+
+
+def _get_daily_summary_concurrency(user_count: int) -> int:
+    """Get how many users to process at once, from DAILY_SUMMARY_CONCURRENCY.
+
+    Args:
+        user_count: Number of users to process
+
+    Returns:
+        Worker count, at least 1 and at most ``user_count``
+
+    """
+    concurrency = int(os.environ.get('DAILY_SUMMARY_CONCURRENCY', DEFAULT_DAILY_SUMMARY_CONCURRENCY))
+    return max(1, min(concurrency, user_count))
+
+
+def _send_summaries_concurrently(user_ids: Sequence[str], log_store: LogStore, llm: LLMClient) -> None:
+    """Send daily summaries to several users at once, logging each user's outcome.
+
+    Summaries are independent and bound by LLM and Slack round trips, so they
+    overlap in a thread pool of up to DAILY_SUMMARY_CONCURRENCY workers.
+
+    Args:
+        user_ids: Users to send summaries to
+        log_store: Storage implementation for fetching logs
+        llm: LLM client for generating summaries
+
+    """
+    with ThreadPoolExecutor(max_workers=_get_daily_summary_concurrency(len(user_ids))) as executor:
+        futures = {executor.submit(send_summary_message, user_id, log_store, llm): user_id for user_id in user_ids}
+        for future in as_completed(futures):
+            user_id = futures[future]
             try:
-                send_summary_message(user_id, log_store, llm)
+                future.result()
                 logger.info('Successfully sent daily summary to user %s', user_id)
             except Exception:
                 logger.exception('Failed to send daily summary to user %s', user_id)
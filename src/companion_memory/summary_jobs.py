@@ -1,11 +1,14 @@
 """Job handlers for summary generation and delivery."""
 
+import functools
 import logging
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
+from slack_sdk.errors import SlackApiError
 
 from companion_memory.job_dispatcher import BaseJobHandler, register_handler
 from companion_memory.job_models import ScheduledJob
@@ -17,6 +20,35 @@ from companion_memory.summarizer import summarize_today, summarize_week, summari
 
 logger = logging.getLogger(__name__)
 
+# Summary function for each supported range
+_SUMMARY_FUNCTIONS: dict[str, Callable[..., str]] = {
+    'today': summarize_today,
+    'yesterday': summarize_yesterday,
+    'lastweek': summarize_week,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_job_table() -> JobTable:
+    """Get the job table used to enqueue follow-up jobs, created once per process.
+
+    Returns:
+        JobTable instance
+
+    """
+    return JobTable()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_client() -> LLMLClient:
+    """Get the LLM client used for summary jobs, created once per process.
+
+    Returns:
+        LLMLClient instance
+
+    """
+    return LLMLClient()
+
 
 def get_summary(user_id: str, summary_range: str, log_store: LogStore, llm: LLMLClient) -> str:
     """Get summary for user and time range.
@@ -34,18 +66,12 @@ def get_summary(user_id: str, summary_range: str, log_store: LogStore, llm: LLML
         ValueError: If summary_range is not supported
 
     """
-    # Validate range early
-    if summary_range not in ('today', 'yesterday', 'lastweek'):
+    summarize = _SUMMARY_FUNCTIONS.get(summary_range)
+    if summarize is None:
         error_msg = f'Unknown range: {summary_range}'
         raise ValueError(error_msg)
 
-    # Generate summary based on range
-    if summary_range == 'today':
-        return summarize_today(user_id=user_id, log_store=log_store, llm=llm)
-    if summary_range == 'yesterday':
-        return summarize_yesterday(user_id=user_id, log_store=log_store, llm=llm)
-    # lastweek
-    return summarize_week(user_id=user_id, log_store=log_store, llm=llm)
+    return summarize(user_id=user_id, log_store=log_store, llm=llm)
 
 
 def generate_summary_job(
@@ -55,12 +81,16 @@ def generate_summary_job(
     log_store: LogStore,
     llm: LLMLClient,
 ) -> None:
-    """Generate a summary and enqueue a Slack message job.
+    """Generate a summary and send it to the user via Slack.
+
+    The message is sent right away. If Slack rejects it or cannot be reached,
+    it is enqueued as a send_slack_message job so the job worker retries it
+    with backoff.
 
     Args:
         user_id: User ID to generate summary for
         summary_range: Summary range ('today', 'yesterday', 'lastweek')
-        job_table: Job table for scheduling follow-up job
+        job_table: Job table for scheduling a follow-up job when the send fails
         log_store: Log store for retrieving user data
         llm: LLM client for generating summaries
 
@@ -68,24 +98,31 @@ def generate_summary_job(
     # Generate summary using helper
     summary = get_summary(user_id, summary_range, log_store, llm)
 
-    # Generate UUID for tracing
-    job_uuid = str(uuid.uuid1())
-
-    # Create follow-up job to send message to Slack
+    # A queued retry's own ID doubles as its tracing UUID
+    job_id = uuid.uuid4()
+    payload = {
+        'slack_user_id': user_id,
+        'message': summary,
+        'job_uuid': str(job_id),
+    }
+
+    # Most sends succeed at once, which saves a round trip through the job table
+    try:
+        send_slack_message_job(payload)
+    except (SlackApiError, OSError):
+        logger.warning('Sending summary to user %s failed, queueing it for retry', user_id, exc_info=True)
+    else:
+        return
+
+    now = datetime.now(UTC)
     send_job = ScheduledJob(
-        job_id=uuid.uuid4(),
+        job_id=job_id,
         job_type='send_slack_message',
-        payload={
-            'slack_user_id': user_id,
-            'message': summary,
-            'job_uuid': job_uuid,
-        },
-        scheduled_for=datetime.now(UTC),
+        payload=payload,
+        scheduled_for=now,
         status='pending',
-        created_at=datetime.now(UTC),
+        created_at=now,
     )
-
-    # Enqueue the send job
     job_table.put_job(send_job)
 
 
@@ -148,22 +185,16 @@ class GenerateSummaryHandler(BaseJobHandler):
             msg = f'Expected GenerateSummaryPayload, got {type(payload)}'
             raise TypeError(msg)
 
-        # Get required dependencies
+        # Handlers are created per job, so the job table and LLM client are shared process-wide
         from companion_memory.app import get_log_store
-        from companion_memory.job_table import JobTable
-        from companion_memory.llm_client import LLMLClient
-
-        job_table = JobTable()
-        log_store = get_log_store()
-        llm = LLMLClient()
 
         # Call the existing business logic
         generate_summary_job(
             user_id=payload.user_id,
             summary_range=payload.summary_range,
-            job_table=job_table,
-            log_store=log_store,
-            llm=llm,
+            job_table=_get_job_table(),
+            log_store=get_log_store(),
+            llm=_get_llm_client(),
         )
 
 
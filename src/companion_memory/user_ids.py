@@ -0,0 +1,19 @@
+"""Parsing of configured Slack user ID lists."""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def parse_user_ids(users_env: str) -> tuple[str, ...]:
+    """Parse a comma-separated user ID list, such as DAILY_SUMMARY_USERS.
+
+    The setting rarely changes, so the last parse is cached by its raw value.
+
+    Args:
+        users_env: Comma-separated user IDs
+
+    Returns:
+        Non-empty, whitespace-stripped user IDs in their configured order
+
+    """
+    return tuple(user_id.strip() for user_id in users_env.split(',') if user_id.strip())
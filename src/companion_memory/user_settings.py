@@ -1,9 +1,48 @@
 """User settings storage interfaces and DynamoDB implementation."""
 
+import functools
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Protocol
 
 import boto3
 
+# Most keys DynamoDB accepts in a single BatchGetItem request
+BATCH_GET_MAX_KEYS = 100
+
+# Segments iter_all_users scans concurrently
+DEFAULT_SCAN_SEGMENTS = 4
+
+
+@functools.lru_cache(maxsize=8)
+def _get_settings_resource(region: str) -> Any:  # noqa: ANN401
+    """Get a DynamoDB service resource for user settings, shared per region.
+
+    Args:
+        region: AWS region name
+
+    Returns:
+        DynamoDB service resource
+
+    """
+    return boto3.resource('dynamodb', region_name=region)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_settings_table(table_name: str, region: str) -> Any:  # noqa: ANN401
+    """Get a DynamoDB Table resource for user settings, shared per table and region.
+
+    Args:
+        table_name: Name of the DynamoDB table
+        region: AWS region name
+
+    Returns:
+        DynamoDB Table resource
+
+    """
+    return _get_settings_resource(region).Table(table_name)
+
 
 class UserSettingsStore(Protocol):
     """Protocol for user settings storage implementations."""
@@ -40,13 +79,12 @@ class DynamoUserSettingsStore:
             table_name: Name of the DynamoDB table to use
 
         """
-        import os
-
         self._table_name = table_name
         # Use specified region or default to us-east-1 for testing
         region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
-        self._dynamodb = boto3.resource('dynamodb', region_name=region)
-        self._table = self._dynamodb.Table(table_name)
+        # Stores are created per sync and per scheduler run, so the boto3 resources are shared between them
+        self._dynamodb = _get_settings_resource(region)
+        self._table = _get_settings_table(table_name, region)
 
     def _generate_partition_key(self, user_id: str) -> str:
         """Generate partition key for DynamoDB."""
@@ -67,10 +105,91 @@ class DynamoUserSettingsStore:
         # Remove PK and SK from returned settings
         return {k: v for k, v in item.items() if k not in ('PK', 'SK')}
 
+    def iter_all_users(self, total_segments: int = DEFAULT_SCAN_SEGMENTS) -> Iterator[str]:
+        """Yield the ID of every user with stored settings.
+
+        The table is read as a parallel Scan, one thread per segment. Scan
+        responses stop at 1MB, so every page of each segment is read; only the
+        partition key is projected to keep each page small.
+
+        Args:
+            total_segments: Number of segments to scan concurrently
+
+        Yields:
+            User identifiers, grouped by segment
+
+        """
+        if total_segments <= 1:
+            yield from self._scan_user_segment(None)
+            return
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            segments = list(
+                executor.map(lambda segment: self._scan_user_segment((segment, total_segments)), range(total_segments))
+            )
+        for user_ids in segments:
+            yield from user_ids
+
+    def _scan_user_segment(self, segment: tuple[int, int] | None) -> list[str]:
+        """Scan every page of one segment of the table for users with stored settings.
+
+        Args:
+            segment: (segment, total_segments) for a parallel Scan, or None to scan the whole table
+
+        Returns:
+            User identifiers found in the segment
+
+        """
+        scan_kwargs: dict[str, Any] = {
+            'TableName': self._table_name,
+            'ProjectionExpression': 'PK',
+            'FilterExpression': 'begins_with(PK, :prefix) AND SK = :sk',
+            'ExpressionAttributeValues': {':prefix': 'user#', ':sk': self._generate_sort_key()},
+        }
+        if segment is not None:
+            scan_kwargs['Segment'], scan_kwargs['TotalSegments'] = segment
+        # The resource's client converts attribute values to and from plain Python types
+        paginator = self._dynamodb.meta.client.get_paginator('scan')
+        return [
+            item['PK'].removeprefix('user#') for page in paginator.paginate(**scan_kwargs) for item in page['Items']
+        ]
+
+    def batch_get_user_settings(self, user_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Get user settings for several users with as few BatchGetItem requests as possible.
+
+        Args:
+            user_ids: The user identifiers
+
+        Returns:
+            Dictionary mapping user IDs to their settings; users without settings are omitted
+
+        """
+        sk = self._generate_sort_key()
+        # BatchGetItem rejects duplicate keys, so each user is requested once
+        keys = [{'PK': self._generate_partition_key(user_id), 'SK': sk} for user_id in dict.fromkeys(user_ids)]
+        settings: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+            request_items: dict[str, Any] = {self._table_name: {'Keys': keys[start : start + BATCH_GET_MAX_KEYS]}}
+            # Keys DynamoDB could not read this time come back unprocessed and are requested again
+            while request_items:
+                response = self._dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get('Responses', {}).get(self._table_name, []):
+                    user_id = item['PK'].removeprefix('user#')
+                    settings[user_id] = {k: v for k, v in item.items() if k not in ('PK', 'SK')}
+                request_items = response.get('UnprocessedKeys') or {}
+        return settings
+
     def update_user_settings(self, user_id: str, settings: dict[str, Any]) -> None:
-        """Update user settings for a user."""
+        """Update user settings for a user, leaving settings not given here unchanged."""
+        if not settings:
+            return
         pk = self._generate_partition_key(user_id)
         sk = self._generate_sort_key()
-        item = {'PK': pk, 'SK': sk}
-        item.update(settings)
-        self._table.put_item(Item=item)
+        # Placeholders keep arbitrary setting names clear of DynamoDB reserved words
+        names = {f'#k{index}': name for index, name in enumerate(settings)}
+        values = {f':v{index}': value for index, value in enumerate(settings.values())}
+        self._table.update_item(
+            Key={'PK': pk, 'SK': sk},
+            UpdateExpression='SET ' + ', '.join(f'#k{index} = :v{index}' for index in range(len(settings))),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+        )
@@ -2,15 +2,55 @@
 
 import logging
 import os
+import threading
+from concurrent.futures import Future
 
 from companion_memory.user_settings import DynamoUserSettingsStore
 
 logger = logging.getLogger(__name__)
 
+# user_id -> result of the sync currently running for that user
+_inflight_syncs: dict[str, Future[str | None]] = {}
+_inflight_syncs_lock = threading.Lock()
+
 
 def sync_user_timezone_from_slack(user_id: str) -> str | None:
     """Sync a specific user's timezone from Slack to DynamoDB user settings.
 
+    Concurrent syncs for the same user share a single Slack users_info call:
+    callers arriving while one is running wait for and return its result.
+
+    Args:
+        user_id: The Slack user ID to sync timezone for
+
+    Returns:
+        The timezone string if successfully synced, None otherwise
+
+    """
+    with _inflight_syncs_lock:
+        inflight = _inflight_syncs.get(user_id)
+        if inflight is None:
+            result: Future[str | None] = Future()
+            _inflight_syncs[user_id] = result
+    if inflight is not None:
+        return inflight.result()
+
+    try:
+        timezone = _fetch_and_store_user_timezone(user_id)
+    except BaseException as exc:
+        result.set_exception(exc)
+        raise
+    else:
+        result.set_result(timezone)
+        return timezone
+    finally:
+        with _inflight_syncs_lock:
+            del _inflight_syncs[user_id]
+
+
+def _fetch_and_store_user_timezone(user_id: str) -> str | None:
+    """Fetch a user's timezone from their Slack profile and store it in their settings.
+
     Args:
         user_id: The Slack user ID to sync timezone for
 
@@ -20,6 +60,7 @@ def sync_user_timezone_from_slack(user_id: str) -> str | None:
     """
     # Import here to avoid circular import
     from companion_memory.scheduler import get_slack_client
+    from companion_memory.summarizer import invalidate_user_timezone
 
     try:
         slack_client = get_slack_client()
@@ -35,7 +76,13 @@ def sync_user_timezone_from_slack(user_id: str) -> str | None:
             return None
 
         settings_store = DynamoUserSettingsStore()
+        # A read costs less than a write, and most syncs find the timezone unchanged
+        if settings_store.get_user_settings(user_id).get('timezone') == timezone:
+            logger.debug('User %s timezone is already %s', user_id, timezone)
+            return str(timezone)
+
         settings_store.update_user_settings(user_id, {'timezone': timezone})
+        invalidate_user_timezone(user_id)
         logger.info('Synced user %s timezone to %s from Slack to DynamoDB', user_id, timezone)
 
     except Exception:
@@ -11,13 +11,13 @@ from companion_memory.job_models import WorkSamplingPayload
 WORK_SAMPLING_PROMPTS_PER_DAY = 5
 
 # Prompt variations for work sampling
-PROMPT_VARIATIONS = [
+PROMPT_VARIATIONS = (
     'What are you working on right now? `/log` to take note.',
     "Got a minute? Log what you're doing with `/log`.",
     "Quick check-in: what's your focus at the moment? `/log` to take note.",
     'Still on track? Drop a note with `/log` to take note.',
     'Pause and reflect: what are you doing right now? `/log` to take note.',
-]
+)
 
 
 @register_handler('work_sampling_prompt')
@@ -42,12 +42,13 @@ class WorkSamplingHandler(BaseJobHandler):
             raise TypeError(msg)
 
         # Load Slack client
-        from companion_memory.scheduler import get_slack_client
+        from companion_memory.scheduler import get_slack_client, get_user_message_lock
 
         slack_client = get_slack_client()
 
         # Select a random prompt variation
         prompt = random.choice(PROMPT_VARIATIONS)  # noqa: S311
 
-        # Send direct message to user
-        slack_client.chat_postMessage(channel=payload.user_id, text=prompt)
+        # Send direct message to user, in order with other messages to them
+        with get_user_message_lock(payload.user_id):
+            slack_client.chat_postMessage(channel=payload.user_id, text=prompt)
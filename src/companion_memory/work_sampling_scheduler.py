@@ -3,11 +3,11 @@
 Schedules random work sampling prompts throughout the workday for each user.
 """
 
-import hashlib
-import random
-from datetime import UTC, datetime, timedelta
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, time, timedelta
 from typing import TYPE_CHECKING
-from uuid import uuid4
+from uuid import UUID, uuid5
 from zoneinfo import ZoneInfo
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -19,6 +19,16 @@ from companion_memory.job_table import JobTable
 from companion_memory.user_settings import DynamoUserSettingsStore
 from companion_memory.work_sampling_handler import WORK_SAMPLING_PROMPTS_PER_DAY
 
+# Workday bounds in the user's local time
+WORKDAY_START = time(8)
+WORKDAY_END = time(17)
+
+# Most users whose slots are planned concurrently
+SCHEDULING_MAX_WORKERS = 16
+
+# Namespace for job IDs derived from a slot's logical job ID
+WORK_SAMPLING_JOB_NAMESPACE = UUID('62de001f-6ff4-4296-b23e-37c6346983de')
+
 
 def schedule_work_sampling_jobs(
     now_utc: datetime | None = None,
@@ -46,44 +56,49 @@ def schedule_work_sampling_jobs(
     if deduplication_index is None:
         deduplication_index = DeduplicationIndex()
 
-    # Get all users (this method doesn't exist yet - we'll need to add it)
-    # For now, we'll create a mock implementation
     all_users = _get_all_users(user_settings_store)
 
-    for user_id in all_users:
-        _schedule_user_work_sampling_jobs(
-            user_id=user_id,
-            now_utc=now_utc,
-            user_settings_store=user_settings_store,
-            job_table=job_table,
-            deduplication_index=deduplication_index,
+    if not all_users:
+        return
+
+    # Users are independent, so their settings reads and slot planning run
+    # concurrently. Reservations and job writes stay on this thread, where the
+    # caller's batch writer and reservation tracking are active.
+    with ThreadPoolExecutor(max_workers=min(len(all_users), SCHEDULING_MAX_WORKERS)) as executor:
+        plans = list(
+            executor.map(
+                lambda user_id: _plan_user_work_sampling_jobs(user_id, now_utc, user_settings_store), all_users
+            )
         )
 
+    for jobs, reservations in plans:
+        # Store only the jobs whose slot was not already reserved
+        for job, reserved in zip(jobs, deduplication_index.try_reserve_many(reservations), strict=True):
+            if reserved:
+                job_table.put_job(job)
 
-def _get_all_users(user_settings_store: DynamoUserSettingsStore) -> list[str]:
-    """Get all user IDs from user settings store.
 
-    Note: This is a simplified implementation. In practice, we would need to
-    scan the DynamoDB table or maintain a separate index of users.
-    """
-    # For now, use the mock method if it exists (for testing)
-    if hasattr(user_settings_store, 'get_all_users'):
-        users = user_settings_store.get_all_users()
-        return users if isinstance(users, list) else []
-
-    # In a real implementation, this would scan the user settings table
-    # For now, return empty list (no users to schedule)
-    return []
+def _get_all_users(user_settings_store: DynamoUserSettingsStore) -> list[str]:
+    """Get the IDs of all users with stored settings."""
+    return list(user_settings_store.iter_all_users())
 
 
-def _schedule_user_work_sampling_jobs(
+def _plan_user_work_sampling_jobs(
     user_id: str,
     now_utc: datetime,
     user_settings_store: DynamoUserSettingsStore,
-    job_table: JobTable,
-    deduplication_index: DeduplicationIndex,
-) -> None:
-    """Schedule work sampling jobs for a single user."""
+) -> tuple[list[ScheduledJob], list[tuple[str, str, str, str]]]:
+    """Build a single user's work sampling jobs for the day, and the reservation each one needs.
+
+    Args:
+        user_id: The user to plan jobs for
+        now_utc: Current UTC time, which picks the user's local day
+        user_settings_store: Store holding the user's timezone
+
+    Returns:
+        The slot jobs, and (logical_id, date, job_pk, job_sk) reservations in the same order
+
+    """
     # Get user's timezone settings
     user_settings = user_settings_store.get_user_settings(user_id)
     timezone_name = user_settings.get('timezone', 'UTC')
@@ -98,32 +113,40 @@ def _schedule_user_work_sampling_jobs(
     local_date = now_utc.astimezone(user_tz).date()
 
     # Define workday range: 8:00-17:00 in user's local timezone
-    workday_start = datetime.combine(local_date, datetime.min.time().replace(hour=8), tzinfo=user_tz)
-    workday_end = datetime.combine(local_date, datetime.min.time().replace(hour=17), tzinfo=user_tz)
+    workday_start = datetime.combine(local_date, WORKDAY_START, tzinfo=user_tz)
+    workday_end = datetime.combine(local_date, WORKDAY_END, tzinfo=user_tz)
+    local_midnight = datetime.combine(local_date, time())
+    local_date_str = local_date.isoformat()
 
     # Calculate slot duration (9 hours / N slots)
     workday_duration = workday_end - workday_start
     slot_duration = workday_duration / WORK_SAMPLING_PROMPTS_PER_DAY
 
-    # Schedule jobs for each slot
+    # Slots are laid out in UTC so scheduled times, and the job sort keys built
+    # from them, carry a UTC offset like every other job's
+    workday_start_utc = workday_start.astimezone(UTC)
+
+    # Build a job for each slot, to be reserved all at once
+    jobs: list[ScheduledJob] = []
+    reservations: list[tuple[str, str, str, str]] = []
     for slot_index in range(WORK_SAMPLING_PROMPTS_PER_DAY):
-        slot_start = workday_start + (slot_duration * slot_index)
+        slot_start = workday_start_utc + (slot_duration * slot_index)
         slot_end = slot_start + slot_duration
 
         # Generate deterministic random time within the slot
         random_time_utc = _generate_random_time_in_slot(
             user_id=user_id,
-            local_date=datetime.combine(local_date, datetime.min.time()),
+            local_date=local_midnight,
             slot_index=slot_index,
             slot_start=slot_start,
             slot_end=slot_end,
         )
 
         # Create logical job ID for deduplication
-        logical_job_id = f'work_sampling_prompt:{user_id}:{local_date.isoformat()}:{slot_index}'
+        logical_job_id = f'work_sampling_prompt:{user_id}:{local_date_str}:{slot_index}'
 
-        # Create job
-        job_id = uuid4()
+        # Create job, with an ID that is the same every time this slot is scheduled
+        job_id = uuid5(WORK_SAMPLING_JOB_NAMESPACE, logical_job_id)
         job = ScheduledJob(
             job_id=job_id,
             job_type='work_sampling_prompt',
@@ -134,10 +157,10 @@ def _schedule_user_work_sampling_jobs(
             created_at=now_utc,
         )
 
-        # Try to reserve deduplication slot
-        job_sk = make_job_sk(random_time_utc, job_id)
-        if deduplication_index.try_reserve(logical_job_id, str(local_date), 'job', job_sk):
-            job_table.put_job(job)
+        jobs.append(job)
+        reservations.append((logical_job_id, local_date_str, 'job', make_job_sk(random_time_utc, job_id)))
+
+    return jobs, reservations
 
 
 def _generate_random_time_in_slot(
@@ -147,19 +170,14 @@ def _generate_random_time_in_slot(
     slot_start: datetime,
     slot_end: datetime,
 ) -> datetime:
-    """Generate a deterministic random time within a slot using seeded PRNG."""
-    # Create deterministic seed as specified
+    """Generate a deterministic pseudo-random time within a slot, derived from a hash of the slot."""
     seed_string = f'{user_id}-{local_date.date().isoformat()}-{slot_index}'
-    seed_bytes = hashlib.sha256(seed_string.encode()).digest()
-
-    # Use first 4 bytes as integer seed
-    seed = int.from_bytes(seed_bytes[:4], byteorder='big')
-
-    # Seed random generator
-    rng = random.Random(seed)  # noqa: S311
+    # The offset only needs to be stable, not unpredictable, so a 32-bit checksum
+    # scaled into [0, 1) stands in for a seeded PRNG's single draw
+    fraction = zlib.crc32(seed_string.encode()) / 2**32
 
     # Generate random time within the slot
     slot_duration_seconds = (slot_end - slot_start).total_seconds()
-    random_offset_seconds = rng.uniform(0, slot_duration_seconds)
+    random_offset_seconds = fraction * slot_duration_seconds
 
     return slot_start + timedelta(seconds=random_offset_seconds)
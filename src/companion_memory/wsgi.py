@@ -25,15 +25,19 @@ scheduler_logger.setLevel(logging.INFO)
 app_logger = logging.getLogger('companion_memory.app')
 app_logger.setLevel(logging.INFO)
 
-sentry_sdk.init(
-    dsn=os.getenv('SENTRY_DSN', ''),
-    # Add data like request headers and IP for users,
-    # see https://docs.sentry.io/platforms/python/data-management/data-collected/ for more info
-    send_default_pii=True,
-)
-
-# Production WSGI uses DynamoDB and LLM by default
-log_store = DynamoLogStore()
+# Without a DSN Sentry would still install its integrations only to discard every event
+if sentry_dsn := os.getenv('SENTRY_DSN'):
+    sentry_sdk.init(
+        dsn=sentry_dsn,
+        # Add data like request headers and IP for users,
+        # see https://docs.sentry.io/platforms/python/data-management/data-collected/ for more info
+        send_default_pii=True,
+    )
+
+# Production WSGI uses DynamoDB and LLM by default. Log writes stay synchronous
+# so an entry is durable before the user is told it was logged, and summary
+# reads query the history window in concurrent segments
+log_store = DynamoLogStore(query_segments=4)
 llm_client = LLMLClient()
 
 # Get a logger for this module
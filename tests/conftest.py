@@ -0,0 +1,43 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from companion_memory import summarizer
+from companion_memory.llm_client import _llm_circuit_breaker
+from companion_memory.scheduler import _get_cached_slack_client, _get_lock_client
+from companion_memory.storage import _get_log_client, _get_log_table
+from companion_memory.summarizer import _summary_response_cache, _user_timezone_cache
+from companion_memory.summary_jobs import _get_job_table, _get_llm_client
+from companion_memory.user_settings import _get_settings_resource, _get_settings_table
+
+
+@pytest.fixture(autouse=True)
+def clear_aws_resource_caches() -> Iterator[None]:
+    """Clear cached AWS resources and shared client state so each test sees its own mocks."""
+    _get_lock_client.cache_clear()
+    _get_log_table.cache_clear()
+    _get_log_client.cache_clear()
+    _get_cached_slack_client.cache_clear()
+    _get_settings_resource.cache_clear()
+    _get_settings_table.cache_clear()
+    _get_job_table.cache_clear()
+    _get_llm_client.cache_clear()
+    _user_timezone_cache.clear()
+    _summary_response_cache.clear()
+    summarizer._settings_store = None  # noqa: SLF001
+    _llm_circuit_breaker.record_success()
+    yield
+    _get_lock_client.cache_clear()
+    _get_log_table.cache_clear()
+    _get_log_client.cache_clear()
+    _get_cached_slack_client.cache_clear()
+    _get_settings_resource.cache_clear()
+    _get_settings_table.cache_clear()
+    _get_job_table.cache_clear()
+    _get_llm_client.cache_clear()
+    _user_timezone_cache.clear()
+    _summary_response_cache.clear()
+    summarizer._settings_store = None  # noqa: SLF001
+    _llm_circuit_breaker.record_success()
@@ -231,11 +231,11 @@ def test_scheduler_registers_daily_summary_job() -> None:
             # It should be one of the calls to add_job
             job_calls = mock_scheduler.add_job.call_args_list
 
-            # Look for a call that includes schedule_daily_summaries function
+            # Look for the hourly scheduling pass, which includes daily summaries
             daily_summary_job_found = False
             for call in job_calls:
                 args, kwargs = call
-                if len(args) > 0 and hasattr(args[0], '__name__') and 'schedule_daily_summaries' in args[0].__name__:
+                if len(args) > 0 and hasattr(args[0], '__name__') and 'schedule_hourly_jobs' in args[0].__name__:
                     daily_summary_job_found = True
                     # Check it has the right interval schedule (hourly)
                     assert 'interval' in args or kwargs.get('trigger') == 'interval'
@@ -253,7 +253,7 @@ def test_daily_summary_handler() -> None:
 
     # Mock the timezone function and logging
     with (
-        patch('companion_memory.summarizer._get_user_timezone') as mock_get_tz,
+        patch('companion_memory.daily_summary_scheduler.get_user_timezone') as mock_get_tz,
         patch('logging.getLogger') as mock_get_logger,
     ):
         from zoneinfo import ZoneInfo
@@ -310,7 +310,7 @@ def test_end_to_end_daily_summary_workflow(
 
     # Mock timezone function and logging for handler test
     with (
-        patch('companion_memory.summarizer._get_user_timezone') as mock_get_tz,
+        patch('companion_memory.daily_summary_scheduler.get_user_timezone') as mock_get_tz,
         patch('logging.getLogger') as mock_get_logger,
         patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'user1,user2'}),
     ):
@@ -504,9 +504,9 @@ def test_daily_summary_handler_exception_handling() -> None:
 
     from companion_memory.daily_summary_scheduler import DailySummaryHandler, DailySummaryPayload
 
-    # Mock the _get_user_timezone function to raise an exception
+    # Mock the get_user_timezone function to raise an exception
     with (
-        patch('companion_memory.summarizer._get_user_timezone', side_effect=Exception('Test error')),
+        patch('companion_memory.daily_summary_scheduler.get_user_timezone', side_effect=Exception('Test error')),
         patch('logging.getLogger') as mock_get_logger,
     ):
         mock_logger = MagicMock()
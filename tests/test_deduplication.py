@@ -149,3 +149,113 @@ def test_deduplication_reraises_non_conditional_errors() -> None:
     finally:
         # Restore original method
         deduplication._table.put_item = original_put_item  # noqa: SLF001
+
+
+@mock_aws
+def test_track_reservations_records_successful_reservations_and_release_frees_them() -> None:
+    """Test that only successful reservations are tracked and release allows rescheduling."""
+    dedup_index = DeduplicationIndex()
+    dedup_index.create_table_for_testing()
+    job_sk = make_job_sk(datetime(2025, 7, 11, 12, 0, tzinfo=UTC), uuid4())
+    dedup_index.try_reserve('summary#U123456', '2025-07-11', 'job', job_sk)
+
+    with dedup_index.track_reservations() as reservations:
+        assert dedup_index.try_reserve('summary#U123456', '2025-07-11', 'job', job_sk) is False
+        assert dedup_index.try_reserve('summary#U789012', '2025-07-11', 'job', job_sk) is True
+
+    assert reservations == [('summary#U789012', '2025-07-11', job_sk)]
+
+    # Reservations made outside the block are not tracked
+    dedup_index.try_reserve('summary#U345678', '2025-07-11', 'job', job_sk)
+    assert len(reservations) == 1
+
+    dedup_index.release('summary#U789012', '2025-07-11')
+    assert dedup_index.try_reserve('summary#U789012', '2025-07-11', 'job', job_sk) is True
+
+
+@mock_aws
+def test_try_reserve_many_reserves_only_unreserved_slots() -> None:
+    """Test that batched reservations skip slots already reserved and track the rest."""
+    from unittest.mock import patch
+
+    dedup_index = DeduplicationIndex()
+    dedup_index.create_table_for_testing()
+    job_sk = make_job_sk(datetime(2025, 7, 11, 12, 0, tzinfo=UTC), uuid4())
+    dedup_index.try_reserve('slot#1', '2025-07-11', 'job', job_sk)
+    requested = [(f'slot#{index}', '2025-07-11', 'job', job_sk) for index in range(5)]
+
+    # Split into several transactions to cover chunking
+    with (
+        patch('companion_memory.deduplication.TRANSACT_WRITE_MAX_ITEMS', 3),
+        dedup_index.track_reservations() as tracked,
+    ):
+        assert dedup_index.try_reserve_many(requested) == [True, False, True, True, True]
+
+    assert tracked == [(f'slot#{index}', '2025-07-11', job_sk) for index in (0, 2, 3, 4)]
+    # Everything is reserved now, so a second pass reserves nothing
+    assert dedup_index.try_reserve_many(requested) == [False] * 5
+    assert dedup_index.try_reserve_many([]) == []
+
+
+@mock_aws
+@pytest.mark.parametrize(
+    'error_response',
+    [
+        {'Error': {'Code': 'ValidationException', 'Message': 'Some other error'}},
+        {
+            'Error': {'Code': 'TransactionCanceledException', 'Message': 'Cancelled'},
+            'CancellationReasons': [{'Code': 'TransactionConflict'}],
+        },
+    ],
+)
+def test_try_reserve_many_reraises_other_errors(error_response: dict[str, object]) -> None:
+    """Test that transaction failures other than existing reservations are re-raised."""
+    from unittest.mock import patch
+
+    from botocore.exceptions import ClientError
+
+    dedup_index = DeduplicationIndex()
+    client = dedup_index._dynamodb.meta.client  # noqa: SLF001
+
+    with (
+        patch.object(client, 'transact_write_items', side_effect=ClientError(error_response, 'TransactWriteItems')),
+        pytest.raises(ClientError),
+    ):
+        dedup_index.try_reserve_many([('slot#0', '2025-07-11', 'job', 'scheduled#2025-07-11T09:00:00')])
+
+
+def _lock_fence(epoch: int) -> dict[str, object]:
+    return {
+        'TableName': 'CompanionMemory',
+        'Key': {'PK': 'system#scheduler', 'SK': 'lock#main'},
+        'ConditionExpression': 'process_id = :process_id AND epoch = :epoch',
+        'ExpressionAttributeValues': {':process_id': 'holder', ':epoch': epoch},
+    }
+
+
+@mock_aws
+def test_fenced_reservations_require_the_lock_to_still_be_held() -> None:
+    """Test that fenced reservations succeed under the current lock holding and fail after it is lost."""
+    from companion_memory.exceptions import SchedulerLockLostError
+
+    dedup_index = DeduplicationIndex()
+    dedup_index.create_table_for_testing()
+    dedup_index._table.put_item(  # noqa: SLF001
+        Item={'PK': 'system#scheduler', 'SK': 'lock#main', 'process_id': 'holder', 'epoch': 2}
+    )
+    job_sk = make_job_sk(datetime(2025, 7, 11, 12, 0, tzinfo=UTC), uuid4())
+
+    with dedup_index.fenced_by(_lock_fence(2)):
+        assert dedup_index.try_reserve('summary#U1', '2025-07-11', 'job', job_sk) is True
+        assert dedup_index.try_reserve('summary#U1', '2025-07-11', 'job', job_sk) is False
+        assert dedup_index.try_reserve_many([
+            ('summary#U1', '2025-07-11', 'job', job_sk),
+            ('summary#U2', '2025-07-11', 'job', job_sk),
+        ]) == [False, True]
+
+    # A holding from an earlier epoch has been superseded
+    with dedup_index.fenced_by(_lock_fence(1)), pytest.raises(SchedulerLockLostError):
+        dedup_index.try_reserve('summary#U3', '2025-07-11', 'job', job_sk)
+
+    # Nothing was reserved by the stale holder
+    assert dedup_index.try_reserve('summary#U3', '2025-07-11', 'job', job_sk) is True
@@ -1,5 +1,6 @@
 """Tests for Flask web application."""
 
+import time
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
@@ -54,7 +55,7 @@ def test_log_endpoint_with_valid_signature_returns_200(client: 'FlaskClient') ->
 
     # Create test request data
     request_body = 'text=test+message&user_id=U123456789&timestamp=1234567890'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -87,7 +88,7 @@ def test_log_endpoint_stores_entry_with_valid_signature() -> None:
 
     # Create test request data
     request_body = 'text=Debugged+deploy+script&user_id=U123456789&timestamp=1234567890'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -137,7 +138,7 @@ def test_log_endpoint_handles_sampling_responses() -> None:
 
     # Create test request data for a sampling response
     request_body = 'text=Working+on+debugging+the+API&user_id=U123456789&timestamp=1234567890'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -197,7 +198,7 @@ def test_events_endpoint_with_valid_signature_returns_200(client: 'FlaskClient')
 
     # Create test request data
     request_body = json.dumps({'event': 'test_event', 'type': 'message'})
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -231,7 +232,7 @@ def test_events_endpoint_handles_url_verification(client: 'FlaskClient') -> None
     # Create test request data for URL verification
     challenge_value = 'test_challenge_123'
     request_body = json.dumps({'type': 'url_verification', 'challenge': challenge_value})
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -285,7 +286,7 @@ def test_lastweek_endpoint_with_valid_signature_returns_summary() -> None:
 
     # Create test request data
     request_body = 'user_id=U123456789&command=/lastweek'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -336,7 +337,7 @@ def test_yesterday_endpoint_with_valid_signature_returns_summary() -> None:
 
     # Create test request data
     request_body = 'user_id=U123456789&command=/yesterday'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -381,7 +382,7 @@ def test_yesterday_endpoint_with_timezone_discovery() -> None:
 
     # Create test request data
     request_body = 'user_id=U123456789&command=/yesterday'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -432,7 +433,7 @@ def test_today_endpoint_with_valid_signature_returns_summary() -> None:
 
     # Create test request data
     request_body = 'user_id=U123456789&command=/today'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -477,7 +478,7 @@ def test_today_endpoint_with_timezone_discovery() -> None:
 
     # Create test request data
     request_body = 'user_id=U123456789&timestamp=1234567890'
-    request_timestamp = '1234567890'
+    request_timestamp = str(int(time.time()))
 
     # Create valid signature
     sig_basestring = f'v0:{request_timestamp}:{request_body}'
@@ -52,6 +52,54 @@ def test_make_job_sk() -> None:
     assert sk == expected
 
 
+def test_job_id_str_is_cached_string_form() -> None:
+    """Test that job_id_str returns the canonical string form and is not serialized."""
+    job_id = UUID('12345678-1234-5678-9abc-123456789abc')
+    scheduled_for = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+
+    job = ScheduledJob(
+        job_id=job_id,
+        job_type='daily_summary',
+        payload={},
+        scheduled_for=scheduled_for,
+        status='pending',
+        created_at=scheduled_for,
+    )
+
+    assert job.job_id_str == '12345678-1234-5678-9abc-123456789abc'
+    assert job.job_id_str is job.job_id_str
+    assert 'job_id_str' not in job.model_dump()
+
+
+def test_job_id_str_follows_job_id_changes() -> None:
+    """Test that job_id_str does not go stale after model_copy or reassignment."""
+    scheduled_for = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+    job = ScheduledJob(
+        job_id=UUID('12345678-1234-5678-9abc-123456789abc'),
+        job_type='daily_summary',
+        payload={},
+        scheduled_for=scheduled_for,
+        status='pending',
+        created_at=scheduled_for,
+    )
+    assert job.job_id_str == '12345678-1234-5678-9abc-123456789abc'
+
+    copied = job.model_copy(update={'job_id': UUID('87654321-4321-8765-cba9-876543210cba')})
+    assert copied.job_id_str == '87654321-4321-8765-cba9-876543210cba'
+    assert job.job_id_str == '12345678-1234-5678-9abc-123456789abc'
+
+    job.job_id = UUID('11111111-2222-3333-4444-555555555555')
+    assert job.job_id_str == '11111111-2222-3333-4444-555555555555'
+
+
+def test_make_job_sk_accepts_string_job_id() -> None:
+    """Test that make_job_sk produces the same key for a UUID and its string form."""
+    job_id = UUID('12345678-1234-5678-9abc-123456789abc')
+    scheduled_for = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+
+    assert make_job_sk(scheduled_for, str(job_id)) == make_job_sk(scheduled_for, job_id)
+
+
 def test_parse_job_sk() -> None:
     """Test that parse_job_sk correctly extracts timestamp and UUID."""
     sk = 'scheduled#2025-07-11T12:00:00+00:00#12345678-1234-5678-9abc-123456789abc'
@@ -6,7 +6,7 @@ from uuid import uuid4
 import pytest
 from moto import mock_aws
 
-from companion_memory.job_models import ScheduledJob
+from companion_memory.job_models import ScheduledJob, make_job_sk
 from companion_memory.job_table import JobTable
 
 pytestmark = pytest.mark.block_network
@@ -298,3 +298,160 @@ def test_cleanup_old_jobs_with_custom_days() -> None:
     # Should delete with 3-day retention
     deleted_count = job_table.cleanup_old_jobs(older_than_days=3)
     assert deleted_count == 1
+
+
+@mock_aws
+def test_get_next_scheduled_time_returns_soonest_future_job() -> None:
+    """Test that the soonest job scheduled after now is found."""
+    job_table = JobTable()
+    job_table.create_table_for_testing()
+
+    now = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+    for offset in (timedelta(minutes=-5), timedelta(minutes=30), timedelta(minutes=10)):
+        job_table.put_job(
+            ScheduledJob(
+                job_id=uuid4(),
+                job_type='daily_summary',
+                payload={},
+                scheduled_for=now + offset,
+                status='pending',
+                created_at=now,
+            )
+        )
+
+    assert job_table.get_next_scheduled_time(now) == now + timedelta(minutes=10)
+
+
+@mock_aws
+def test_get_next_scheduled_time_returns_none_without_future_jobs() -> None:
+    """Test that None is returned when no jobs are scheduled after now."""
+    job_table = JobTable()
+    job_table.create_table_for_testing()
+
+    now = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+    job_table.put_job(
+        ScheduledJob(
+            job_id=uuid4(),
+            job_type='daily_summary',
+            payload={},
+            scheduled_for=now,
+            status='pending',
+            created_at=now,
+        )
+    )
+
+    assert job_table.get_next_scheduled_time(now) is None
+
+
+@mock_aws
+def test_batch_writes_flushes_buffered_jobs() -> None:
+    """Test that jobs put inside batch_writes are written when the block exits."""
+    job_table = JobTable()
+    job_table.create_table_for_testing()
+    now = datetime.now(UTC)
+
+    jobs = [
+        ScheduledJob(
+            job_id=uuid4(),
+            job_type='daily_summary',
+            payload={'user_id': f'U{index}'},
+            scheduled_for=now,
+            status='pending',
+            attempts=0,
+            created_at=now,
+        )
+        for index in range(30)
+    ]
+
+    with job_table.batch_writes():
+        for job in jobs:
+            job_table.put_job(job)
+
+    due_jobs = job_table.get_due_jobs(now + timedelta(minutes=1), limit=50)
+    assert {job.job_id for job in due_jobs} == {job.job_id for job in jobs}
+
+    # Writes after the block go straight to the table again
+    job_table.put_job(
+        ScheduledJob(
+            job_id=uuid4(),
+            job_type='daily_summary',
+            payload={'user_id': 'U30'},
+            scheduled_for=now,
+            status='pending',
+            attempts=0,
+            created_at=now,
+        )
+    )
+    assert len(job_table.get_due_jobs(now + timedelta(minutes=1), limit=50)) == 31
+
+
+@mock_aws
+def test_batch_writes_reports_written_jobs_and_resubmits_unprocessed_items() -> None:
+    """Test that batch_writes yields the written sort keys, retrying items DynamoDB left unprocessed."""
+    from unittest.mock import patch
+
+    job_table = JobTable()
+    job_table.create_table_for_testing()
+    now = datetime.now(UTC)
+    jobs = [
+        ScheduledJob(
+            job_id=uuid4(), job_type='test_job', payload={}, scheduled_for=now, status='pending', created_at=now
+        )
+        for _ in range(3)
+    ]
+    batch_write_item = job_table._dynamodb.batch_write_item  # noqa: SLF001
+    calls = []
+
+    def leave_first_unprocessed(**kwargs: object) -> dict[str, object]:
+        requests = kwargs['RequestItems']['CompanionMemory']  # type: ignore[index]
+        calls.append(len(requests))
+        if len(calls) == 1:
+            batch_write_item(RequestItems={'CompanionMemory': requests[1:]})
+            return {'UnprocessedItems': {'CompanionMemory': requests[:1]}}
+        return batch_write_item(**kwargs)  # type: ignore[no-any-return]
+
+    with (
+        patch.object(job_table._dynamodb, 'batch_write_item', side_effect=leave_first_unprocessed),  # noqa: SLF001
+        job_table.batch_writes() as written,
+    ):
+        for job in jobs:
+            job_table.put_job(job)
+
+    assert calls == [3, 1]
+    assert written == {make_job_sk(job.scheduled_for, job.job_id) for job in jobs}
+    assert len(job_table.get_due_jobs(now + timedelta(minutes=1), limit=50)) == 3
+
+
+@mock_aws
+def test_batch_writes_failed_flush_leaves_jobs_out_of_written() -> None:
+    """Test that jobs a failed flush dropped are not reported as written."""
+    from unittest.mock import patch
+
+    job_table = JobTable()
+    now = datetime.now(UTC)
+    job = ScheduledJob(
+        job_id=uuid4(), job_type='test_job', payload={}, scheduled_for=now, status='pending', created_at=now
+    )
+
+    with (
+        patch.object(job_table._dynamodb, 'batch_write_item', side_effect=RuntimeError('flush failed')),  # noqa: SLF001
+        pytest.raises(RuntimeError),
+        job_table.batch_writes() as written,
+    ):
+        job_table.put_job(job)
+
+    assert written == set()
+
+
+@mock_aws
+def test_new_jobs_signal_counts_signals() -> None:
+    """Test that each signal_new_jobs call changes the value get_new_jobs_signal reads."""
+    job_table = JobTable()
+    job_table.create_table_for_testing()
+
+    assert job_table.get_new_jobs_signal() == 0
+    job_table.signal_new_jobs()
+    job_table.signal_new_jobs()
+    assert job_table.get_new_jobs_signal() == 2
+    # The signal item is not a job
+    assert job_table.get_due_jobs(datetime.now(UTC) + timedelta(days=1)) == []
@@ -1,6 +1,7 @@
 """Tests for job worker poll loop."""
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
@@ -10,7 +11,7 @@ from pydantic import BaseModel
 from companion_memory.job_dispatcher import BaseJobHandler
 from companion_memory.job_models import ScheduledJob
 from companion_memory.job_table import JobTable
-from companion_memory.job_worker import JobWorker
+from companion_memory.job_worker import JobWorker, _format_error
 
 pytestmark = pytest.mark.block_network
 
@@ -227,6 +228,7 @@ def test_worker_handles_processing_failure() -> None:
     assert updated_job.attempts == 1
     assert updated_job.last_error is not None
     assert 'Job processing failed!' in updated_job.last_error
+    assert 'Traceback' not in updated_job.last_error
 
 
 @mock_aws
@@ -364,6 +366,9 @@ def test_worker_job_exceeds_max_attempts_goes_to_dead_letter() -> None:
     updated_job = job_table.get_job_by_id(job.job_id, job.scheduled_for)
     assert updated_job is not None
     assert updated_job.status == 'dead_letter'
+    assert updated_job.last_error is not None
+    assert 'ValueError: Always fails' in updated_job.last_error
+    assert 'Traceback' in updated_job.last_error
 
 
 @mock_aws
@@ -401,3 +406,79 @@ def test_worker_skips_locked_job_with_logging() -> None:
     assert updated_job is not None
     assert updated_job.status == 'pending'
     assert updated_job.locked_by == 'other-worker'
+
+
+def test_format_error_without_traceback_uses_exception_summary() -> None:
+    """Test that only the exception type and message are formatted on the retry path."""
+    message = _format_error(RuntimeError('boom'), include_traceback=False)
+
+    assert message == 'RuntimeError: boom'
+
+
+def test_format_error_truncates_long_messages() -> None:
+    """Test that formatted error messages are capped at the given limit."""
+    message = _format_error(RuntimeError('x' * 100), include_traceback=False, limit=20)
+
+    assert message == '…xxxxxxxxxxxxxxxxxxx'
+    assert len(message) == 20
+
+
+def test_format_error_truncation_keeps_traceback_tail() -> None:
+    """Test that truncated tracebacks keep the innermost frame and exception line."""
+
+    def fail() -> None:
+        raise RuntimeError('boom')
+
+    try:
+        fail()
+    except RuntimeError as error:
+        message = _format_error(error, include_traceback=True, limit=120)
+
+    assert message.startswith('…')
+    assert len(message) == 120
+    assert 'raise RuntimeError' in message
+    assert message.endswith('RuntimeError: boom')
+
+
+class TestGetPollDelay:
+    """Tests for adaptive poll delay calculation."""
+
+    def test_waits_until_next_scheduled_job(self) -> None:
+        """Test that the delay runs until the next job is due."""
+        now = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+        job_table = Mock()
+        job_table.get_next_scheduled_time.return_value = now + timedelta(seconds=5)
+
+        worker = JobWorker(job_table)
+
+        assert worker.get_poll_delay(30, now) == 5.0
+
+    def test_caps_delay_at_maximum(self) -> None:
+        """Test that the delay never exceeds the maximum."""
+        now = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+        job_table = Mock()
+        job_table.get_next_scheduled_time.return_value = now + timedelta(hours=1)
+
+        worker = JobWorker(job_table)
+
+        assert worker.get_poll_delay(30, now) == 30
+
+    def test_uses_maximum_when_no_jobs_scheduled(self) -> None:
+        """Test that the maximum delay is used when nothing is scheduled."""
+        job_table = Mock()
+        job_table.get_next_scheduled_time.return_value = None
+
+        worker = JobWorker(job_table)
+
+        assert worker.get_poll_delay(30) == 30
+        job_table.get_next_scheduled_time.assert_called_once()
+
+    def test_never_returns_negative_delay(self) -> None:
+        """Test that an overdue job yields a zero delay."""
+        now = datetime(2025, 7, 11, 12, 0, 0, tzinfo=UTC)
+        job_table = Mock()
+        job_table.get_next_scheduled_time.return_value = now - timedelta(seconds=5)
+
+        worker = JobWorker(job_table)
+
+        assert worker.get_poll_delay(30, now) == 0.0
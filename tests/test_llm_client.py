@@ -5,8 +5,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from companion_memory.exceptions import LLMConfigurationError, LLMGenerationError
-from companion_memory.llm_client import LLMLClient
+from companion_memory.exceptions import LLMConfigurationError, LLMGenerationError, LLMUnavailableError
+from companion_memory.llm_client import CIRCUIT_BREAKER_FAILURE_THRESHOLD, CachedResponse, CircuitBreaker, LLMLClient
 
 pytestmark = pytest.mark.block_network
 
@@ -217,3 +217,87 @@ def test_llm_client_exhausts_retries_on_persistent_overload(mock_llm_module: Mag
 
         # Verify that text() was called 3 times (max retries)
         assert mock_response.text.call_count == 3
+
+
+def test_cached_response_returns_first_successful_text() -> None:
+    """Test that CachedResponse only calls the underlying response once after success."""
+    mock_response = MagicMock()
+    mock_response.text.return_value = 'Completion'
+
+    cached = CachedResponse(mock_response)
+
+    assert cached.text() == 'Completion'
+    assert cached.text() == 'Completion'
+    mock_response.text.assert_called_once()
+
+
+def test_cached_response_reissues_after_failure() -> None:
+    """Test that CachedResponse re-issues the call when the previous attempt raised."""
+    mock_response = MagicMock()
+    mock_response.text.side_effect = [Exception('overloaded'), 'Completion']
+
+    cached = CachedResponse(mock_response)
+
+    with pytest.raises(Exception, match='overloaded'):
+        cached.text()
+    assert cached.text() == 'Completion'
+    assert cached.text() == 'Completion'
+    assert mock_response.text.call_count == 2
+
+
+def test_circuit_breaker_opens_after_consecutive_failures_and_allows_one_trial_per_cooldown() -> None:
+    """Test that the breaker fails fast once open and lets a single trial call through after the cooldown."""
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60.0)
+
+    with patch('companion_memory.llm_client.time.monotonic', return_value=1000.0) as mock_monotonic:
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert not breaker.allow_request()
+
+        mock_monotonic.return_value = 1059.0
+        assert not breaker.allow_request()
+
+        mock_monotonic.return_value = 1060.0
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        # A failed trial keeps the breaker open for another cooldown
+        breaker.record_failure()
+        mock_monotonic.return_value = 1119.0
+        assert not breaker.allow_request()
+
+        mock_monotonic.return_value = 1120.0
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.allow_request()
+        assert breaker.allow_request()
+
+
+def test_circuit_breaker_success_resets_the_failure_count() -> None:
+    """Test that only consecutive failures open the breaker."""
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.allow_request()
+
+
+def test_llm_client_fails_fast_after_repeated_generation_errors(mock_llm_module: MagicMock) -> None:
+    """Test that LLMLClient stops calling the provider once completions keep failing."""
+    mock_model = MagicMock()
+    mock_model.prompt.return_value.text.side_effect = Exception('Internal server error')
+    mock_llm_module.get_model.return_value = mock_model
+
+    with patch('companion_memory.llm_client.llm', mock_llm_module):
+        client = LLMLClient()
+        for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+            with pytest.raises(LLMGenerationError, match='Error generating completion'):
+                client.complete('Test prompt')
+
+        with pytest.raises(LLMUnavailableError):
+            client.complete('Test prompt')
+
+    assert mock_model.prompt.call_count == CIRCUIT_BREAKER_FAILURE_THRESHOLD
@@ -1,5 +1,6 @@
 """Tests for LogStore interface and implementations."""
 
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -19,6 +20,9 @@ class TestLogStore:
     def write_log(self, user_id: str, timestamp: str, text: str, log_id: str) -> None:
         """Test implementation of write_log."""
 
+    def write_logs(self, entries: Iterable[Mapping[str, str]]) -> None:
+        """Test implementation of write_logs."""
+
     def fetch_logs(self, user_id: str, since: datetime) -> list[dict[str, Any]]:
         """Test implementation of fetch_logs."""
         return []
@@ -45,9 +49,11 @@ def test_memory_log_store_write_log_stores_record() -> None:
 
     # Verify the record was stored
     assert 'user123' in store._storage  # noqa: SLF001
-    assert len(store._storage['user123']) == 1  # noqa: SLF001
+    user_logs = store._storage['user123']  # noqa: SLF001
+    assert len(user_logs.epochs) == 1
+    assert user_logs.epochs[0] == datetime(2023, 1, 1, 12, tzinfo=UTC).timestamp()
 
-    log_entry = store._storage['user123'][0]  # noqa: SLF001
+    [log_entry] = store.fetch_logs('user123', datetime(2023, 1, 1, tzinfo=UTC))
     assert log_entry['user_id'] == 'user123'
     assert log_entry['timestamp'] == '2023-01-01T12:00:00Z'
     assert log_entry['text'] == 'Test log entry'
@@ -96,3 +102,43 @@ def test_memory_log_store_fetch_logs_returns_empty_for_nonexistent_user() -> Non
     logs = store.fetch_logs(user_id='nonexistent', since=since)
 
     assert logs == []
+
+
+def test_memory_log_store_write_logs_stores_records() -> None:
+    """Test that MemoryLogStore write_logs() stores every record."""
+    store = MemoryLogStore()
+    store.write_logs([
+        {'user_id': 'user123', 'timestamp': '2023-01-01T12:00:00Z', 'text': 'First entry', 'log_id': 'log1'},
+        {'user_id': 'user456', 'timestamp': '2023-01-01T13:00:00Z', 'text': 'Second entry', 'log_id': 'log2'},
+    ])
+
+    logs = store.fetch_logs('user123', datetime(2023, 1, 1, tzinfo=UTC))
+    assert [log['text'] for log in logs] == ['First entry']
+    assert len(store.fetch_logs('user456', datetime(2023, 1, 1, tzinfo=UTC))) == 1
+
+
+def test_memory_log_store_fetch_logs_compares_across_utc_offsets() -> None:
+    """Test that MemoryLogStore fetch_logs() compares instants, not timestamp strings."""
+    store = MemoryLogStore()
+    # 09:30 at UTC-5 is 14:30 UTC; 16:00 at UTC+2 is 14:00 UTC
+    store.write_log(user_id='user123', timestamp='2023-01-01T09:30:00-05:00', text='After', log_id='log1')
+    store.write_log(user_id='user123', timestamp='2023-01-01T16:00:00+02:00', text='Before', log_id='log2')
+
+    logs = store.fetch_logs('user123', datetime(2023, 1, 1, 14, 15, tzinfo=UTC))
+
+    assert [log['text'] for log in logs] == ['After']
+
+
+def test_memory_log_store_fetch_logs_returns_logs_in_time_order() -> None:
+    """Test that MemoryLogStore returns logs oldest first even when written out of order."""
+    store = MemoryLogStore()
+    store.write_log(user_id='user123', timestamp='2023-01-01T12:00:00Z', text='Noon', log_id='log1')
+    store.write_log(user_id='user123', timestamp='2023-01-01T09:00:00Z', text='Morning', log_id='log2')
+    store.write_log(user_id='user123', timestamp='2023-01-01T18:00:00Z', text='Evening', log_id='log3')
+    store.write_log(user_id='user123', timestamp='2023-01-01T12:00:00Z', text='Also noon', log_id='log4')
+
+    all_logs = store.fetch_logs('user123', datetime(2023, 1, 1, tzinfo=UTC))
+    afternoon_logs = store.fetch_logs('user123', datetime(2023, 1, 1, 12, tzinfo=UTC))
+
+    assert [log['text'] for log in all_logs] == ['Morning', 'Noon', 'Also noon', 'Evening']
+    assert [log['text'] for log in afternoon_logs] == ['Noon', 'Also noon', 'Evening']
@@ -1,5 +1,6 @@
 """Tests for retry policy and backoff logic."""
 
+import random
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
@@ -22,6 +23,14 @@ class TestPayload(BaseModel):
     message: str
 
 
+class UpperBoundRandom(random.Random):  # noqa: S311
+    """Random generator that always returns the upper bound of uniform draws."""
+
+    def uniform(self, a: float, b: float) -> float:
+        """Return the upper bound."""
+        return b
+
+
 class FailingHandler(BaseJobHandler):
     """Handler that always fails for testing."""
 
@@ -37,7 +46,7 @@ class FailingHandler(BaseJobHandler):
 
 def test_backoff_applied_after_failure() -> None:
     """Test that exponential backoff is applied after job failures."""
-    policy = RetryPolicy(base_delay_seconds=60, max_attempts=5)
+    policy = RetryPolicy(base_delay_seconds=60, max_attempts=5, rng=UpperBoundRandom())
 
     now = datetime.now(UTC)
 
@@ -68,6 +77,42 @@ def test_retry_policy_determines_dead_letter() -> None:
     assert policy.should_retry(4) is False  # Beyond max, definitely dead letter
 
 
+def test_backoff_delay_is_capped() -> None:
+    """Test that the backoff delay never exceeds the configured maximum."""
+    policy = RetryPolicy(base_delay_seconds=60, max_attempts=10, max_delay_seconds=300, rng=UpperBoundRandom())
+
+    assert policy.calculate_delay(3) == timedelta(seconds=240)
+    assert policy.calculate_delay(4) == timedelta(seconds=300)
+    assert policy.calculate_delay(9) == timedelta(seconds=300)
+
+
+def test_backoff_delay_beyond_max_attempts() -> None:
+    """Test that delays are still computed for attempts past the precomputed range."""
+    policy = RetryPolicy(base_delay_seconds=60, max_attempts=2, rng=UpperBoundRandom())
+
+    assert policy.calculate_delay(2) == timedelta(seconds=120)
+    assert policy.calculate_delay(4) == timedelta(seconds=480)
+
+
+@pytest.mark.parametrize('attempts', [0, -1])
+def test_backoff_delay_rejects_attempts_below_one(attempts: int) -> None:
+    """Test that attempt counts below one are rejected instead of wrapping around the bounds."""
+    policy = RetryPolicy(base_delay_seconds=60, max_attempts=3, rng=UpperBoundRandom())
+
+    with pytest.raises(ValueError, match='attempts must be at least 1'):
+        policy.calculate_delay(attempts)
+
+
+def test_backoff_delay_uses_full_jitter() -> None:
+    """Test that delays are drawn between zero and the exponential backoff."""
+    policy = RetryPolicy(base_delay_seconds=60, rng=random.Random(42))  # noqa: S311
+
+    delays = [policy.calculate_delay(3) for _ in range(50)]
+
+    assert all(timedelta(0) <= delay <= timedelta(seconds=240) for delay in delays)
+    assert len(set(delays)) > 1
+
+
 @mock_aws
 def test_worker_applies_backoff_on_failure() -> None:
     """Test that worker applies backoff when jobs fail."""
@@ -149,7 +194,7 @@ def test_job_becomes_dead_letter_after_max_attempts() -> None:
 @mock_aws
 def test_retry_policy_configurable_parameters() -> None:
     """Test that retry policy parameters are configurable."""
-    policy = RetryPolicy(base_delay_seconds=30, max_attempts=10)
+    policy = RetryPolicy(base_delay_seconds=30, max_attempts=10, rng=UpperBoundRandom())
 
     # Test custom base delay
     delay1 = policy.calculate_delay(1)
@@ -166,3 +211,12 @@ def test_retry_policy_configurable_parameters() -> None:
 
     # Test max_attempts property
     assert policy.max_attempts == 10
+
+
+def test_retry_policy_uses_slots() -> None:
+    """Test that retry policies carry no per-instance __dict__."""
+    policy = RetryPolicy()
+
+    assert not hasattr(policy, '__dict__')
+    with pytest.raises(AttributeError):
+        policy.unexpected = 1  # type: ignore[attr-defined]
@@ -1,14 +1,20 @@
 """Tests for distributed scheduler."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+from moto import mock_aws
 
+from companion_memory.job_table import JobTable
 from companion_memory.scheduler import (
+    LOCK_CLIENT_CONFIG,
+    LOCK_HOLDER_JOB_IDS,
     DistributedScheduler,
     SchedulerLock,
     get_scheduler,
     get_slack_client,
+    get_user_message_lock,
 )
 
 pytestmark = pytest.mark.block_network
@@ -16,7 +22,7 @@ pytestmark = pytest.mark.block_network
 
 def test_scheduler_lock_key_format() -> None:
     """Test that scheduler lock uses correct table key format."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         lock = SchedulerLock('TestTable')
 
         assert lock.partition_key == 'system#scheduler'
@@ -24,48 +30,85 @@ def test_scheduler_lock_key_format() -> None:
         assert lock.table_name == 'TestTable'
 
 
+def test_scheduler_lock_process_id_is_short_and_unique() -> None:
+    """Test that each lock gets a compact process ID of pid plus a 64-bit token."""
+    with patch('boto3.client'):
+        first_lock = SchedulerLock('TestTable')
+        second_lock = SchedulerLock('TestTable')
+
+    pid, token = first_lock.process_id.split('-')
+    assert pid == str(os.getpid())
+    assert len(token) == 16
+    int(token, 16)
+    assert first_lock.process_id != second_lock.process_id
+
+
+def test_scheduler_locks_share_cached_client() -> None:
+    """Test that the DynamoDB client is built once and shared between locks."""
+    with patch('boto3.client') as mock_boto3:
+        first_lock = SchedulerLock('TestTable')
+        second_lock = SchedulerLock('TestTable')
+
+        assert first_lock.client is second_lock.client
+        mock_boto3.assert_called_once()
+
+
+def test_scheduler_lock_uses_low_latency_client_config() -> None:
+    """Test that lock operations use short timeouts and standard retries."""
+    with patch('boto3.client') as mock_boto3:
+        SchedulerLock('TestTable')
+
+        assert mock_boto3.call_args.kwargs['config'] is LOCK_CLIENT_CONFIG
+        assert LOCK_CLIENT_CONFIG.connect_timeout == 1
+        assert LOCK_CLIENT_CONFIG.read_timeout == 2
+        assert LOCK_CLIENT_CONFIG.retries == {'mode': 'standard', 'max_attempts': 3}
+
+
 def test_scheduler_lock_acquire_with_mocked_dynamodb() -> None:
     """Test scheduler lock acquisition with mocked DynamoDB."""
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
 
-        # Mock successful lock acquisition
-        mock_table.put_item.return_value = None
+        # Mock successful lock acquisition at epoch 3
+        mock_client.update_item.return_value = {'Attributes': {'epoch': {'N': '3'}}}
 
         result = lock.acquire()
 
         assert result is True
         assert lock.lock_acquired is True
+        assert lock.epoch == 3
 
-        # Verify put_item was called with correct structure
-        mock_table.put_item.assert_called_once()
-        call_args = mock_table.put_item.call_args
+        # Verify update_item was called with correct structure
+        mock_client.update_item.assert_called_once()
+        call_kwargs = mock_client.update_item.call_args.kwargs
 
-        item = call_args[1]['Item']
-        assert item['PK'] == 'system#scheduler'
-        assert item['SK'] == 'lock#main'
-        assert 'process_id' in item
-        assert 'timestamp' in item
-        assert 'ttl' in item
-        assert 'instance_info' in item
-        assert item['lock_type'] == 'scheduler'
+        assert call_kwargs['TableName'] == 'TestTable'
+        assert call_kwargs['Key'] == {'PK': {'S': 'system#scheduler'}, 'SK': {'S': 'lock#main'}}
+        assert 'ADD epoch :one' in call_kwargs['UpdateExpression']
+        values = call_kwargs['ExpressionAttributeValues']
+        assert values[':process_id'] == {'S': lock.process_id}
+        assert 'N' in values[':current_time']
+        assert 'M' in values[':info']
+        assert values[':lock_type'] == {'S': 'scheduler'}
 
 
 def test_scheduler_lock_acquire_failure_with_mocked_dynamodb() -> None:
     """Test scheduler lock acquisition failure (lock already held)."""
     from botocore.exceptions import ClientError
 
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
 
         # Mock conditional check failure (lock already exists)
-        mock_table.put_item.side_effect = ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'PutItem')
+        mock_client.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem'
+        )
 
         result = lock.acquire()
 
@@ -77,15 +120,15 @@ def test_scheduler_lock_acquire_other_client_error() -> None:
     """Test scheduler lock acquisition with other ClientError."""
     from botocore.exceptions import ClientError
 
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
 
         # Mock other ClientError (not ConditionalCheckFailedException)
-        mock_table.put_item.side_effect = ClientError(
-            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'PutItem'
+        mock_client.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'UpdateItem'
         )
 
         with pytest.raises(ClientError):
@@ -94,27 +137,33 @@ def test_scheduler_lock_acquire_other_client_error() -> None:
 
 def test_scheduler_lock_refresh_success() -> None:
     """Test scheduler lock refresh success."""
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = True  # Simulate already acquired lock
 
         # Mock successful refresh
-        mock_table.update_item.return_value = None
+        mock_client.update_item.return_value = None
 
         result = lock.refresh()
 
         assert result is True
-        mock_table.update_item.assert_called_once()
+        mock_client.update_item.assert_called_once()
+
+        # Heartbeat only touches the timestamp and TTL
+        call_kwargs = mock_client.update_item.call_args.kwargs
+        assert call_kwargs['UpdateExpression'] == 'SET #ts = :current_time'
+        assert call_kwargs['ConditionExpression'] == 'process_id = :process_id AND epoch = :epoch'
+        assert ':info' not in call_kwargs['ExpressionAttributeValues']
 
 
 def test_scheduler_lock_refresh_not_acquired() -> None:
     """Test scheduler lock refresh when lock not acquired."""
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = False  # Simulate not acquired lock
@@ -122,22 +171,22 @@ def test_scheduler_lock_refresh_not_acquired() -> None:
         result = lock.refresh()
 
         assert result is False
-        mock_table.update_item.assert_not_called()
+        mock_client.update_item.assert_not_called()
 
 
 def test_scheduler_lock_refresh_failure() -> None:
     """Test scheduler lock refresh failure (lock lost)."""
     from botocore.exceptions import ClientError
 
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = True  # Simulate already acquired lock
 
         # Mock conditional check failure (lock lost)
-        mock_table.update_item.side_effect = ClientError(
+        mock_client.update_item.side_effect = ClientError(
             {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem'
         )
 
@@ -151,15 +200,15 @@ def test_scheduler_lock_refresh_other_client_error() -> None:
     """Test scheduler lock refresh with other ClientError."""
     from botocore.exceptions import ClientError
 
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = True  # Simulate already acquired lock
 
         # Mock other ClientError (not ConditionalCheckFailedException)
-        mock_table.update_item.side_effect = ClientError(
+        mock_client.update_item.side_effect = ClientError(
             {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'UpdateItem'
         )
 
@@ -169,27 +218,27 @@ def test_scheduler_lock_refresh_other_client_error() -> None:
 
 def test_scheduler_lock_release_success() -> None:
     """Test scheduler lock release success."""
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = True  # Simulate acquired lock
 
         # Mock successful release
-        mock_table.delete_item.return_value = None
+        mock_client.update_item.return_value = None
 
         lock.release()
 
         assert lock.lock_acquired is False
-        mock_table.delete_item.assert_called_once()
+        mock_client.update_item.assert_called_once()
 
 
 def test_scheduler_lock_release_not_acquired() -> None:
     """Test scheduler lock release when lock not acquired."""
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = False  # Simulate not acquired lock
@@ -197,23 +246,23 @@ def test_scheduler_lock_release_not_acquired() -> None:
         lock.release()
 
         assert lock.lock_acquired is False
-        mock_table.delete_item.assert_not_called()
+        mock_client.update_item.assert_not_called()
 
 
 def test_scheduler_lock_release_failure() -> None:
     """Test scheduler lock release failure (lock already taken)."""
     from botocore.exceptions import ClientError
 
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = True  # Simulate acquired lock
 
         # Mock conditional check failure (lock already taken by another process)
-        mock_table.delete_item.side_effect = ClientError(
-            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'DeleteItem'
+        mock_client.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem'
         )
 
         lock.release()
@@ -225,16 +274,16 @@ def test_scheduler_lock_release_other_client_error() -> None:
     """Test scheduler lock release with other ClientError."""
     from botocore.exceptions import ClientError
 
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
         lock.lock_acquired = True  # Simulate acquired lock
 
         # Mock other ClientError (not ConditionalCheckFailedException)
-        mock_table.delete_item.side_effect = ClientError(
-            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'DeleteItem'
+        mock_client.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'UpdateItem'
         )
 
         lock.release()
@@ -242,30 +291,69 @@ def test_scheduler_lock_release_other_client_error() -> None:
         assert lock.lock_acquired is False
 
 
+@mock_aws
+def test_scheduler_lock_epoch_fences_previous_holder() -> None:
+    """Test that each acquisition bumps the epoch and fences out the previous holder."""
+    JobTable().create_table_for_testing()
+
+    first_lock = SchedulerLock()
+    second_lock = SchedulerLock()
+
+    assert first_lock.acquire() is True
+    assert first_lock.epoch == 1
+    assert second_lock.acquire() is False
+    assert first_lock.refresh() is True
+
+    # Releasing keeps the item, so the next holder gets a higher epoch immediately
+    first_lock.release()
+    assert second_lock.acquire() is True
+    assert second_lock.epoch == 2
+
+    # The former holder cannot refresh its way back in
+    first_lock.lock_acquired = True
+    assert first_lock.refresh() is False
+
+    holder = second_lock.get_current_lock_holder()
+    assert holder is not None
+    assert holder['process_id'] == second_lock.process_id
+    assert holder['epoch'] == 2
+    assert 'ttl' not in holder
+
+
 def test_scheduler_lock_get_current_lock_holder_success() -> None:
     """Test getting current lock holder successfully."""
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
-        mock_item = {'PK': 'system#scheduler', 'SK': 'lock#main', 'process_id': 'test-process'}
-        mock_table.get_item.return_value = {'Item': mock_item}
+        mock_item = {
+            'PK': {'S': 'system#scheduler'},
+            'SK': {'S': 'lock#main'},
+            'process_id': {'S': 'test-process'},
+            'timestamp': {'N': '1700000000'},
+        }
+        mock_client.get_item.return_value = {'Item': mock_item}
 
         result = lock.get_current_lock_holder()
 
-        assert result == mock_item
-        mock_table.get_item.assert_called_once()
+        assert result == {
+            'PK': 'system#scheduler',
+            'SK': 'lock#main',
+            'process_id': 'test-process',
+            'timestamp': 1700000000,
+        }
+        mock_client.get_item.assert_called_once()
 
 
 def test_scheduler_lock_get_current_lock_holder_no_item() -> None:
     """Test getting current lock holder when no lock exists."""
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
-        mock_table.get_item.return_value = {}
+        mock_client.get_item.return_value = {}
 
         result = lock.get_current_lock_holder()
 
@@ -276,12 +364,12 @@ def test_scheduler_lock_get_current_lock_holder_client_error() -> None:
     """Test getting current lock holder with ClientError."""
     from botocore.exceptions import ClientError
 
-    with patch('boto3.resource') as mock_boto3:
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+    with patch('boto3.client') as mock_boto3:
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         lock = SchedulerLock('TestTable')
-        mock_table.get_item.side_effect = ClientError(
+        mock_client.get_item.side_effect = ClientError(
             {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'GetItem'
         )
 
@@ -298,7 +386,7 @@ def test_scheduler_singleton_pattern() -> None:
     original_instance = scheduler._scheduler_instance  # noqa: SLF001
     scheduler._scheduler_instance = None  # noqa: SLF001
 
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler1 = get_scheduler()
         scheduler2 = get_scheduler()
 
@@ -308,9 +396,41 @@ def test_scheduler_singleton_pattern() -> None:
     scheduler._scheduler_instance = original_instance  # noqa: SLF001
 
 
+def test_scheduler_singleton_concurrent_first_use() -> None:
+    """Test that concurrent first calls to get_scheduler construct a single instance."""
+    import threading
+
+    from companion_memory import scheduler
+
+    original_instance = scheduler._scheduler_instance  # noqa: SLF001
+    scheduler._scheduler_instance = None  # noqa: SLF001
+    barrier = threading.Barrier(8)
+    results: list[DistributedScheduler] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(get_scheduler())
+
+    try:
+        with (
+            patch('boto3.client'),
+            patch('companion_memory.scheduler.DistributedScheduler', wraps=DistributedScheduler) as mock_class,
+        ):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            mock_class.assert_called_once()
+            assert all(result is results[0] for result in results)
+    finally:
+        scheduler._scheduler_instance = original_instance  # noqa: SLF001
+
+
 def test_distributed_scheduler_status() -> None:
     """Test scheduler status method."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
 
         status = scheduler.get_status()
@@ -327,7 +447,7 @@ def test_distributed_scheduler_status() -> None:
 
 def test_distributed_scheduler_start_success() -> None:
     """Test scheduler start success with immediate lock acquisition."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -342,14 +462,19 @@ def test_distributed_scheduler_start_success() -> None:
         assert scheduler.started is True
         mock_scheduler.start.assert_called_once()
         assert (
-            mock_scheduler.add_job.call_count == 6
-        )  # lock_manager + user_timezone_sync + daily_summary_scheduler + work_sampling_scheduler + job_worker_poller + job_cleanup
+            mock_scheduler.add_job.call_count == 4
+        )  # user_timezone_sync + hourly_job_scheduler + job_worker_poller + job_cleanup
         mock_acquire.assert_called_once()
+        assert scheduler._lock_thread is not None  # noqa: SLF001
+        assert scheduler._lock_thread.daemon  # noqa: SLF001
+
+        scheduler.shutdown()
+        assert scheduler._lock_thread is None  # noqa: SLF001
 
 
 def test_distributed_scheduler_start_already_started() -> None:
     """Test scheduler start when already started."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.started = True
 
@@ -360,7 +485,7 @@ def test_distributed_scheduler_start_already_started() -> None:
 
 def test_distributed_scheduler_start_without_immediate_lock() -> None:
     """Test scheduler start when lock is not immediately acquired."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -374,13 +499,35 @@ def test_distributed_scheduler_start_without_immediate_lock() -> None:
         assert result is True  # Scheduler always starts successfully
         assert scheduler.started is True
         mock_scheduler.start.assert_called_once()
-        assert mock_scheduler.add_job.call_count == 1  # Only lock_manager job added
+        mock_scheduler.add_job.assert_not_called()  # Lock management runs on its own thread
         mock_acquire.assert_called_once()
 
+        scheduler.shutdown()
+
+
+def test_distributed_scheduler_lock_loop_manages_lock_until_stopped() -> None:
+    """Test the lock thread calls _manage_lock each tick and logs errors without exiting."""
+    with patch('boto3.client'), patch('companion_memory.scheduler.logger') as mock_logger:
+        scheduler = DistributedScheduler('TestTable')
+        scheduler._lock_check_interval = 0  # noqa: SLF001
+        calls: list[int] = []
+
+        def manage_lock() -> None:
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError('DynamoDB unavailable')
+            scheduler._stop_event.set()  # noqa: SLF001
+
+        with patch.object(scheduler, '_manage_lock', side_effect=manage_lock):
+            scheduler._lock_loop()  # noqa: SLF001
+
+        assert len(calls) == 2
+        mock_logger.exception.assert_called_once_with('Error managing scheduler lock')
+
 
 def test_distributed_scheduler_manage_lock_with_lock_held() -> None:
     """Test scheduler manage lock when lock is held."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'), patch('companion_memory.scheduler.logger') as mock_logger:
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = True  # Simulate holding the lock
         mock_refresh = MagicMock(return_value=True)
@@ -389,11 +536,13 @@ def test_distributed_scheduler_manage_lock_with_lock_held() -> None:
             scheduler._manage_lock()  # noqa: SLF001
 
             mock_refresh.assert_called_once()
+            # Heartbeat is logged locally from the single refresh write
+            mock_logger.debug.assert_called_once()
 
 
 def test_distributed_scheduler_manage_lock_loses_lock() -> None:
     """Test scheduler manage lock when lock is lost during refresh."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.logger') as mock_logger:
+    with patch('boto3.client'), patch('companion_memory.scheduler.logger') as mock_logger:
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = True  # Simulate holding the lock
         scheduler._jobs_added = True  # Simulate having active jobs  # noqa: SLF001
@@ -413,7 +562,7 @@ def test_distributed_scheduler_manage_lock_loses_lock() -> None:
 
 def test_distributed_scheduler_manage_lock_without_lock() -> None:
     """Test scheduler manage lock when lock is not held."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = False  # Simulate not holding the lock
         mock_acquire = MagicMock(return_value=False)
@@ -426,7 +575,7 @@ def test_distributed_scheduler_manage_lock_without_lock() -> None:
 
 def test_distributed_scheduler_add_job_when_started() -> None:
     """Test adding job when scheduler is started and has lock."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -445,7 +594,7 @@ def test_distributed_scheduler_add_job_when_started() -> None:
 
 def test_distributed_scheduler_add_job_when_not_started() -> None:
     """Test adding job when scheduler is not started."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.started = False
 
@@ -459,7 +608,7 @@ def test_distributed_scheduler_add_job_when_not_started() -> None:
 
 def test_distributed_scheduler_add_job_without_lock() -> None:
     """Test adding job when scheduler is started but doesn't have lock."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -479,7 +628,7 @@ def test_distributed_scheduler_add_job_without_lock() -> None:
 
 def test_distributed_scheduler_add_active_jobs_when_already_added() -> None:
     """Test _add_active_jobs when jobs are already added."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -496,7 +645,7 @@ def test_distributed_scheduler_add_active_jobs_when_already_added() -> None:
 
 def test_distributed_scheduler_add_active_jobs_without_scheduler() -> None:
     """Test _add_active_jobs when scheduler is None."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.scheduler = None
         scheduler._jobs_added = False  # noqa: SLF001
@@ -509,7 +658,7 @@ def test_distributed_scheduler_add_active_jobs_without_scheduler() -> None:
 
 def test_distributed_scheduler_remove_active_jobs() -> None:
     """Test _remove_active_jobs method."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -520,10 +669,10 @@ def test_distributed_scheduler_remove_active_jobs() -> None:
         # Call the method
         scheduler._remove_active_jobs()  # noqa: SLF001
 
-        # Should remove four jobs
+        # Should remove all four lock-holder jobs
         assert mock_scheduler.remove_job.call_count == 4
-        mock_scheduler.remove_job.assert_any_call('daily_summary_scheduler')
-        mock_scheduler.remove_job.assert_any_call('work_sampling_scheduler')
+        mock_scheduler.remove_job.assert_any_call('user_timezone_sync')
+        mock_scheduler.remove_job.assert_any_call('hourly_job_scheduler')
         mock_scheduler.remove_job.assert_any_call('job_worker_poller')
         mock_scheduler.remove_job.assert_any_call('job_cleanup')
         assert scheduler._jobs_added is False  # noqa: SLF001
@@ -531,7 +680,7 @@ def test_distributed_scheduler_remove_active_jobs() -> None:
 
 def test_distributed_scheduler_remove_active_jobs_with_exception() -> None:
     """Test _remove_active_jobs when job removal raises exception."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler.remove_job.side_effect = Exception('Job not found')
         mock_scheduler_class.return_value = mock_scheduler
@@ -547,9 +696,31 @@ def test_distributed_scheduler_remove_active_jobs_with_exception() -> None:
         assert scheduler._jobs_added is False  # noqa: SLF001
 
 
+def test_distributed_scheduler_readds_jobs_after_losing_and_reacquiring_lock() -> None:
+    """Test that losing and then reacquiring the lock re-adds every job without ID conflicts."""
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    with patch('boto3.client'):
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.scheduler = BackgroundScheduler(timezone='UTC')
+        scheduler.scheduler.start(paused=True)
+        try:
+            scheduler._add_active_jobs()  # noqa: SLF001
+            job_ids = {job.id for job in scheduler.scheduler.get_jobs()}
+            assert job_ids == set(LOCK_HOLDER_JOB_IDS)
+
+            scheduler._remove_active_jobs()  # noqa: SLF001
+            assert scheduler.scheduler.get_jobs() == []
+
+            scheduler._add_active_jobs()  # noqa: SLF001
+            assert {job.id for job in scheduler.scheduler.get_jobs()} == job_ids
+        finally:
+            scheduler.scheduler.shutdown(wait=False)
+
+
 def test_distributed_scheduler_configure_dependencies() -> None:
     """Test scheduler dependency configuration."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         mock_log_store = MagicMock()
         mock_llm = MagicMock()
@@ -562,7 +733,7 @@ def test_distributed_scheduler_configure_dependencies() -> None:
 
 def test_distributed_scheduler_shutdown_with_scheduler() -> None:
     """Test scheduler shutdown with active scheduler."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -583,7 +754,7 @@ def test_distributed_scheduler_shutdown_with_exception() -> None:
     from botocore.exceptions import ClientError
 
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class,
         patch('companion_memory.scheduler.logger') as mock_logger,
     ):
@@ -606,7 +777,7 @@ def test_distributed_scheduler_shutdown_with_exception() -> None:
 
 def test_distributed_scheduler_shutdown_without_scheduler() -> None:
     """Test scheduler shutdown without active scheduler."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.started = False
         scheduler.scheduler = None
@@ -624,12 +795,12 @@ def test_flask_app_integration() -> None:
 
     with (
         patch('companion_memory.scheduler.SchedulerLock.acquire') as mock_acquire,
-        patch('boto3.resource') as mock_boto3,
+        patch('boto3.client') as mock_boto3,
         patch('companion_memory.app.get_scheduler') as mock_get_scheduler,
     ):
         mock_acquire.return_value = True
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
+        mock_client = MagicMock()
+        mock_boto3.return_value = mock_client
 
         # Mock scheduler with a proper status response
         mock_scheduler = MagicMock()
@@ -661,6 +832,49 @@ def test_get_slack_client_success() -> None:
         assert client is not None
 
 
+def test_get_slack_client_is_shared_per_token() -> None:
+    """Test that the Slack client is reused until the bot token changes."""
+    with patch.dict('os.environ', {'SLACK_BOT_TOKEN': 'test-token'}):
+        first_client = get_slack_client()
+        assert get_slack_client() is first_client
+
+    with patch.dict('os.environ', {'SLACK_BOT_TOKEN': 'rotated-token'}):
+        rotated_client = get_slack_client()
+        assert rotated_client is not first_client
+        assert rotated_client.token == 'rotated-token'  # noqa: S105
+
+
+def test_get_slack_client_reuses_one_ssl_context() -> None:
+    """Test that the shared Slack client carries a prebuilt SSL context for its connections."""
+    import ssl
+
+    with patch.dict('os.environ', {'SLACK_BOT_TOKEN': 'test-token'}):
+        client = get_slack_client()
+
+    assert isinstance(client.ssl, ssl.SSLContext)
+    assert client.ssl.verify_mode == ssl.CERT_REQUIRED
+
+
+def test_get_slack_client_retries_rate_limited_calls_once() -> None:
+    """Test that the shared Slack client keeps the default retries and adds one rate-limit retry."""
+    from slack_sdk.http_retry import ConnectionErrorRetryHandler, RateLimitErrorRetryHandler
+
+    with patch.dict('os.environ', {'SLACK_BOT_TOKEN': 'test-token'}):
+        client = get_slack_client()
+
+    handler_types = [type(handler) for handler in client.retry_handlers]
+    assert handler_types == [ConnectionErrorRetryHandler, RateLimitErrorRetryHandler]
+    assert client.retry_handlers[1].max_retry_count == 1
+
+
+def test_get_user_message_lock_is_per_user() -> None:
+    """Test that each user gets one stable message lock."""
+    first_lock = get_user_message_lock('U123')
+
+    assert get_user_message_lock('U123') is first_lock
+    assert get_user_message_lock('U456') is not first_lock
+
+
 def test_get_slack_client_missing_token() -> None:
     """Test getting Slack client with missing token."""
     with (
@@ -672,7 +886,7 @@ def test_get_slack_client_missing_token() -> None:
 
 def test_distributed_scheduler_poll_and_process_jobs_without_lock() -> None:
     """Test _poll_and_process_jobs when lock is not held."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = False
 
@@ -686,9 +900,9 @@ def test_distributed_scheduler_poll_and_process_jobs_without_lock() -> None:
 def test_distributed_scheduler_poll_and_process_jobs_with_lock() -> None:
     """Test _poll_and_process_jobs when lock is held."""
     with (
-        patch('boto3.resource'),
-        patch('companion_memory.job_table.JobTable') as mock_job_table_class,
-        patch('companion_memory.job_worker.JobWorker') as mock_job_worker_class,
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+        patch('companion_memory.scheduler.JobWorker') as mock_job_worker_class,
     ):
         mock_job_table = MagicMock()
         mock_job_table_class.return_value = mock_job_table
@@ -714,15 +928,16 @@ def test_distributed_scheduler_poll_and_process_jobs_with_lock() -> None:
 def test_distributed_scheduler_poll_and_process_jobs_no_jobs_processed() -> None:
     """Test _poll_and_process_jobs when no jobs are processed."""
     with (
-        patch('boto3.resource'),
-        patch('companion_memory.job_table.JobTable') as mock_job_table_class,
-        patch('companion_memory.job_worker.JobWorker') as mock_job_worker_class,
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+        patch('companion_memory.scheduler.JobWorker') as mock_job_worker_class,
     ):
         mock_job_table = MagicMock()
         mock_job_table_class.return_value = mock_job_table
 
         mock_job_worker = MagicMock()
         mock_job_worker.poll_and_process_jobs.return_value = 0  # No jobs processed
+        mock_job_worker.get_poll_delay.side_effect = lambda max_delay: max_delay
         mock_job_worker_class.return_value = mock_job_worker
 
         scheduler = DistributedScheduler('TestTable')
@@ -735,6 +950,144 @@ def test_distributed_scheduler_poll_and_process_jobs_no_jobs_processed() -> None
         mock_job_worker.poll_and_process_jobs.assert_called_once()
 
 
+def test_distributed_scheduler_backs_off_polling_while_idle() -> None:
+    """Test that empty polls double the effective polling interval up to the maximum."""
+    with patch('boto3.client'), patch('companion_memory.scheduler.time.monotonic') as mock_monotonic:
+        mock_job_worker = MagicMock()
+        mock_job_worker.poll_and_process_jobs.return_value = 0
+        mock_job_worker.get_poll_delay.side_effect = lambda max_delay: max_delay
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+        scheduler._job_worker = mock_job_worker  # noqa: SLF001
+        scheduler._job_table = MagicMock(**{'get_new_jobs_signal.return_value': 0})  # noqa: SLF001
+
+        poll_times = []
+        for tick in range(0, 1200, 30):
+            mock_monotonic.return_value = float(tick)
+            calls_before = mock_job_worker.poll_and_process_jobs.call_count
+            scheduler._poll_and_process_jobs()  # noqa: SLF001
+            if mock_job_worker.poll_and_process_jobs.call_count > calls_before:
+                poll_times.append(tick)
+
+        # Intervals grow 60s, 120s, 240s, then stay capped at 300s
+        assert poll_times == [0, 60, 180, 420, 720, 1020]
+        # The idle count stops growing once the cap is reached
+        assert scheduler._job_worker_idle_polls == 3  # noqa: SLF001
+
+
+def test_distributed_scheduler_new_jobs_signal_ends_poll_backoff() -> None:
+    """Test that jobs signalled by another process are polled for on the next tick despite the backoff."""
+    with patch('boto3.client'), patch('companion_memory.scheduler.time.monotonic') as mock_monotonic:
+        mock_job_worker = MagicMock()
+        mock_job_worker.poll_and_process_jobs.return_value = 0
+        mock_job_worker.get_poll_delay.side_effect = lambda max_delay: max_delay
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+        scheduler._job_worker = mock_job_worker  # noqa: SLF001
+        scheduler._job_table = MagicMock(**{'get_new_jobs_signal.return_value': 0})  # noqa: SLF001
+
+        mock_monotonic.return_value = 0.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        mock_monotonic.return_value = 30.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        assert mock_job_worker.poll_and_process_jobs.call_count == 1
+
+        scheduler._job_table.get_new_jobs_signal.return_value = 1  # noqa: SLF001
+        mock_monotonic.return_value = 35.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        assert mock_job_worker.poll_and_process_jobs.call_count == 2
+
+
+def test_distributed_scheduler_resets_poll_backoff_after_work() -> None:
+    """Test that processing a job resets the idle backoff."""
+    with patch('boto3.client'), patch('companion_memory.scheduler.time.monotonic') as mock_monotonic:
+        mock_job_worker = MagicMock()
+        mock_job_worker.poll_and_process_jobs.return_value = 0
+        mock_job_worker.get_poll_delay.side_effect = lambda max_delay: max_delay
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+        scheduler._job_worker = mock_job_worker  # noqa: SLF001
+        scheduler._job_table = MagicMock(**{'get_new_jobs_signal.return_value': 0})  # noqa: SLF001
+
+        mock_monotonic.return_value = 0.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        mock_monotonic.return_value = 30.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        assert mock_job_worker.poll_and_process_jobs.call_count == 1
+
+        mock_job_worker.poll_and_process_jobs.return_value = 2
+        mock_monotonic.return_value = 60.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        mock_monotonic.return_value = 90.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        assert mock_job_worker.poll_and_process_jobs.call_count == 3
+
+
+def test_distributed_scheduler_poll_backoff_stops_at_next_due_job() -> None:
+    """Test that the idle backoff never skips past the next scheduled job."""
+    with patch('boto3.client'), patch('companion_memory.scheduler.time.monotonic') as mock_monotonic:
+        mock_job_worker = MagicMock()
+        mock_job_worker.poll_and_process_jobs.return_value = 0
+        mock_job_worker.get_poll_delay.return_value = 0.0
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+        scheduler._job_worker = mock_job_worker  # noqa: SLF001
+        scheduler._job_table = MagicMock(**{'get_new_jobs_signal.return_value': 0})  # noqa: SLF001
+
+        for tick in (0.0, 30.0, 60.0):
+            mock_monotonic.return_value = tick
+            scheduler._poll_and_process_jobs()  # noqa: SLF001
+
+        assert mock_job_worker.poll_and_process_jobs.call_count == 3
+        mock_job_worker.get_poll_delay.assert_called_with(240)
+
+
+def test_distributed_scheduler_schedule_hourly_jobs_resets_poll_backoff() -> None:
+    """Test that enqueuing the hourly jobs resumes polling on the next tick."""
+    with (
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.JobTable'),
+        patch('companion_memory.scheduler.DynamoUserSettingsStore'),
+        patch('companion_memory.scheduler.DeduplicationIndex'),
+        patch('companion_memory.scheduler.schedule_daily_summaries'),
+        patch('companion_memory.scheduler.schedule_work_sampling_jobs'),
+    ):
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+        scheduler._job_worker_idle_polls = 3  # noqa: SLF001
+        scheduler._next_job_poll_at = 1_000_000.0  # noqa: SLF001
+
+        scheduler._schedule_hourly_jobs()  # noqa: SLF001
+
+        assert scheduler._job_worker_idle_polls == 0  # noqa: SLF001
+        assert scheduler._next_job_poll_at == 0.0  # noqa: SLF001
+
+
+def test_distributed_scheduler_reset_job_polling_backoff() -> None:
+    """Test that an explicit reset resumes polling on the next tick."""
+    with patch('boto3.client'), patch('companion_memory.scheduler.time.monotonic') as mock_monotonic:
+        mock_job_worker = MagicMock()
+        mock_job_worker.poll_and_process_jobs.return_value = 0
+        mock_job_worker.get_poll_delay.side_effect = lambda max_delay: max_delay
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+        scheduler._job_worker = mock_job_worker  # noqa: SLF001
+        scheduler._job_table = MagicMock(**{'get_new_jobs_signal.return_value': 0})  # noqa: SLF001
+
+        mock_monotonic.return_value = 0.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+        scheduler.reset_job_polling_backoff()
+        mock_monotonic.return_value = 30.0
+        scheduler._poll_and_process_jobs()  # noqa: SLF001
+
+        assert mock_job_worker.poll_and_process_jobs.call_count == 2
+
+
 def test_distributed_scheduler_poll_and_process_jobs_debug_logging_with_due_jobs() -> None:
     """Test _poll_and_process_jobs debug logging when jobs are found but not processed."""
     from datetime import UTC, datetime
@@ -743,9 +1096,9 @@ def test_distributed_scheduler_poll_and_process_jobs_debug_logging_with_due_jobs
     from companion_memory.job_models import ScheduledJob
 
     with (
-        patch('boto3.resource'),
-        patch('companion_memory.job_table.JobTable') as mock_job_table_class,
-        patch('companion_memory.job_worker.JobWorker') as mock_job_worker_class,
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+        patch('companion_memory.scheduler.JobWorker') as mock_job_worker_class,
     ):
         # Create mock due jobs
         due_job1 = ScheduledJob(
@@ -775,6 +1128,7 @@ def test_distributed_scheduler_poll_and_process_jobs_debug_logging_with_due_jobs
         # Mock job worker that processes 0 jobs
         mock_job_worker = MagicMock()
         mock_job_worker.poll_and_process_jobs.return_value = 0  # No jobs processed
+        mock_job_worker.get_poll_delay.side_effect = lambda max_delay: max_delay
         mock_job_worker_class.return_value = mock_job_worker
 
         scheduler = DistributedScheduler('TestTable')
@@ -790,9 +1144,9 @@ def test_distributed_scheduler_poll_and_process_jobs_debug_logging_with_due_jobs
 def test_distributed_scheduler_poll_and_process_jobs_no_due_jobs_found() -> None:
     """Test _poll_and_process_jobs debug logging when no due jobs are found."""
     with (
-        patch('boto3.resource'),
-        patch('companion_memory.job_table.JobTable') as mock_job_table_class,
-        patch('companion_memory.job_worker.JobWorker') as mock_job_worker_class,
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+        patch('companion_memory.scheduler.JobWorker') as mock_job_worker_class,
     ):
         # Mock job table with no due jobs
         mock_job_table = MagicMock()
@@ -802,6 +1156,7 @@ def test_distributed_scheduler_poll_and_process_jobs_no_due_jobs_found() -> None
         # Mock job worker that processes 0 jobs
         mock_job_worker = MagicMock()
         mock_job_worker.poll_and_process_jobs.return_value = 0  # No jobs processed
+        mock_job_worker.get_poll_delay.side_effect = lambda max_delay: max_delay
         mock_job_worker_class.return_value = mock_job_worker
 
         scheduler = DistributedScheduler('TestTable')
@@ -817,8 +1172,8 @@ def test_distributed_scheduler_poll_and_process_jobs_no_due_jobs_found() -> None
 def test_distributed_scheduler_poll_and_process_jobs_exception() -> None:
     """Test _poll_and_process_jobs when an exception occurs."""
     with (
-        patch('boto3.resource'),
-        patch('companion_memory.job_table.JobTable') as mock_job_table_class,
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
         patch('companion_memory.scheduler.logger') as mock_logger,
     ):
         mock_job_table_class.side_effect = Exception('Job table error')
@@ -835,7 +1190,7 @@ def test_distributed_scheduler_poll_and_process_jobs_exception() -> None:
 
 def test_distributed_scheduler_job_worker_disabled() -> None:
     """Test scheduler when job worker is disabled."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -847,15 +1202,15 @@ def test_distributed_scheduler_job_worker_disabled() -> None:
         with patch.object(scheduler.lock, 'acquire', mock_acquire):
             scheduler.start()
 
-        # Should only add 6 jobs (not including job worker poller)
-        assert (
-            mock_scheduler.add_job.call_count == 5
-        )  # lock_manager + user_timezone_sync + daily_summary_scheduler + work_sampling_scheduler + job_cleanup
+        # Should only add 4 jobs (not including job worker poller)
+        assert mock_scheduler.add_job.call_count == 3  # user_timezone_sync + hourly_job_scheduler + job_cleanup
+
+        scheduler.shutdown()
 
 
 def test_distributed_scheduler_remove_job_worker_poller() -> None:
     """Test that job worker poller is removed when losing lock."""
-    with patch('boto3.resource'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
+    with patch('boto3.client'), patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class:
         mock_scheduler = MagicMock()
         mock_scheduler_class.return_value = mock_scheduler
 
@@ -867,14 +1222,13 @@ def test_distributed_scheduler_remove_job_worker_poller() -> None:
         scheduler._remove_active_jobs()  # noqa: SLF001
 
         # Should attempt to remove all scheduler jobs
-        mock_scheduler.remove_job.assert_any_call('daily_summary_scheduler')
-        mock_scheduler.remove_job.assert_any_call('work_sampling_scheduler')
+        mock_scheduler.remove_job.assert_any_call('hourly_job_scheduler')
         mock_scheduler.remove_job.assert_any_call('job_worker_poller')
 
 
 def test_distributed_scheduler_schedule_daily_summaries_without_lock() -> None:
     """Test _schedule_daily_summaries when lock is not held."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = False
 
@@ -887,12 +1241,12 @@ def test_distributed_scheduler_schedule_daily_summaries_without_lock() -> None:
 def test_distributed_scheduler_schedule_daily_summaries_success() -> None:
     """Test _schedule_daily_summaries successful execution."""
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.logger') as mock_logger,
-        patch('companion_memory.user_settings.DynamoUserSettingsStore') as mock_settings_store_class,
-        patch('companion_memory.job_table.JobTable') as mock_job_table_class,
-        patch('companion_memory.deduplication.DeduplicationIndex') as mock_dedup_class,
-        patch('companion_memory.daily_summary_scheduler.schedule_daily_summaries') as mock_schedule_fn,
+        patch('companion_memory.scheduler.DynamoUserSettingsStore') as mock_settings_store_class,
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+        patch('companion_memory.scheduler.DeduplicationIndex') as mock_dedup_class,
+        patch('companion_memory.scheduler.schedule_daily_summaries') as mock_schedule_fn,
     ):
         # Set up mocks
         mock_settings_store = MagicMock()
@@ -923,14 +1277,14 @@ def test_distributed_scheduler_schedule_daily_summaries_success() -> None:
 def test_distributed_scheduler_schedule_daily_summaries_exception() -> None:
     """Test _schedule_daily_summaries when an exception occurs."""
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.logger') as mock_logger,
     ):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = True
 
         # Mock DynamoUserSettingsStore to raise an exception
-        with patch('companion_memory.user_settings.DynamoUserSettingsStore', side_effect=Exception('Import error')):
+        with patch('companion_memory.scheduler.DynamoUserSettingsStore', side_effect=Exception('Import error')):
             # Call the method - should not raise exception
             scheduler._schedule_daily_summaries()  # noqa: SLF001
 
@@ -940,7 +1294,7 @@ def test_distributed_scheduler_schedule_daily_summaries_exception() -> None:
 
 def test_distributed_scheduler_schedule_work_sampling_jobs_without_lock() -> None:
     """Test _schedule_work_sampling_jobs when lock is not held."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = False
 
@@ -951,11 +1305,11 @@ def test_distributed_scheduler_schedule_work_sampling_jobs_without_lock() -> Non
 def test_distributed_scheduler_schedule_work_sampling_jobs_with_lock() -> None:
     """Test _schedule_work_sampling_jobs when lock is held."""
     with (
-        patch('boto3.resource'),
-        patch('companion_memory.work_sampling_scheduler.schedule_work_sampling_jobs') as mock_schedule_fn,
-        patch('companion_memory.user_settings.DynamoUserSettingsStore') as mock_settings_store,
-        patch('companion_memory.job_table.JobTable') as mock_job_table,
-        patch('companion_memory.deduplication.DeduplicationIndex') as mock_dedup_index,
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.schedule_work_sampling_jobs') as mock_schedule_fn,
+        patch('companion_memory.scheduler.DynamoUserSettingsStore') as mock_settings_store,
+        patch('companion_memory.scheduler.JobTable') as mock_job_table,
+        patch('companion_memory.scheduler.DeduplicationIndex') as mock_dedup_index,
     ):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = True
@@ -978,17 +1332,125 @@ def test_distributed_scheduler_schedule_work_sampling_jobs_with_lock() -> None:
         # Verify scheduling function was called (success logging removed)
 
 
+def test_distributed_scheduler_schedule_hourly_jobs_without_lock() -> None:
+    """Test _schedule_hourly_jobs when lock is not held."""
+    with patch('boto3.client'), patch('companion_memory.scheduler.JobTable') as mock_job_table:
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = False
+
+        scheduler._schedule_hourly_jobs()  # noqa: SLF001
+
+        mock_job_table.assert_not_called()
+
+
+def test_distributed_scheduler_schedule_hourly_jobs_batches_both_passes() -> None:
+    """Test _schedule_hourly_jobs runs both passes inside one batch of job writes."""
+    with (
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.DynamoUserSettingsStore'),
+        patch('companion_memory.scheduler.DeduplicationIndex') as mock_dedup_class,
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+        patch('companion_memory.scheduler.schedule_daily_summaries') as mock_daily_fn,
+        patch('companion_memory.scheduler.schedule_work_sampling_jobs') as mock_sampling_fn,
+    ):
+        mock_job_table = mock_job_table_class.return_value
+        batch = mock_job_table.batch_writes.return_value
+        calls = MagicMock()
+        calls.attach_mock(batch.__enter__, 'enter')
+        calls.attach_mock(mock_daily_fn, 'daily')
+        calls.attach_mock(mock_sampling_fn, 'sampling')
+        calls.attach_mock(batch.__exit__, 'exit')
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+
+        scheduler._schedule_hourly_jobs()  # noqa: SLF001
+
+        assert [name for name, _, _ in calls.mock_calls] == ['enter', 'daily', 'sampling', 'exit']
+        # Reservations made during the pass are fenced by the lock's epoch
+        mock_dedup_class.return_value.fenced_by.assert_called_once_with(scheduler.lock.fencing_check())
+
+
+def test_distributed_scheduler_schedule_hourly_jobs_flush_error() -> None:
+    """Test _schedule_hourly_jobs logs errors raised while flushing the batch."""
+    with (
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.logger') as mock_logger,
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+    ):
+        mock_job_table_class.return_value.batch_writes.side_effect = Exception('Flush error')
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+
+        scheduler._schedule_hourly_jobs()  # noqa: SLF001
+
+        mock_logger.exception.assert_called_once_with('Error writing hourly scheduled jobs')
+
+
+def test_distributed_scheduler_schedule_hourly_jobs_releases_unwritten_reservations() -> None:
+    """Test that reservations for jobs a failed flush dropped are released."""
+    with (
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.logger') as mock_logger,
+        patch('companion_memory.scheduler.DynamoUserSettingsStore'),
+        patch('companion_memory.scheduler.DeduplicationIndex') as mock_dedup_class,
+        patch('companion_memory.scheduler.JobTable') as mock_job_table_class,
+        patch('companion_memory.scheduler.schedule_daily_summaries'),
+        patch('companion_memory.scheduler.schedule_work_sampling_jobs'),
+    ):
+        mock_dedup = mock_dedup_class.return_value
+        reservations = [('summary#U1', '2025-07-11', 'sk-written'), ('summary#U2', '2025-07-11', 'sk-lost')]
+        mock_dedup.track_reservations.return_value.__enter__.return_value = reservations
+        mock_job_table = mock_job_table_class.return_value
+        mock_job_table.batch_writes.return_value.__enter__.return_value = {'sk-written'}
+        mock_job_table.batch_writes.return_value.__exit__.side_effect = Exception('Flush error')
+
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+
+        scheduler._schedule_hourly_jobs()  # noqa: SLF001
+
+        mock_dedup.release.assert_called_once_with('summary#U2', '2025-07-11')
+        mock_logger.warning.assert_called_once()
+        mock_logger.exception.assert_called_once_with('Error writing hourly scheduled jobs')
+
+
+def test_distributed_scheduler_reuses_dependencies_across_runs() -> None:
+    """Test that the hourly jobs build their DynamoDB dependencies only once."""
+    with (
+        patch('boto3.client'),
+        patch('companion_memory.scheduler.schedule_daily_summaries') as mock_daily_fn,
+        patch('companion_memory.scheduler.schedule_work_sampling_jobs') as mock_sampling_fn,
+        patch('companion_memory.scheduler.DynamoUserSettingsStore') as mock_settings_store,
+        patch('companion_memory.scheduler.JobTable') as mock_job_table,
+        patch('companion_memory.scheduler.DeduplicationIndex') as mock_dedup_index,
+    ):
+        scheduler = DistributedScheduler('TestTable')
+        scheduler.lock.lock_acquired = True
+
+        scheduler._schedule_daily_summaries()  # noqa: SLF001
+        scheduler._schedule_work_sampling_jobs()  # noqa: SLF001
+        scheduler._cleanup_old_jobs()  # noqa: SLF001
+
+        mock_settings_store.assert_called_once()
+        mock_job_table.assert_called_once()
+        mock_dedup_index.assert_called_once()
+        assert mock_daily_fn.call_args == mock_sampling_fn.call_args
+        mock_job_table.return_value.cleanup_old_jobs.assert_called_once_with(older_than_days=7)
+
+
 def test_distributed_scheduler_schedule_work_sampling_jobs_exception() -> None:
     """Test _schedule_work_sampling_jobs when an exception occurs."""
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.logger') as mock_logger,
     ):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = True
 
         # Mock DynamoUserSettingsStore to raise an exception
-        with patch('companion_memory.user_settings.DynamoUserSettingsStore', side_effect=Exception('Import error')):
+        with patch('companion_memory.scheduler.DynamoUserSettingsStore', side_effect=Exception('Import error')):
             # Call the method - should not raise exception
             scheduler._schedule_work_sampling_jobs()  # noqa: SLF001
 
@@ -999,7 +1461,7 @@ def test_distributed_scheduler_schedule_work_sampling_jobs_exception() -> None:
 def test_distributed_scheduler_cleanup_old_jobs_with_lock() -> None:
     """Test _cleanup_old_jobs when lock is held."""
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.logger') as mock_logger,
     ):
         scheduler = DistributedScheduler('TestTable')
@@ -1009,7 +1471,7 @@ def test_distributed_scheduler_cleanup_old_jobs_with_lock() -> None:
         mock_job_table = MagicMock()
         mock_job_table.cleanup_old_jobs.return_value = 42  # Deleted 42 jobs
 
-        with patch('companion_memory.job_table.JobTable', return_value=mock_job_table):
+        with patch('companion_memory.scheduler.JobTable', return_value=mock_job_table):
             # Call the method
             scheduler._cleanup_old_jobs()  # noqa: SLF001
 
@@ -1022,14 +1484,14 @@ def test_distributed_scheduler_cleanup_old_jobs_with_lock() -> None:
 
 def test_distributed_scheduler_cleanup_old_jobs_without_lock() -> None:
     """Test _cleanup_old_jobs when lock is not held."""
-    with patch('boto3.resource'):
+    with patch('boto3.client'):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = False
 
         # Mock JobTable
         mock_job_table = MagicMock()
 
-        with patch('companion_memory.job_table.JobTable', return_value=mock_job_table):
+        with patch('companion_memory.scheduler.JobTable', return_value=mock_job_table):
             # Call the method
             scheduler._cleanup_old_jobs()  # noqa: SLF001
 
@@ -1040,14 +1502,14 @@ def test_distributed_scheduler_cleanup_old_jobs_without_lock() -> None:
 def test_distributed_scheduler_cleanup_old_jobs_exception() -> None:
     """Test _cleanup_old_jobs when an exception occurs."""
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.logger') as mock_logger,
     ):
         scheduler = DistributedScheduler('TestTable')
         scheduler.lock.lock_acquired = True
 
         # Mock JobTable to raise an exception
-        with patch('companion_memory.job_table.JobTable', side_effect=Exception('Import error')):
+        with patch('companion_memory.scheduler.JobTable', side_effect=Exception('Import error')):
             # Call the method - should not raise exception
             scheduler._cleanup_old_jobs()  # noqa: SLF001
 
@@ -1058,7 +1520,7 @@ def test_distributed_scheduler_cleanup_old_jobs_exception() -> None:
 def test_distributed_scheduler_adds_cleanup_job() -> None:
     """Test that scheduler adds cleanup job when acquiring lock."""
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class,
     ):
         mock_scheduler = MagicMock()
@@ -1088,7 +1550,7 @@ def test_distributed_scheduler_adds_cleanup_job() -> None:
 def test_distributed_scheduler_removes_cleanup_job() -> None:
     """Test that scheduler removes cleanup job when losing lock."""
     with (
-        patch('boto3.resource'),
+        patch('boto3.client'),
         patch('companion_memory.scheduler.BackgroundScheduler') as mock_scheduler_class,
     ):
         mock_scheduler = MagicMock()
@@ -1104,3 +1566,17 @@ def test_distributed_scheduler_removes_cleanup_job() -> None:
         # Should remove cleanup job
         remove_calls = [call for call in mock_scheduler.remove_job.call_args_list if call[0][0] == 'job_cleanup']
         assert len(remove_calls) == 1
+
+
+def test_scheduler_lock_fencing_check_matches_current_holding() -> None:
+    """Test that the fencing check conditions on this holder and its epoch."""
+    with patch('boto3.client'):
+        lock = SchedulerLock('TestTable')
+        lock.epoch = 7
+
+        assert lock.fencing_check() == {
+            'TableName': 'TestTable',
+            'Key': {'PK': 'system#scheduler', 'SK': 'lock#main'},
+            'ConditionExpression': 'process_id = :process_id AND epoch = :epoch',
+            'ExpressionAttributeValues': {':process_id': lock.process_id, ':epoch': 7},
+        }
@@ -11,7 +11,7 @@ from pydantic import BaseModel
 from companion_memory.job_dispatcher import BaseJobHandler
 from companion_memory.job_models import ScheduledJob
 from companion_memory.job_table import JobTable
-from companion_memory.job_worker import JobWorker
+from companion_memory.job_worker import FailureReportThrottle, JobWorker
 
 pytestmark = pytest.mark.block_network
 
@@ -153,3 +153,101 @@ def test_successful_jobs_not_reported_to_sentry(mock_capture: Mock) -> None:
 
     # Verify no Sentry calls for successful jobs
     mock_capture.assert_not_called()
+
+
+@mock_aws
+@patch('sentry_sdk.capture_exception')
+def test_like_failures_reported_to_sentry_once_per_window(mock_capture: Mock) -> None:
+    """Test that repeated failures of the same job type and error are throttled."""
+    job_table = JobTable()
+    job_table.create_table_for_testing()
+
+    worker = JobWorker(job_table)
+    worker.register_handler('failing_job', FailingHandler)
+
+    now = datetime.now(UTC)
+    for _ in range(3):
+        job_table.put_job(
+            ScheduledJob(
+                job_id=uuid4(),
+                job_type='failing_job',
+                payload={'message': 'test'},
+                scheduled_for=now - timedelta(minutes=1),
+                status='pending',
+                attempts=0,
+                created_at=now,
+            )
+        )
+
+    processed = worker.poll_and_process_jobs(now)
+    assert processed == 3
+
+    mock_capture.assert_called_once()
+
+
+class TestFailureReportThrottle:
+    """Tests for the failure report throttle."""
+
+    def test_suppresses_like_failures_within_window(self) -> None:
+        """Test that only the first failure in a window is reported."""
+        clock = Mock(return_value=100.0)
+        throttle = FailureReportThrottle(window_seconds=60, clock=clock)
+
+        assert throttle.acquire(('job', 'RuntimeError')) == 0
+        assert throttle.acquire(('job', 'RuntimeError')) is None
+        assert throttle.acquire(('job', 'ValueError')) == 0
+
+    def test_reports_suppressed_count_after_window(self) -> None:
+        """Test that the next report after the window carries the suppressed count."""
+        clock = Mock(return_value=100.0)
+        throttle = FailureReportThrottle(window_seconds=60, clock=clock)
+
+        throttle.acquire(('job', 'RuntimeError'))
+        throttle.acquire(('job', 'RuntimeError'))
+        throttle.acquire(('job', 'RuntimeError'))
+
+        clock.return_value = 161.0
+        assert throttle.acquire(('job', 'RuntimeError')) == 2
+        assert throttle.acquire(('job', 'RuntimeError')) is None
+
+    def test_evicts_oldest_fingerprint_when_full(self) -> None:
+        """Test that tracked fingerprints are bounded."""
+        clock = Mock(return_value=100.0)
+        throttle = FailureReportThrottle(window_seconds=60, max_fingerprints=2, clock=clock)
+
+        throttle.acquire(('job', 'A'))
+        throttle.acquire(('job', 'B'))
+        throttle.acquire(('job', 'C'))
+
+        # The oldest fingerprint was evicted, so it is reported again
+        assert throttle.acquire(('job', 'A')) == 0
+        assert throttle.acquire(('job', 'C')) is None
+
+
+@patch('sentry_sdk.set_context')
+@patch('sentry_sdk.capture_exception')
+def test_sentry_context_includes_suppressed_failure_count(mock_capture: Mock, mock_set_context: Mock) -> None:
+    """Test that the suppressed failure count is attached to the next report."""
+    clock = Mock(return_value=100.0)
+    worker = JobWorker(Mock())
+    worker._sentry_throttle = FailureReportThrottle(window_seconds=60, clock=clock)  # noqa: SLF001
+
+    now = datetime.now(UTC)
+    job = ScheduledJob(
+        job_id=uuid4(),
+        job_type='failing_job',
+        payload={},
+        scheduled_for=now,
+        status='pending',
+        created_at=now,
+    )
+    error = RuntimeError('boom')
+
+    worker._report_to_sentry(job, error)  # noqa: SLF001
+    worker._report_to_sentry(job, error)  # noqa: SLF001
+    clock.return_value = 200.0
+    worker._report_to_sentry(job, error)  # noqa: SLF001
+
+    assert mock_capture.call_count == 2
+    assert 'suppressed_failures' not in mock_set_context.call_args_list[0][0][1]
+    assert mock_set_context.call_args_list[1][0][1]['suppressed_failures'] == 1
@@ -3,14 +3,23 @@
 import hashlib
 import hmac
 import os
+from collections.abc import Generator
+from unittest.mock import patch
 
 import pytest
 
-from companion_memory.slack_auth import validate_slack_signature
+from companion_memory.slack_auth import MAX_REQUEST_AGE_SECONDS, validate_slack_signature
 
 pytestmark = pytest.mark.block_network
 
 
+@pytest.fixture(autouse=True)
+def request_time() -> Generator[None, None, None]:
+    """Pin the current time shortly after the 1234567890 timestamp used by these tests."""
+    with patch('companion_memory.slack_auth.time.time', return_value=1234567890 + 60):
+        yield
+
+
 def test_validate_slack_signature_with_valid_signature() -> None:
     """Test that validate_slack_signature returns True for valid signature."""
     request_body = b'token=test&text=hello'
@@ -81,3 +90,108 @@ def test_validate_slack_signature_from_env_var() -> None:
         # Clean up
         if 'SLACK_SIGNING_SECRET' in os.environ:
             del os.environ['SLACK_SIGNING_SECRET']
+
+
+def _sign(request_body: bytes, request_timestamp: str, signing_secret: str) -> str:
+    sig_basestring = f'v0:{request_timestamp}:{request_body.decode("utf-8")}'
+    return 'v0=' + hmac.new(signing_secret.encode('utf-8'), sig_basestring.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def test_validate_slack_signature_reuses_keyed_hmac_without_state_leaking() -> None:
+    """Test that repeated validations with a cached key don't affect each other."""
+    signing_secret = 'test_secret'  # noqa: S105
+    first_signature = _sign(b'text=first', '1234567890', signing_secret)
+    second_signature = _sign(b'text=second', '1234567891', signing_secret)
+
+    assert validate_slack_signature(b'text=first', '1234567890', first_signature, signing_secret) is True
+    assert validate_slack_signature(b'text=second', '1234567891', second_signature, signing_secret) is True
+    assert validate_slack_signature(b'text=first', '1234567890', first_signature, signing_secret) is True
+
+
+def test_validate_slack_signature_after_secret_rotation() -> None:
+    """Test that a rotated signing secret no longer validates old signatures."""
+    old_signature = _sign(b'text=hello', '1234567890', 'old_secret')
+    new_signature = _sign(b'text=hello', '1234567890', 'new_secret')
+
+    assert validate_slack_signature(b'text=hello', '1234567890', old_signature, 'old_secret') is True
+    assert validate_slack_signature(b'text=hello', '1234567890', old_signature, 'new_secret') is False
+    assert validate_slack_signature(b'text=hello', '1234567890', new_signature, 'new_secret') is True
+
+
+def test_validate_slack_signature_signs_raw_body_bytes() -> None:
+    """Test that bodies that aren't valid UTF-8 are signed as raw bytes instead of raising."""
+    signing_secret = 'test_secret'  # noqa: S105
+    request_body = b'payload=\xff\xfe'
+    request_timestamp = '1234567890'
+    signature = (
+        'v0='
+        + hmac.new(
+            signing_secret.encode('utf-8'), b'v0:' + request_timestamp.encode() + b':' + request_body, hashlib.sha256
+        ).hexdigest()
+    )
+
+    assert validate_slack_signature(request_body, request_timestamp, signature, signing_secret) is True
+    assert validate_slack_signature(request_body, request_timestamp, 'v0=invalid', signing_secret) is False
+
+
+def test_validate_slack_signature_rejects_wrong_length_signatures() -> None:
+    """Test that signatures of the wrong length are rejected."""
+    signature = _sign(b'text=hello', '1234567890', 'test_secret')
+
+    assert validate_slack_signature(b'text=hello', '1234567890', signature + '0', 'test_secret') is False
+    assert validate_slack_signature(b'text=hello', '1234567890', signature + '00', 'test_secret') is False
+    assert validate_slack_signature(b'text=hello', '1234567890', signature[:-1], 'test_secret') is False
+    assert validate_slack_signature(b'text=hello', '1234567890', '', 'test_secret') is False
+
+
+def test_validate_slack_signature_rejects_malformed_signatures() -> None:
+    """Test that signatures without the v0 prefix or with non-hex digits are rejected."""
+    signature = _sign(b'text=hello', '1234567890', 'test_secret')
+
+    assert validate_slack_signature(b'text=hello', '1234567890', 'v1=' + signature[3:], 'test_secret') is False
+    assert validate_slack_signature(b'text=hello', '1234567890', 'v0=' + 'zz' * 32, 'test_secret') is False
+
+
+def test_validate_slack_signature_rejects_non_canonical_hex() -> None:
+    """Test that uppercase or whitespace-padded hex digests are rejected even when they decode correctly."""
+    signature = _sign(b'text=hello', '1234567890', 'test_secret')
+    digest = signature[3:]
+
+    assert validate_slack_signature(b'text=hello', '1234567890', 'v0=' + digest.upper(), 'test_secret') is False
+    assert (
+        validate_slack_signature(b'text=hello', '1234567890', f'v0={digest[:32]} {digest[32:]}', 'test_secret') is False
+    )
+    assert validate_slack_signature(b'text=hello', '1234567890', f'v0= {digest}', 'test_secret') is False
+    assert validate_slack_signature(b'text=hello', '1234567890', f'{signature}\n', 'test_secret') is False
+    assert validate_slack_signature(b'text=hello', '1234567890', signature, 'test_secret') is True
+
+
+@pytest.mark.parametrize('request_timestamp', ['1234567890', str(1234567950 - MAX_REQUEST_AGE_SECONDS)])
+def test_validate_slack_signature_accepts_timestamps_within_max_age(request_timestamp: str) -> None:
+    """Test that requests up to MAX_REQUEST_AGE_SECONDS old are accepted."""
+    signature = _sign(b'text=hello', request_timestamp, 'test_secret')
+
+    assert validate_slack_signature(b'text=hello', request_timestamp, signature, 'test_secret') is True
+
+
+@pytest.mark.parametrize(
+    'request_timestamp',
+    [
+        str(1234567950 - MAX_REQUEST_AGE_SECONDS - 1),
+        str(1234567950 + MAX_REQUEST_AGE_SECONDS + 1),
+        '',
+        'not-a-time',
+        '-1234567890',
+        ' 1234567890',
+        '1234567890.5',
+        '\u0661\u0662\u0663',
+    ],
+)
+def test_validate_slack_signature_rejects_stale_or_malformed_timestamps_before_hmac(request_timestamp: str) -> None:
+    """Test that replayed or malformed timestamps are rejected without computing the HMAC."""
+    signature = _sign(b'text=hello', request_timestamp, 'test_secret')
+
+    with patch('companion_memory.slack_auth._primed_hmac') as mock_primed_hmac:
+        assert validate_slack_signature(b'text=hello', request_timestamp, signature, 'test_secret') is False
+
+    mock_primed_hmac.assert_not_called()
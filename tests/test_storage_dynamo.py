@@ -1,11 +1,14 @@
 """Tests for DynamoDB storage implementation."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import boto3
 import pytest
+from moto import mock_aws
 
-from companion_memory.storage import DynamoLogStore
+from companion_memory.storage import LOG_STORE_CLIENT_CONFIG, DynamoLogStore
 
 pytestmark = pytest.mark.block_network
 
@@ -13,9 +16,9 @@ pytestmark = pytest.mark.block_network
 def test_dynamo_log_store_write_log() -> None:
     """Test that DynamoLogStore.write_log() calls DynamoDB put_item."""
     # Mock boto3 client
-    mock_dynamodb = MagicMock()
+    mock_client = MagicMock()
 
-    with patch('companion_memory.storage.boto3.resource', return_value=mock_dynamodb):
+    with patch('boto3.resource'), patch('companion_memory.storage.boto3.client', return_value=mock_client):
         store = DynamoLogStore()
 
         # Test write_log
@@ -23,18 +26,35 @@ def test_dynamo_log_store_write_log() -> None:
         store.write_log(user_id='U123456789', timestamp=timestamp, text='Working on unit tests', log_id='test-log-id')
 
         # Verify DynamoDB was called
-        mock_table = mock_dynamodb.Table.return_value
-        mock_table.put_item.assert_called_once()
+        mock_client.put_item.assert_called_once()
 
         # Check the item structure
-        call_args = mock_table.put_item.call_args
+        call_args = mock_client.put_item.call_args
+        assert call_args[1]['TableName'] == 'CompanionMemory'
         item = call_args[1]['Item']
-        assert item['PK'] == 'user#U123456789'
-        assert item['SK'] == f'log#{timestamp}'
-        assert item['user_id'] == 'U123456789'
-        assert item['timestamp'] == timestamp
-        assert item['text'] == 'Working on unit tests'
-        assert item['log_id'] == 'test-log-id'
+        assert item['PK'] == {'S': 'user#U123456789'}
+        assert item['SK'] == {'S': f'log#{timestamp}'}
+        assert item['user_id'] == {'S': 'U123456789'}
+        assert item['timestamp'] == {'S': timestamp}
+        assert item['text'] == {'S': 'Working on unit tests'}
+        assert item['log_id'] == {'S': 'test-log-id'}
+
+
+def test_dynamo_log_stores_share_cached_table() -> None:
+    """Test that log stores share one DynamoDB resource per table and one client per region."""
+    with (
+        patch('companion_memory.storage.boto3.resource') as mock_resource,
+        patch('companion_memory.storage.boto3.client') as mock_client,
+    ):
+        first_store = DynamoLogStore()
+        second_store = DynamoLogStore()
+        other_store = DynamoLogStore('OtherTable')
+
+        assert first_store._table is second_store._table  # noqa: SLF001
+        assert mock_resource.call_count == 2
+        mock_resource.return_value.Table.assert_any_call('OtherTable')
+        assert first_store._client is other_store._client  # noqa: SLF001
+        mock_client.assert_called_once_with('dynamodb', region_name='us-east-1', config=LOG_STORE_CLIENT_CONFIG)
 
 
 def test_dynamo_log_store_fetch_logs() -> None:
@@ -42,33 +62,32 @@ def test_dynamo_log_store_fetch_logs() -> None:
     from datetime import UTC, datetime
 
     # Mock boto3 client
-    mock_dynamodb = MagicMock()
-    mock_table = mock_dynamodb.Table.return_value
+    mock_client = MagicMock()
 
     # Mock query response
     mock_response = {
         'Items': [
             {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T10:00:00+00:00',
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T10:00:00+00:00',
-                'text': 'Working on unit tests',
-                'log_id': 'test-log-1',
+                'pk': {'S': 'user#U123456789'},
+                'sk': {'S': 'log#2024-01-15T10:00:00+00:00'},
+                'user_id': {'S': 'U123456789'},
+                'timestamp': {'S': '2024-01-15T10:00:00+00:00'},
+                'text': {'S': 'Working on unit tests'},
+                'log_id': {'S': 'test-log-1'},
             },
             {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T11:00:00+00:00',
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T11:00:00+00:00',
-                'text': 'Debugging API',
-                'log_id': 'test-log-2',
+                'pk': {'S': 'user#U123456789'},
+                'sk': {'S': 'log#2024-01-15T11:00:00+00:00'},
+                'user_id': {'S': 'U123456789'},
+                'timestamp': {'S': '2024-01-15T11:00:00+00:00'},
+                'text': {'S': 'Debugging API'},
+                'log_id': {'S': 'test-log-2'},
             },
         ]
     }
-    mock_table.query.return_value = mock_response
+    mock_client.query.return_value = mock_response
 
-    with patch('companion_memory.storage.boto3.resource', return_value=mock_dynamodb):
+    with patch('boto3.resource'), patch('companion_memory.storage.boto3.client', return_value=mock_client):
         store = DynamoLogStore()
 
         # Test fetch_logs
@@ -76,8 +95,8 @@ def test_dynamo_log_store_fetch_logs() -> None:
         logs = store.fetch_logs('U123456789', since)
 
         # Verify DynamoDB query was called
-        mock_table.query.assert_called_once()
-        call_args = mock_table.query.call_args[1]
+        mock_client.query.assert_called_once()
+        call_args = mock_client.query.call_args[1]
         assert call_args['KeyConditionExpression'] is not None
 
         # Verify results
@@ -91,41 +110,40 @@ def test_dynamo_log_store_fetch_logs_with_pagination() -> None:
     from datetime import UTC, datetime
 
     # Mock boto3 client
-    mock_dynamodb = MagicMock()
-    mock_table = mock_dynamodb.Table.return_value
+    mock_client = MagicMock()
 
     # Mock pagination: first response has LastEvaluatedKey, second doesn't
     first_response = {
         'Items': [
             {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T10:00:00+00:00',
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T10:00:00+00:00',
-                'text': 'First batch',
-                'log_id': 'test-log-1',
+                'pk': {'S': 'user#U123456789'},
+                'sk': {'S': 'log#2024-01-15T10:00:00+00:00'},
+                'user_id': {'S': 'U123456789'},
+                'timestamp': {'S': '2024-01-15T10:00:00+00:00'},
+                'text': {'S': 'First batch'},
+                'log_id': {'S': 'test-log-1'},
             }
         ],
-        'LastEvaluatedKey': {'pk': 'user#U123456789', 'sk': 'log#2024-01-15T10:00:00+00:00'},
+        'LastEvaluatedKey': {'pk': {'S': 'user#U123456789'}, 'sk': 'log#2024-01-15T10:00:00+00:00'},
     }
 
     second_response = {
         'Items': [
             {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T11:00:00+00:00',
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T11:00:00+00:00',
-                'text': 'Second batch',
-                'log_id': 'test-log-2',
+                'pk': {'S': 'user#U123456789'},
+                'sk': {'S': 'log#2024-01-15T11:00:00+00:00'},
+                'user_id': {'S': 'U123456789'},
+                'timestamp': {'S': '2024-01-15T11:00:00+00:00'},
+                'text': {'S': 'Second batch'},
+                'log_id': {'S': 'test-log-2'},
             }
         ]
         # No LastEvaluatedKey in second response
     }
 
-    mock_table.query.side_effect = [first_response, second_response]
+    mock_client.query.side_effect = [first_response, second_response]
 
-    with patch('companion_memory.storage.boto3.resource', return_value=mock_dynamodb):
+    with patch('boto3.resource'), patch('companion_memory.storage.boto3.client', return_value=mock_client):
         store = DynamoLogStore()
 
         # Test fetch_logs with pagination
@@ -133,7 +151,7 @@ def test_dynamo_log_store_fetch_logs_with_pagination() -> None:
         logs = store.fetch_logs('U123456789', since)
 
         # Verify DynamoDB query was called twice (pagination)
-        assert mock_table.query.call_count == 2
+        assert mock_client.query.call_count == 2
 
         # Verify results from both pages
         assert len(logs) == 2
@@ -141,7 +159,7 @@ def test_dynamo_log_store_fetch_logs_with_pagination() -> None:
         assert logs[1]['text'] == 'Second batch'
 
         # Verify second call included ExclusiveStartKey
-        second_call_args = mock_table.query.call_args_list[1][1]
+        second_call_args = mock_client.query.call_args_list[1][1]
         assert 'ExclusiveStartKey' in second_call_args
 
 
@@ -150,11 +168,10 @@ def test_dynamo_log_store_fetch_logs_with_exception() -> None:
     from datetime import UTC, datetime
 
     # Mock boto3 client that raises exception
-    mock_dynamodb = MagicMock()
-    mock_table = mock_dynamodb.Table.return_value
-    mock_table.query.side_effect = Exception('DynamoDB error')
+    mock_client = MagicMock()
+    mock_client.query.side_effect = Exception('DynamoDB error')
 
-    with patch('companion_memory.storage.boto3.resource', return_value=mock_dynamodb):
+    with patch('boto3.resource'), patch('companion_memory.storage.boto3.client', return_value=mock_client):
         store = DynamoLogStore()
 
         # Test fetch_logs with exception
@@ -165,96 +182,145 @@ def test_dynamo_log_store_fetch_logs_with_exception() -> None:
         assert logs == []
 
 
-def test_dynamo_log_store_fetch_logs_with_mixed_timestamps() -> None:
-    """Test that DynamoLogStore.fetch_logs() filters by timestamp correctly."""
-    from datetime import UTC, datetime
+def _create_log_table() -> Any:  # noqa: ANN401
+    """Create the log table in the mocked DynamoDB and return it."""
+    dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+    return dynamodb.create_table(
+        TableName='CompanionMemory',
+        KeySchema=[{'AttributeName': 'PK', 'KeyType': 'HASH'}, {'AttributeName': 'SK', 'KeyType': 'RANGE'}],
+        AttributeDefinitions=[
+            {'AttributeName': 'PK', 'AttributeType': 'S'},
+            {'AttributeName': 'SK', 'AttributeType': 'S'},
+        ],
+        BillingMode='PAY_PER_REQUEST',
+    )
 
-    # Mock boto3 client
-    mock_dynamodb = MagicMock()
-    mock_table = mock_dynamodb.Table.return_value
 
-    # Mock response with logs before and after the 'since' date
-    mock_response = {
-        'Items': [
-            {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T08:00:00+00:00',  # Before 'since'
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T08:00:00+00:00',
-                'text': 'Too early',
-                'log_id': 'test-log-early',
-            },
-            {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T10:00:00+00:00',  # After 'since'
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T10:00:00+00:00',
-                'text': 'Just right',
-                'log_id': 'test-log-good',
-            },
-        ]
-    }
-    mock_table.query.return_value = mock_response
+@mock_aws
+def test_dynamo_log_store_fetch_logs_with_mixed_timestamps() -> None:
+    """Test that DynamoLogStore.fetch_logs() selects logs by sort key range."""
+    _create_log_table()
+    store = DynamoLogStore()
+    store.write_log('U123456789', '2024-01-15T08:00:00+00:00', 'Too early', 'test-log-early')
+    store.write_log('U123456789', '2024-01-15T10:00:00+00:00', 'Just right', 'test-log-good')
+    store.write_log('U987654321', '2024-01-15T10:00:00+00:00', 'Other user', 'test-log-other')
+
+    since = datetime(2024, 1, 15, 9, 0, 0, tzinfo=UTC)  # 9 AM
+    logs = store.fetch_logs('U123456789', since)
+
+    # Should only return the user's log after 9 AM, without the table keys
+    assert logs == [
+        {
+            'user_id': 'U123456789',
+            'timestamp': '2024-01-15T10:00:00+00:00',
+            'text': 'Just right',
+            'log_id': 'test-log-good',
+        }
+    ]
+
+
+@mock_aws
+def test_dynamo_log_store_fetch_logs_with_missing_timestamp() -> None:
+    """Test that DynamoLogStore.fetch_logs() handles records missing timestamp field."""
+    table = _create_log_table()
+    store = DynamoLogStore()
+    store.write_log('U123456789', '2024-01-15T10:00:00+00:00', 'Valid record', 'test-log-1')
+    table.put_item(
+        Item={
+            'PK': 'user#U123456789',
+            'SK': 'log#2024-01-15T11:00:00+00:00',
+            'user_id': 'U123456789',
+            # Missing timestamp field
+            'text': 'Corrupted record',
+            'log_id': 'test-log-2',
+        }
+    )
+    store.write_log('U123456789', '2024-01-15T12:00:00+00:00', 'Another valid record', 'test-log-3')
+
+    since = datetime(2024, 1, 15, 9, 0, 0, tzinfo=UTC)
+    logs = store.fetch_logs('U123456789', since)
+
+    # Should only return records with valid timestamp fields
+    assert [log['text'] for log in logs] == ['Valid record', 'Another valid record']
+
+
+@mock_aws
+def test_dynamo_log_store_write_logs_batches_entries() -> None:
+    """Test that DynamoLogStore.write_logs() writes more than one batch of entries."""
+    _create_log_table()
+    store = DynamoLogStore()
+    entries = [
+        {
+            'user_id': 'U123456789',
+            'timestamp': f'2024-01-15T10:{minute:02d}:00+00:00',
+            'text': f'Entry {minute}',
+            'log_id': f'test-log-{minute}',
+        }
+        for minute in range(30)
+    ]
+
+    store.write_logs(entries)
+
+    logs = store.fetch_logs('U123456789', datetime(2024, 1, 15, tzinfo=UTC))
+    assert [log['log_id'] for log in logs] == [entry['log_id'] for entry in entries]
+
+
+@mock_aws
+def test_dynamo_log_store_fetch_logs_queries_segments_concurrently() -> None:
+    """Test that segmented fetches return every log once, in time order."""
+    _create_log_table()
+    now = datetime.now(UTC)
+    since = now - timedelta(days=7)
+    store = DynamoLogStore(query_segments=4)
+    timestamps = [since + timedelta(hours=hours) for hours in range(0, 7 * 24, 5)]
+    # A log exactly on a segment boundary must not be returned twice
+    timestamps.append(since + (now - since) / 4)
+    timestamps.sort()
+    store.write_logs(
+        {'user_id': 'U123456789', 'timestamp': timestamp.isoformat(), 'text': 'Entry', 'log_id': str(index)}
+        for index, timestamp in enumerate(timestamps)
+    )
+    store.write_log('U123456789', (since - timedelta(seconds=1)).isoformat(), 'Too early', 'early')
+
+    with patch('companion_memory.storage.datetime') as mock_datetime:
+        mock_datetime.now.return_value = now
+        logs = store.fetch_logs('U123456789', since)
 
-    with patch('companion_memory.storage.boto3.resource', return_value=mock_dynamodb):
-        store = DynamoLogStore()
+    assert [log['log_id'] for log in logs] == [str(index) for index in range(len(timestamps))]
 
-        # Test fetch_logs with filtering
-        since = datetime(2024, 1, 15, 9, 0, 0, tzinfo=UTC)  # 9 AM
-        logs = store.fetch_logs('U123456789', since)
 
-        # Should only return the log after 9 AM
-        assert len(logs) == 1
-        assert logs[0]['text'] == 'Just right'
+def test_dynamo_log_store_fetch_logs_segment_exception() -> None:
+    """Test that a failing segment query makes fetch_logs fall back to an empty list."""
+    mock_client = MagicMock()
+    mock_client.query.side_effect = Exception('DynamoDB error')
 
+    with patch('boto3.resource'), patch('companion_memory.storage.boto3.client', return_value=mock_client):
+        store = DynamoLogStore(query_segments=4)
 
-def test_dynamo_log_store_fetch_logs_with_missing_timestamp() -> None:
-    """Test that DynamoLogStore.fetch_logs() handles records missing timestamp field."""
-    from datetime import UTC, datetime
+        logs = store.fetch_logs('U123456789', datetime(2024, 1, 15, tzinfo=UTC))
 
-    # Mock boto3 client
-    mock_dynamodb = MagicMock()
-    mock_table = mock_dynamodb.Table.return_value
+    assert logs == []
+    assert mock_client.query.call_count >= 1
 
-    # Mock response with some records missing timestamp field
-    mock_response = {
-        'Items': [
-            {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T10:00:00+00:00',
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T10:00:00+00:00',
-                'text': 'Valid record',
-                'log_id': 'test-log-1',
-            },
-            {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T11:00:00+00:00',
-                'user_id': 'U123456789',
-                # Missing timestamp field
-                'text': 'Corrupted record',
-                'log_id': 'test-log-2',
-            },
-            {
-                'pk': 'user#U123456789',
-                'sk': 'log#2024-01-15T12:00:00+00:00',
-                'user_id': 'U123456789',
-                'timestamp': '2024-01-15T12:00:00+00:00',
-                'text': 'Another valid record',
-                'log_id': 'test-log-3',
-            },
-        ]
-    }
-    mock_table.query.return_value = mock_response
 
-    with patch('companion_memory.storage.boto3.resource', return_value=mock_dynamodb):
-        store = DynamoLogStore()
+@pytest.mark.parametrize(
+    ('window', 'expected_queries'),
+    [
+        (timedelta(days=-1), 1),
+        (timedelta(hours=36), 1),
+        (timedelta(days=3), 3),
+        (timedelta(days=30), 4),
+    ],
+)
+def test_dynamo_log_store_fetch_logs_segments_only_long_windows(window: timedelta, expected_queries: int) -> None:
+    """Test that only windows spanning several MIN_QUERY_SEGMENT_SPANs are split, up to query_segments."""
+    mock_client = MagicMock()
+    mock_client.query.return_value = {'Items': []}
 
-        # Test fetch_logs with missing timestamp field
-        since = datetime(2024, 1, 15, 9, 0, 0, tzinfo=UTC)
-        logs = store.fetch_logs('U123456789', since)
+    with patch('boto3.resource'), patch('companion_memory.storage.boto3.client', return_value=mock_client):
+        store = DynamoLogStore(query_segments=4)
 
-        # Should only return records with valid timestamp fields
-        assert len(logs) == 2
-        assert logs[0]['text'] == 'Valid record'
-        assert logs[1]['text'] == 'Another valid record'
+        logs = store.fetch_logs('U123456789', datetime.now(UTC) - window)
+
+    assert logs == []
+    assert mock_client.query.call_count == expected_queries
@@ -123,10 +123,10 @@ def test_send_summary_message_combines_summaries_and_sends_slack() -> None:
 
     # Mock LLM client
     mock_llm = MagicMock()
-    mock_llm.complete.side_effect = [
-        'Weekly summary: Focused on testing and development.',
-        'Yesterday summary: Attended meetings and completed code reviews.',
-    ]
+    mock_llm.complete.return_value = (
+        '<weekly>\nWeekly summary: Focused on testing and development.\n</weekly>\n'
+        '<daily>Yesterday summary: Attended meetings and completed code reviews.</daily>'
+    )
 
     # Mock Slack client
     mock_slack_client = MagicMock()
@@ -135,8 +135,9 @@ def test_send_summary_message_combines_summaries_and_sends_slack() -> None:
     with patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client):
         send_summary_message(user_id='U123456789', log_store=mock_log_store, llm=mock_llm)
 
-    # Verify LLM was called twice (for week and day summaries)
-    assert mock_llm.complete.call_count == 2
+    # Verify both summaries came from one LLM call over one log fetch
+    mock_llm.complete.assert_called_once()
+    mock_log_store.fetch_logs.assert_called_once()
 
     # Verify Slack client was called to send message
     mock_slack_client.chat_postMessage.assert_called_once()
@@ -151,6 +152,186 @@ def test_send_summary_message_combines_summaries_and_sends_slack() -> None:
     assert 'Yesterday summary: Attended meetings and completed code reviews.' in message_text
 
 
+def test_send_summary_message_passes_only_yesterdays_logs_as_daily_entries() -> None:
+    """Test that the daily section of the combined prompt holds only logs since yesterday began."""
+    from unittest.mock import patch
+
+    now = datetime(2024, 1, 15, 7, 0, 0, tzinfo=UTC)
+    mock_log_store = MagicMock()
+    mock_log_store.fetch_logs.return_value = [
+        {'timestamp': '2024-01-10T12:00:00+00:00', 'text': 'Early in the week'},
+        {'timestamp': '2024-01-14T09:00:00+00:00', 'text': 'Yesterday morning'},
+        {'timestamp': '2024-01-15T06:00:00+00:00', 'text': 'This morning'},
+    ]
+    mock_llm = MagicMock()
+    mock_llm.complete.return_value = '<weekly>Week</weekly><daily>Day</daily>'
+
+    with (
+        patch('companion_memory.summarizer.datetime', wraps=datetime) as mock_datetime,
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
+        patch('companion_memory.scheduler.get_slack_client'),
+    ):
+        mock_datetime.now.return_value = now
+        send_summary_message(user_id='U123456789', log_store=mock_log_store, llm=mock_llm)
+
+    mock_log_store.fetch_logs.assert_called_once_with('U123456789', now - timedelta(days=7))
+    prompt = mock_llm.complete.call_args.args[0]
+    week_entries = prompt.split('<week-log-entries>')[1].split('</week-log-entries>')[0]
+    day_entries = prompt.split('<day-log-entries>')[1].split('</day-log-entries>')[0]
+    assert 'Early in the week' in week_entries
+    assert 'Early in the week' not in day_entries
+    assert 'Yesterday morning' in day_entries
+    assert 'This morning' in week_entries
+    assert 'This morning' not in day_entries
+
+
+def test_get_day_range_utc_uses_local_midnight_offsets_across_dst_change() -> None:
+    """Test that day bounds use the offsets in effect at each local midnight, not at the current time."""
+    import zoneinfo
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import _get_day_range_utc
+
+    tz = zoneinfo.ZoneInfo('America/New_York')
+    # Noon on the day after DST began (EDT); the midnight before the change was still EST
+    now = datetime(2024, 3, 11, 12, 0, tzinfo=tz)
+
+    with patch('companion_memory.summarizer.datetime', wraps=datetime) as mock_datetime:
+        mock_datetime.now.return_value = now
+        today_range = _get_day_range_utc(tz, days_offset=0)
+        yesterday_range = _get_day_range_utc(tz, days_offset=1)
+
+    assert today_range == (datetime(2024, 3, 11, 4, 0, tzinfo=UTC), datetime(2024, 3, 12, 4, 0, tzinfo=UTC))
+    # The day DST began was only 23 hours long
+    assert yesterday_range == (datetime(2024, 3, 10, 5, 0, tzinfo=UTC), datetime(2024, 3, 11, 4, 0, tzinfo=UTC))
+
+
+def test_single_period_summaries_skip_llm_without_log_entries() -> None:
+    """Test that week and day summaries without log entries return NO_ACTIVITY_SUMMARY directly."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import NO_ACTIVITY_SUMMARY, summarize_today, summarize_week
+
+    mock_log_store = MagicMock()
+    mock_log_store.fetch_logs.return_value = []
+    mock_llm = MagicMock()
+
+    with patch('companion_memory.summarizer.get_user_timezone', return_value=UTC):
+        assert summarize_week('U123456789', mock_log_store, mock_llm) == NO_ACTIVITY_SUMMARY
+        assert summarize_today('U123456789', mock_log_store, mock_llm) == NO_ACTIVITY_SUMMARY
+
+    mock_llm.complete.assert_not_called()
+
+
+def test_send_summary_message_skips_llm_without_log_entries() -> None:
+    """Test that a week without log entries is reported without calling the LLM."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import NO_ACTIVITY_SUMMARY
+
+    mock_log_store = MagicMock()
+    mock_log_store.fetch_logs.return_value = []
+    mock_llm = MagicMock()
+    mock_slack_client = MagicMock()
+
+    with (
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
+        patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
+    ):
+        send_summary_message(user_id='U123456789', log_store=mock_log_store, llm=mock_llm)
+
+    mock_llm.complete.assert_not_called()
+    assert mock_slack_client.chat_postMessage.call_args[1]['text'].count(NO_ACTIVITY_SUMMARY) == 2
+
+
+def test_send_summary_message_summarizes_only_the_week_when_yesterday_is_empty() -> None:
+    """Test that only the week is sent to the LLM when nothing was logged since yesterday began."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import NO_ACTIVITY_SUMMARY
+
+    now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+    mock_log_store = MagicMock()
+    mock_log_store.fetch_logs.return_value = [{'timestamp': '2024-01-10T12:00:00+00:00', 'text': 'Early in the week'}]
+    mock_llm = MagicMock()
+    mock_llm.complete.return_value = 'Week summary'
+    mock_slack_client = MagicMock()
+
+    with (
+        patch('companion_memory.summarizer.datetime', wraps=datetime) as mock_datetime,
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
+        patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
+    ):
+        mock_datetime.now.return_value = now
+        send_summary_message(user_id='U123456789', log_store=mock_log_store, llm=mock_llm)
+
+    prompt = mock_llm.complete.call_args.args[0]
+    assert 'work log entries from the past week.' in prompt
+    assert '<day-log-entries>' not in prompt
+    message_text = mock_slack_client.chat_postMessage.call_args[1]['text']
+    assert message_text.index('Week summary') < message_text.index(NO_ACTIVITY_SUMMARY)
+
+
+def test_send_summary_message_generates_summaries_concurrently() -> None:
+    """Test that without tagged sections, the two summaries are generated separately, at the same time."""
+    import threading
+    from unittest.mock import patch
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def summarize(label: str) -> object:
+        def run(*_args: object) -> str:
+            barrier.wait()  # Only passes if both summaries are in flight at once
+            return f'{label} summary'
+
+        return run
+
+    mock_slack_client = MagicMock()
+    with (
+        patch('companion_memory.summarizer.summarize_week', side_effect=summarize('Weekly')),
+        patch('companion_memory.summarizer.summarize_yesterday', side_effect=summarize('Daily')),
+        patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
+    ):
+        mock_log_store = MagicMock()
+        yesterday = datetime.now(UTC) - timedelta(days=1)
+        mock_log_store.fetch_logs.return_value = [{'timestamp': yesterday.isoformat(), 'text': 'Working'}]
+        mock_llm = MagicMock()
+        mock_llm.complete.return_value = '<weekly>Only the weekly section</weekly>'
+        send_summary_message(user_id='U123456789', log_store=mock_log_store, llm=mock_llm)
+
+    message_text = mock_slack_client.chat_postMessage.call_args[1]['text']
+    assert message_text.index('Weekly summary') < message_text.index('**Yesterday:**')
+    assert message_text.index('Daily summary') > message_text.index('**Yesterday:**')
+
+
+def test_summarize_yesterday_leaves_out_entries_logged_today() -> None:
+    """Test that entries from after yesterday ended are dropped before the prompt is built."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import summarize_yesterday
+
+    now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+    mock_log_store = MagicMock()
+    mock_log_store.fetch_logs.return_value = [
+        {'timestamp': '2024-01-14T09:00:00+00:00', 'text': 'Yesterday morning'},
+        {'timestamp': '2024-01-15T00:00:00+00:00', 'text': 'Just after midnight'},
+    ]
+    mock_llm = MagicMock()
+    mock_llm.complete.return_value = 'Yesterday summary'
+
+    with (
+        patch('companion_memory.summarizer.datetime', wraps=datetime) as mock_datetime,
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
+    ):
+        mock_datetime.now.return_value = now
+        assert summarize_yesterday('U123456789', mock_log_store, mock_llm) == 'Yesterday summary'
+
+    mock_log_store.fetch_logs.assert_called_once_with('U123456789', datetime(2024, 1, 14, tzinfo=UTC))
+    prompt = mock_llm.complete.call_args.args[0]
+    assert 'Yesterday morning' in prompt
+    assert 'Just after midnight' not in prompt
+
+
 def test_summarize_yesterday_with_timezone() -> None:
     """Test that summarize_yesterday() fetches logs for yesterday in user's timezone."""
     from unittest.mock import patch
@@ -187,7 +368,7 @@ def test_summarize_yesterday_with_timezone() -> None:
     from companion_memory.summarizer import summarize_yesterday
 
     # Test summarize_yesterday with timezone
-    with patch('companion_memory.summarizer._get_user_timezone') as mock_get_tz:
+    with patch('companion_memory.summarizer.get_user_timezone') as mock_get_tz:
         import zoneinfo
 
         mock_get_tz.return_value = zoneinfo.ZoneInfo('America/New_York')
@@ -207,7 +388,7 @@ def test_summarize_yesterday_with_timezone() -> None:
 
 
 def test_get_user_timezone_success() -> None:
-    """Test that _get_user_timezone returns correct timezone for valid user."""
+    """Test that get_user_timezone returns correct timezone for valid user."""
     from unittest.mock import MagicMock, patch
 
     # Mock DynamoDB user settings store
@@ -215,10 +396,10 @@ def test_get_user_timezone_success() -> None:
     mock_settings_store.get_user_settings.return_value = {'timezone': 'America/New_York'}
 
     # Import the helper function
-    from companion_memory.summarizer import _get_user_timezone
+    from companion_memory.summarizer import get_user_timezone
 
-    with patch('companion_memory.user_settings.DynamoUserSettingsStore', return_value=mock_settings_store):
-        timezone_result = _get_user_timezone('U123456789')
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        timezone_result = get_user_timezone('U123456789')
 
     # Verify timezone is correct
     import zoneinfo
@@ -231,7 +412,7 @@ def test_get_user_timezone_success() -> None:
 
 
 def test_get_user_timezone_fallback_to_utc() -> None:
-    """Test that _get_user_timezone falls back to UTC when no timezone is set."""
+    """Test that get_user_timezone falls back to UTC when no timezone is set."""
     from unittest.mock import MagicMock, patch
 
     # Mock user settings store with no timezone
@@ -239,10 +420,10 @@ def test_get_user_timezone_fallback_to_utc() -> None:
     mock_settings_store.get_user_settings.return_value = {}
 
     # Import the helper function
-    from companion_memory.summarizer import _get_user_timezone
+    from companion_memory.summarizer import get_user_timezone
 
-    with patch('companion_memory.user_settings.DynamoUserSettingsStore', return_value=mock_settings_store):
-        timezone_result = _get_user_timezone('U123456789')
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        timezone_result = get_user_timezone('U123456789')
 
     # Verify falls back to UTC
     from datetime import UTC
@@ -251,7 +432,7 @@ def test_get_user_timezone_fallback_to_utc() -> None:
 
 
 def test_get_user_timezone_invalid_timezone_fallback() -> None:
-    """Test that _get_user_timezone falls back to UTC for invalid timezone."""
+    """Test that get_user_timezone falls back to UTC for invalid timezone."""
     from unittest.mock import MagicMock, patch
 
     # Mock user settings store with invalid timezone
@@ -259,10 +440,10 @@ def test_get_user_timezone_invalid_timezone_fallback() -> None:
     mock_settings_store.get_user_settings.return_value = {'timezone': 'Invalid/Timezone'}
 
     # Import the helper function
-    from companion_memory.summarizer import _get_user_timezone
+    from companion_memory.summarizer import get_user_timezone
 
-    with patch('companion_memory.user_settings.DynamoUserSettingsStore', return_value=mock_settings_store):
-        timezone_result = _get_user_timezone('U123456789')
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        timezone_result = get_user_timezone('U123456789')
 
     # Verify falls back to UTC
     from datetime import UTC
@@ -271,7 +452,7 @@ def test_get_user_timezone_invalid_timezone_fallback() -> None:
 
 
 def test_get_user_timezone_utc_string_returns_utc() -> None:
-    """Test that _get_user_timezone returns UTC for 'UTC' string."""
+    """Test that get_user_timezone returns UTC for 'UTC' string."""
     from unittest.mock import MagicMock, patch
 
     # Mock user settings store with UTC timezone
@@ -279,10 +460,10 @@ def test_get_user_timezone_utc_string_returns_utc() -> None:
     mock_settings_store.get_user_settings.return_value = {'timezone': 'UTC'}
 
     # Import the helper function
-    from companion_memory.summarizer import _get_user_timezone
+    from companion_memory.summarizer import get_user_timezone
 
-    with patch('companion_memory.user_settings.DynamoUserSettingsStore', return_value=mock_settings_store):
-        timezone_result = _get_user_timezone('U123456789')
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        timezone_result = get_user_timezone('U123456789')
 
     # Verify returns UTC
     from datetime import UTC
@@ -291,7 +472,7 @@ def test_get_user_timezone_utc_string_returns_utc() -> None:
 
 
 def test_get_user_timezone_exception_fallback() -> None:
-    """Test that _get_user_timezone falls back to UTC when exception occurs."""
+    """Test that get_user_timezone falls back to UTC when exception occurs."""
     from unittest.mock import MagicMock, patch
 
     # Mock user settings store that raises exception
@@ -299,10 +480,10 @@ def test_get_user_timezone_exception_fallback() -> None:
     mock_settings_store.get_user_settings.side_effect = Exception('DynamoDB Error')
 
     # Import the helper function
-    from companion_memory.summarizer import _get_user_timezone
+    from companion_memory.summarizer import get_user_timezone
 
-    with patch('companion_memory.user_settings.DynamoUserSettingsStore', return_value=mock_settings_store):
-        timezone_result = _get_user_timezone('U123456789')
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        timezone_result = get_user_timezone('U123456789')
 
     # Verify falls back to UTC
     from datetime import UTC
@@ -311,7 +492,7 @@ def test_get_user_timezone_exception_fallback() -> None:
 
 
 def test_get_user_timezone_syncs_from_slack_when_no_record() -> None:
-    """Test that _get_user_timezone syncs from Slack when no user record exists."""
+    """Test that get_user_timezone syncs from Slack when no user record exists."""
     from unittest.mock import MagicMock, patch
 
     # Mock user settings store with no timezone
@@ -322,13 +503,13 @@ def test_get_user_timezone_syncs_from_slack_when_no_record() -> None:
     mock_sync_function = MagicMock(return_value='America/New_York')
 
     # Import the helper function
-    from companion_memory.summarizer import _get_user_timezone
+    from companion_memory.summarizer import get_user_timezone
 
     with (
-        patch('companion_memory.user_settings.DynamoUserSettingsStore', return_value=mock_settings_store),
-        patch('companion_memory.user_sync.sync_user_timezone_from_slack', mock_sync_function),
+        patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store),
+        patch('companion_memory.summarizer.sync_user_timezone_from_slack', mock_sync_function),
     ):
-        timezone_result = _get_user_timezone('U123456789')
+        timezone_result = get_user_timezone('U123456789')
 
     # Verify timezone is correct
     import zoneinfo
@@ -341,7 +522,7 @@ def test_get_user_timezone_syncs_from_slack_when_no_record() -> None:
 
 
 def test_get_user_timezone_fallback_when_slack_sync_fails() -> None:
-    """Test that _get_user_timezone falls back to UTC when Slack sync fails."""
+    """Test that get_user_timezone falls back to UTC when Slack sync fails."""
     from unittest.mock import MagicMock, patch
 
     # Mock user settings store with no timezone
@@ -352,13 +533,13 @@ def test_get_user_timezone_fallback_when_slack_sync_fails() -> None:
     mock_sync_function = MagicMock(return_value=None)
 
     # Import the helper function
-    from companion_memory.summarizer import _get_user_timezone
+    from companion_memory.summarizer import get_user_timezone
 
     with (
-        patch('companion_memory.user_settings.DynamoUserSettingsStore', return_value=mock_settings_store),
-        patch('companion_memory.user_sync.sync_user_timezone_from_slack', mock_sync_function),
+        patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store),
+        patch('companion_memory.summarizer.sync_user_timezone_from_slack', mock_sync_function),
     ):
-        timezone_result = _get_user_timezone('U123456789')
+        timezone_result = get_user_timezone('U123456789')
 
     # Verify falls back to UTC
     from datetime import UTC
@@ -401,7 +582,7 @@ def test_summarize_today_with_timezone() -> None:
     from companion_memory.summarizer import summarize_today
 
     # Test summarize_today with timezone
-    with patch('companion_memory.summarizer._get_user_timezone') as mock_get_tz:
+    with patch('companion_memory.summarizer.get_user_timezone') as mock_get_tz:
         import zoneinfo
 
         mock_get_tz.return_value = zoneinfo.ZoneInfo('America/New_York')
@@ -472,12 +653,13 @@ def test_send_daily_summary_to_users_with_users() -> None:
 
     mock_log_store = MagicMock()
     mock_llm = MagicMock()
+    mock_llm.complete.return_value = '<weekly>Weekly summary</weekly><daily>Daily summary</daily>'
     mock_slack_client = MagicMock()
 
     with (
         patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U123,U456,U789'}),
         patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
-        patch('companion_memory.summarizer._get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
     ):
         send_daily_summary_to_users(mock_log_store, mock_llm)
 
@@ -518,7 +700,8 @@ def test_check_and_send_daily_summaries_not_7am() -> None:
     with (
         patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U123'}),
         patch('companion_memory.summarizer.datetime') as mock_datetime,
-        patch('companion_memory.summarizer._get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer._prime_user_timezone_cache'),
         patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
     ):
         mock_datetime.now.return_value = mock_utc_time
@@ -537,6 +720,7 @@ def test_check_and_send_daily_summaries_is_7am() -> None:
 
     mock_log_store = MagicMock()
     mock_llm = MagicMock()
+    mock_llm.complete.return_value = '<weekly>Weekly summary</weekly><daily>Daily summary</daily>'
     mock_slack_client = MagicMock()
 
     # Mock current time as 7am UTC
@@ -545,7 +729,8 @@ def test_check_and_send_daily_summaries_is_7am() -> None:
     with (
         patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U123'}),
         patch('companion_memory.summarizer.datetime') as mock_datetime,
-        patch('companion_memory.summarizer._get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer._prime_user_timezone_cache'),
         patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
     ):
         mock_datetime.now.return_value = mock_utc_time
@@ -585,7 +770,7 @@ def test_send_daily_summary_to_users_exception_during_send() -> None:
     with (
         patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U123'}),
         patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
-        patch('companion_memory.summarizer._get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
         patch('companion_memory.summarizer.send_summary_message', side_effect=Exception('Send failed')),
     ):
         # Should not raise exception - errors are caught and logged
@@ -624,7 +809,8 @@ def test_check_and_send_daily_summaries_timezone_exception() -> None:
     with (
         patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U123'}),
         patch('companion_memory.summarizer.datetime') as mock_datetime,
-        patch('companion_memory.summarizer._get_user_timezone', side_effect=Exception('Timezone error')),
+        patch('companion_memory.summarizer.get_user_timezone', side_effect=Exception('Timezone error')),
+        patch('companion_memory.summarizer._prime_user_timezone_cache'),
         patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
     ):
         mock_datetime.now.return_value = mock_utc_time
@@ -650,10 +836,325 @@ def test_check_and_send_daily_summaries_send_exception() -> None:
     with (
         patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U123'}),
         patch('companion_memory.summarizer.datetime') as mock_datetime,
-        patch('companion_memory.summarizer._get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer.get_user_timezone', return_value=UTC),
+        patch('companion_memory.summarizer._prime_user_timezone_cache'),
         patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
         patch('companion_memory.summarizer.send_summary_message', side_effect=Exception('Send failed')),
     ):
         mock_datetime.now.return_value = mock_utc_time
         # Should not raise exception - errors are caught and logged
         check_and_send_daily_summaries(mock_log_store, mock_llm)
+
+
+def test_send_daily_summary_to_users_sends_concurrently() -> None:
+    """Test that users' summaries are sent in parallel and failures are logged per user."""
+    import threading
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import send_daily_summary_to_users
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def send(user_id: str, _log_store: object, _llm: object) -> None:
+        barrier.wait()  # Only passes if all three sends are in flight at once
+        if user_id == 'U456':
+            raise RuntimeError(user_id)
+
+    with (
+        patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U123,U456,U789'}),
+        patch('companion_memory.summarizer.send_summary_message', side_effect=send),
+        patch('companion_memory.summarizer.logger') as mock_logger,
+    ):
+        send_daily_summary_to_users(MagicMock(), MagicMock())
+
+    mock_logger.exception.assert_called_once_with('Failed to send daily summary to user %s', 'U456')
+    sent = {call.args[1] for call in mock_logger.info.call_args_list if call.args[0].startswith('Successfully')}
+    assert sent == {'U123', 'U789'}
+
+
+@pytest.mark.parametrize(('concurrency', 'expected'), [('2', 2), ('0', 1), ('50', 3)])
+def test_daily_summary_concurrency_is_bounded(concurrency: str, expected: int) -> None:
+    """Test that DAILY_SUMMARY_CONCURRENCY is clamped between 1 and the user count."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import _get_daily_summary_concurrency
+
+    with patch.dict('os.environ', {'DAILY_SUMMARY_CONCURRENCY': concurrency}):
+        assert _get_daily_summary_concurrency(3) == expected
+
+
+def test_check_and_send_daily_summaries_keeps_user_order_across_timezone_lookups() -> None:
+    """Test that concurrent timezone lookups still pick the right users, in configured order."""
+    import zoneinfo
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import check_and_send_daily_summaries
+
+    timezones = {
+        'U1': UTC,
+        'U2': zoneinfo.ZoneInfo('America/New_York'),
+        'U3': UTC,
+    }
+
+    with (
+        patch.dict('os.environ', {'DAILY_SUMMARY_USERS': 'U1,U2,U3', 'DAILY_SUMMARY_CONCURRENCY': '3'}),
+        patch('companion_memory.summarizer.datetime') as mock_datetime,
+        patch('companion_memory.summarizer.get_user_timezone', side_effect=timezones.__getitem__),
+        patch('companion_memory.summarizer._prime_user_timezone_cache'),
+        patch('companion_memory.summarizer._send_summaries_concurrently') as mock_send,
+    ):
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 7, 0, 0, tzinfo=UTC)
+        check_and_send_daily_summaries(MagicMock(), MagicMock())
+
+    mock_send.assert_called_once()
+    assert mock_send.call_args.args[0] == ['U1', 'U3']
+
+
+def test_get_user_timezone_caches_lookups_until_ttl_expires() -> None:
+    """Test that timezones are reused within the TTL and looked up again after it."""
+    import zoneinfo
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import USER_TIMEZONE_CACHE_TTL_SECONDS, get_user_timezone
+
+    mock_settings_store = MagicMock()
+    mock_settings_store.get_user_settings.return_value = {'timezone': 'America/New_York'}
+
+    with (
+        patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store),
+        patch('companion_memory.summarizer.time.monotonic', return_value=1000.0) as mock_monotonic,
+    ):
+        assert get_user_timezone('U123456789') == zoneinfo.ZoneInfo('America/New_York')
+        mock_settings_store.get_user_settings.return_value = {'timezone': 'Europe/London'}
+
+        mock_monotonic.return_value = 1000.0 + USER_TIMEZONE_CACHE_TTL_SECONDS - 1
+        assert get_user_timezone('U123456789') == zoneinfo.ZoneInfo('America/New_York')
+        assert mock_settings_store.get_user_settings.call_count == 1
+
+        mock_monotonic.return_value = 1000.0 + USER_TIMEZONE_CACHE_TTL_SECONDS
+        assert get_user_timezone('U123456789') == zoneinfo.ZoneInfo('Europe/London')
+        assert mock_settings_store.get_user_settings.call_count == 2
+
+
+def test_get_user_timezone_does_not_cache_failed_lookups() -> None:
+    """Test that a lookup error falls back to UTC without caching it."""
+    import zoneinfo
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import get_user_timezone
+
+    mock_settings_store = MagicMock()
+    mock_settings_store.get_user_settings.side_effect = [Exception('DynamoDB Error'), {'timezone': 'Asia/Tokyo'}]
+
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        assert get_user_timezone('U123456789') is UTC
+        assert get_user_timezone('U123456789') == zoneinfo.ZoneInfo('Asia/Tokyo')
+
+
+def test_prime_user_timezone_cache_loads_stored_timezones_in_one_batch() -> None:
+    """Test that priming caches stored timezones and leaves users without one to their own lookup."""
+    import zoneinfo
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import _prime_user_timezone_cache, get_user_timezone
+
+    mock_settings_store = MagicMock()
+    mock_settings_store.batch_get_user_settings.return_value = {
+        'U1': {'timezone': 'Asia/Tokyo'},
+        'U2': {'timezone': 'UTC'},
+        'U3': {},
+    }
+    mock_settings_store.get_user_settings.return_value = {'timezone': 'Europe/London'}
+
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        _prime_user_timezone_cache(['U1', 'U2', 'U3'])
+        _prime_user_timezone_cache(['U1', 'U2'])
+
+        assert get_user_timezone('U1') == zoneinfo.ZoneInfo('Asia/Tokyo')
+        assert get_user_timezone('U2') is UTC
+        assert get_user_timezone('U3') == zoneinfo.ZoneInfo('Europe/London')
+
+    mock_settings_store.batch_get_user_settings.assert_called_once_with(['U1', 'U2', 'U3'])
+    mock_settings_store.get_user_settings.assert_called_once_with('U3')
+
+
+def test_prime_user_timezone_cache_falls_back_to_individual_lookups_on_error() -> None:
+    """Test that a failed batch read is logged and nothing is cached."""
+    import zoneinfo
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import _prime_user_timezone_cache, get_user_timezone
+
+    mock_settings_store = MagicMock()
+    mock_settings_store.batch_get_user_settings.side_effect = Exception('DynamoDB Error')
+    mock_settings_store.get_user_settings.return_value = {'timezone': 'Asia/Tokyo'}
+
+    with (
+        patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store),
+        patch('companion_memory.summarizer.logger') as mock_logger,
+    ):
+        _prime_user_timezone_cache(['U1'])
+        assert get_user_timezone('U1') == zoneinfo.ZoneInfo('Asia/Tokyo')
+
+    mock_logger.exception.assert_called_once()
+    mock_settings_store.get_user_settings.assert_called_once_with('U1')
+
+
+def test_invalidate_user_timezone_forces_a_fresh_lookup() -> None:
+    """Test that invalidating a user's timezone makes the next call read the settings again."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import get_user_timezone, invalidate_user_timezone
+
+    mock_settings_store = MagicMock()
+    mock_settings_store.get_user_settings.return_value = {'timezone': 'UTC'}
+
+    with patch('companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store):
+        get_user_timezone('U123456789')
+        get_user_timezone('U123456789')
+        invalidate_user_timezone('U123456789')
+        invalidate_user_timezone('U123456789')
+        get_user_timezone('U123456789')
+
+    assert mock_settings_store.get_user_settings.call_count == 2
+
+
+def test_get_user_timezone_reuses_one_settings_store() -> None:
+    """Test that timezone lookups share a single settings store instead of building one per call."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import get_user_timezone, invalidate_user_timezone
+
+    mock_settings_store = MagicMock()
+    mock_settings_store.get_user_settings.return_value = {'timezone': 'UTC'}
+
+    with patch(
+        'companion_memory.summarizer.DynamoUserSettingsStore', return_value=mock_settings_store
+    ) as mock_store_class:
+        get_user_timezone('U123456789')
+        invalidate_user_timezone('U123456789')
+        get_user_timezone('U123456789')
+        get_user_timezone('U987654321')
+
+    mock_store_class.assert_called_once_with()
+    assert mock_settings_store.get_user_settings.call_count == 3
+
+
+def test_summary_prompt_is_dedented_regardless_of_log_text() -> None:
+    """Test that prompt instructions stay dedented even when multi-line log text is inserted."""
+    from companion_memory.summarizer import _build_summary_prompt
+
+    prompt = _build_summary_prompt('- 2024-01-15 10:00:00: One\n- 2024-01-15 11:00:00: Two', 'past week')
+
+    assert '\nYou will be acting in the role of an executive assistant' in prompt
+    assert '\n- 2024-01-15 11:00:00: Two\n</log-entries>\n' in prompt
+    assert 'work log entries from the past week.' in prompt
+
+
+def test_format_log_entries_matches_strftime_for_fractional_and_offset_timestamps() -> None:
+    """Test that formatted timestamps drop fractions and offsets exactly like strftime would."""
+    import zoneinfo
+
+    from companion_memory.summarizer import _format_log_entries
+
+    tz = zoneinfo.ZoneInfo('America/New_York')
+    timestamps = ['2024-01-15T10:00:00.999999+00:00', '2024-07-04T03:05:09+02:00', '2024-03-10T07:30:00Z']
+
+    result = _format_log_entries([{'timestamp': ts, 'text': 'x'} for ts in timestamps], tz)
+
+    expected = [f'- {datetime.fromisoformat(ts).astimezone(tz).strftime("%Y-%m-%d %H:%M:%S")}: x' for ts in timestamps]
+    assert result.split('\n') == expected
+
+
+def test_format_log_entries_keeps_most_recent_entries_within_character_budget() -> None:
+    """Test that entries over the character budget are replaced by an omitted-count line."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import _format_log_entries
+
+    logs = [{'timestamp': f'2024-01-15T1{hour}:00:00+00:00', 'text': f'entry {hour}'} for hour in range(5)]
+    lines = [f'- 2024-01-15 1{hour}:00:00: entry {hour}' for hour in range(5)]
+
+    # Each line is 30 characters, so the two newest lines joined take exactly 61
+    with patch.dict('os.environ', {'SUMMARY_MAX_LOG_CHARS': '61'}):
+        result = _format_log_entries(logs)
+
+    assert result.split('\n') == ['- ... [3 earlier entries omitted] ...', lines[3], lines[4]]
+
+
+def test_format_log_entries_keeps_everything_that_fits_the_budget_exactly() -> None:
+    """Test that the budget only applies once the joined entries exceed it."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import _format_log_entries
+
+    logs = [{'timestamp': f'2024-01-15T1{hour}:00:00+00:00', 'text': f'entry {hour}'} for hour in range(5)]
+
+    with patch.dict('os.environ', {'SUMMARY_MAX_LOG_CHARS': '154'}):
+        result = _format_log_entries(logs)
+    with patch.dict('os.environ', {'SUMMARY_MAX_LOG_CHARS': '153'}):
+        truncated = _format_log_entries(logs)
+
+    assert len(result) == 154
+    assert 'omitted' not in result
+    assert truncated.startswith('- ... [1 earlier entries omitted] ...\n- 2024-01-15 11:00:00: entry 1')
+
+
+def test_format_log_entries_with_no_entries_returns_empty_string() -> None:
+    """Test that formatting an empty log list yields an empty string."""
+    from companion_memory.summarizer import _format_log_entries
+
+    assert _format_log_entries([]) == ''
+
+
+def test_complete_summary_prompt_reuses_recent_summary_for_same_user_and_prompt() -> None:
+    """Test that an identical prompt from the same user is answered from the cache until the TTL passes."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import SUMMARY_RESPONSE_CACHE_TTL_SECONDS, _complete_summary_prompt
+
+    mock_llm = MagicMock()
+    mock_llm.complete.side_effect = ['First', 'Second', 'Third', 'Fourth']
+
+    with patch('companion_memory.summarizer.time.monotonic', return_value=1000.0) as mock_monotonic:
+        assert _complete_summary_prompt('U1', 'prompt', mock_llm) == 'First'
+        assert _complete_summary_prompt('U1', 'prompt', mock_llm) == 'First'
+        assert _complete_summary_prompt('U2', 'prompt', mock_llm) == 'Second'
+        assert _complete_summary_prompt('U1', 'other prompt', mock_llm) == 'Third'
+
+        mock_monotonic.return_value = 1000.0 + SUMMARY_RESPONSE_CACHE_TTL_SECONDS
+        assert _complete_summary_prompt('U1', 'prompt', mock_llm) == 'Fourth'
+
+    assert mock_llm.complete.call_count == 4
+
+
+def test_complete_summary_prompt_does_not_cache_failures() -> None:
+    """Test that a failed completion is retried on the next call."""
+    from companion_memory.summarizer import _complete_summary_prompt
+
+    mock_llm = MagicMock()
+    mock_llm.complete.side_effect = [Exception('LLM error'), 'Summary']
+
+    with pytest.raises(Exception, match='LLM error'):
+        _complete_summary_prompt('U1', 'prompt', mock_llm)
+    assert _complete_summary_prompt('U1', 'prompt', mock_llm) == 'Summary'
+
+
+def test_complete_summary_prompt_drops_oldest_summary_when_full() -> None:
+    """Test that the cache stays bounded by evicting its oldest entry."""
+    from unittest.mock import patch
+
+    from companion_memory.summarizer import _complete_summary_prompt, _summary_response_cache
+
+    mock_llm = MagicMock()
+    mock_llm.complete.side_effect = lambda prompt: f'Summary of {prompt}'
+
+    with patch('companion_memory.summarizer.SUMMARY_RESPONSE_CACHE_MAX_ENTRIES', 2):
+        _complete_summary_prompt('U1', 'a', mock_llm)
+        _complete_summary_prompt('U1', 'b', mock_llm)
+        _complete_summary_prompt('U1', 'c', mock_llm)
+        assert len(_summary_response_cache) == 2
+        _complete_summary_prompt('U1', 'c', mock_llm)
+        _complete_summary_prompt('U1', 'a', mock_llm)
+
+    assert [call.args[0] for call in mock_llm.complete.call_args_list] == ['a', 'b', 'c', 'a']
@@ -1,15 +1,35 @@
 """Tests for summary job handlers."""
 
 from unittest.mock import MagicMock, patch
+from urllib.error import URLError
 
 import pytest
 
 pytestmark = pytest.mark.block_network
 
 
-def test_generate_summary_enqueues_send_job() -> None:
-    """Test that generate_summary_job enqueues a send_slack_message job."""
-    from companion_memory.summary_jobs import generate_summary_job
+def test_generate_summary_sends_message_without_enqueuing_a_job() -> None:
+    """Test that generate_summary_job sends the summary directly when Slack accepts it."""
+    from companion_memory.summary_jobs import _SUMMARY_FUNCTIONS, generate_summary_job
+
+    mock_job_table = MagicMock()
+    mock_slack_client = MagicMock()
+
+    with (
+        patch.dict(_SUMMARY_FUNCTIONS, {'today': MagicMock(return_value='Daily summary for user123')}),
+        patch('companion_memory.summary_jobs.get_slack_client', return_value=mock_slack_client),
+    ):
+        generate_summary_job(
+            user_id='user123', summary_range='today', job_table=mock_job_table, log_store=MagicMock(), llm=MagicMock()
+        )
+
+    mock_slack_client.chat_postMessage.assert_called_once_with(channel='user123', text='Daily summary for user123')
+    mock_job_table.put_job.assert_not_called()
+
+
+def test_generate_summary_enqueues_send_job_when_sending_fails() -> None:
+    """Test that generate_summary_job enqueues a send_slack_message job if the direct send fails."""
+    from companion_memory.summary_jobs import _SUMMARY_FUNCTIONS, generate_summary_job
 
     # Mock dependencies
     mock_job_table = MagicMock()
@@ -18,7 +38,10 @@ def test_generate_summary_enqueues_send_job() -> None:
 
     # Mock summary generation
     expected_summary = 'Daily summary for user123'
-    with patch('companion_memory.summary_jobs.summarize_today', return_value=expected_summary):
+    with (
+        patch.dict(_SUMMARY_FUNCTIONS, {'today': MagicMock(return_value=expected_summary)}),
+        patch('companion_memory.summary_jobs.send_slack_message_job', side_effect=URLError('Slack unreachable')),
+    ):
         # Call the function we're testing
         generate_summary_job(
             user_id='user123', summary_range='today', job_table=mock_job_table, log_store=mock_log_store, llm=mock_llm
@@ -34,7 +57,8 @@ def test_generate_summary_enqueues_send_job() -> None:
     assert enqueued_job.job_type == 'send_slack_message'
     assert enqueued_job.payload['slack_user_id'] == 'user123'
     assert enqueued_job.payload['message'] == expected_summary
-    assert 'job_uuid' in enqueued_job.payload
+    assert enqueued_job.payload['job_uuid'] == str(enqueued_job.job_id)
+    assert enqueued_job.scheduled_for == enqueued_job.created_at
 
 
 def test_send_slack_message_sends_text() -> None:
@@ -104,7 +128,7 @@ def test_get_summary_invalid_range_raises_error() -> None:
 
 def test_get_summary_yesterday_range() -> None:
     """Test that get_summary calls summarize_yesterday for yesterday range."""
-    from companion_memory.summary_jobs import get_summary
+    from companion_memory.summary_jobs import _SUMMARY_FUNCTIONS, get_summary
 
     # Mock dependencies
     mock_log_store = MagicMock()
@@ -112,7 +136,8 @@ def test_get_summary_yesterday_range() -> None:
 
     # Mock summary generation
     expected_summary = 'Yesterday summary for user123'
-    with patch('companion_memory.summary_jobs.summarize_yesterday', return_value=expected_summary) as mock_summarize:
+    mock_summarize = MagicMock(return_value=expected_summary)
+    with patch.dict(_SUMMARY_FUNCTIONS, {'yesterday': mock_summarize}):
         # Call the function we're testing
         result = get_summary('user123', 'yesterday', mock_log_store, mock_llm)
 
@@ -123,7 +148,7 @@ def test_get_summary_yesterday_range() -> None:
 
 def test_get_summary_lastweek_range() -> None:
     """Test that get_summary calls summarize_week for lastweek range."""
-    from companion_memory.summary_jobs import get_summary
+    from companion_memory.summary_jobs import _SUMMARY_FUNCTIONS, get_summary
 
     # Mock dependencies
     mock_log_store = MagicMock()
@@ -131,7 +156,8 @@ def test_get_summary_lastweek_range() -> None:
 
     # Mock summary generation
     expected_summary = 'Week summary for user123'
-    with patch('companion_memory.summary_jobs.summarize_week', return_value=expected_summary) as mock_summarize:
+    mock_summarize = MagicMock(return_value=expected_summary)
+    with patch.dict(_SUMMARY_FUNCTIONS, {'lastweek': mock_summarize}):
         # Call the function we're testing
         result = get_summary('user123', 'lastweek', mock_log_store, mock_llm)
 
@@ -158,8 +184,8 @@ def test_generate_summary_handler_with_valid_payload() -> None:
     # Mock dependencies
     with (
         patch('companion_memory.app.get_log_store') as mock_get_log_store,
-        patch('companion_memory.job_table.JobTable') as mock_job_table_class,
-        patch('companion_memory.llm_client.LLMLClient') as mock_llm_class,
+        patch('companion_memory.summary_jobs.JobTable') as mock_job_table_class,
+        patch('companion_memory.summary_jobs.LLMLClient') as mock_llm_class,
         patch('companion_memory.summary_jobs.generate_summary_job') as mock_generate,
     ):
         mock_log_store = MagicMock()
@@ -169,23 +195,24 @@ def test_generate_summary_handler_with_valid_payload() -> None:
         mock_llm = MagicMock()
         mock_llm_class.return_value = mock_llm
 
-        # Create and use handler
-        handler = GenerateSummaryHandler()
-        handler.handle(payload)
+        # Create and use handlers, one per job as the dispatcher does
+        GenerateSummaryHandler().handle(payload)
+        GenerateSummaryHandler().handle(payload)
 
-        # Verify dependencies were created correctly
-        mock_get_log_store.assert_called_once()
+        # Verify the job table and LLM client were created once and shared between jobs
+        assert mock_get_log_store.call_count == 2
         mock_job_table_class.assert_called_once()
         mock_llm_class.assert_called_once()
 
         # Verify business logic was called
-        mock_generate.assert_called_once_with(
+        mock_generate.assert_called_with(
             user_id='user123',
             summary_range='today',
             job_table=mock_job_table,
             log_store=mock_log_store,
             llm=mock_llm,
         )
+        assert mock_generate.call_count == 2
 
 
 def test_generate_summary_handler_with_invalid_payload() -> None:
@@ -0,0 +1,18 @@
+"""Tests for user ID list parsing."""
+
+import pytest
+
+pytestmark = pytest.mark.block_network
+
+
+def test_parse_user_ids_caches_the_last_setting() -> None:
+    """Test that the user list is parsed once per distinct setting value."""
+    from companion_memory.user_ids import parse_user_ids
+
+    parse_user_ids.cache_clear()
+    first = parse_user_ids(' U1, ,U2 ,U3')
+
+    assert first == ('U1', 'U2', 'U3')
+    assert parse_user_ids(' U1, ,U2 ,U3') is first
+    assert parse_user_ids('U4') == ('U4',)
+    assert parse_user_ids.cache_info().hits == 1
@@ -4,6 +4,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from moto import mock_aws
 
 pytestmark = pytest.mark.block_network
 
@@ -49,13 +50,92 @@ def test_dynamo_user_settings_store_timezone() -> None:
 
         # Now update settings
         store.update_user_settings(user_id, {'timezone': 'America/Los_Angeles'})
-        mock_table.put_item.assert_called_once()
-        item = mock_table.put_item.call_args[1]['Item']
-        assert item['PK'] == f'user#{user_id}'
-        assert item['SK'] == 'settings'
-        assert item['timezone'] == 'America/Los_Angeles'
+        mock_table.update_item.assert_called_once_with(
+            Key={'PK': f'user#{user_id}', 'SK': 'settings'},
+            UpdateExpression='SET #k0 = :v0',
+            ExpressionAttributeNames={'#k0': 'timezone'},
+            ExpressionAttributeValues={':v0': 'America/Los_Angeles'},
+        )
 
         # Simulate get_item returning the settings
+        item = {'PK': f'user#{user_id}', 'SK': 'settings', 'timezone': 'America/Los_Angeles'}
         mock_table.get_item.return_value = {'Item': item}
         settings = store.get_user_settings(user_id)
         assert settings['timezone'] == 'America/Los_Angeles'
+
+
+def test_dynamo_user_settings_store_batch_get_user_settings() -> None:
+    """Test that batch reads chunk keys, drop duplicates, and retry unprocessed keys."""
+    from companion_memory.user_settings import BATCH_GET_MAX_KEYS, DynamoUserSettingsStore
+
+    user_ids = [f'U{n}' for n in range(BATCH_GET_MAX_KEYS + 1)]
+    mock_dynamodb = MagicMock()
+    unprocessed = {'CompanionMemory': {'Keys': [{'PK': 'user#U1', 'SK': 'settings'}]}}
+    mock_dynamodb.batch_get_item.side_effect = [
+        {
+            'Responses': {'CompanionMemory': [{'PK': 'user#U0', 'SK': 'settings', 'timezone': 'UTC'}]},
+            'UnprocessedKeys': unprocessed,
+        },
+        {'Responses': {'CompanionMemory': [{'PK': 'user#U1', 'SK': 'settings', 'timezone': 'Asia/Tokyo'}]}},
+        {'Responses': {}, 'UnprocessedKeys': {}},
+    ]
+
+    with patch('companion_memory.user_settings.boto3.resource', return_value=mock_dynamodb):
+        store = DynamoUserSettingsStore()
+        settings = store.batch_get_user_settings([*user_ids, 'U0'])
+
+    assert settings == {'U0': {'timezone': 'UTC'}, 'U1': {'timezone': 'Asia/Tokyo'}}
+    requests = [call.kwargs['RequestItems'] for call in mock_dynamodb.batch_get_item.call_args_list]
+    assert len(requests[0]['CompanionMemory']['Keys']) == BATCH_GET_MAX_KEYS
+    assert requests[1] == unprocessed
+    assert requests[2] == {'CompanionMemory': {'Keys': [{'PK': f'user#U{BATCH_GET_MAX_KEYS}', 'SK': 'settings'}]}}
+
+
+def test_dynamo_user_settings_stores_share_boto3_resources() -> None:
+    """Test that stores for the same table reuse one boto3 resource and Table."""
+    from companion_memory.user_settings import DynamoUserSettingsStore
+
+    with patch('companion_memory.user_settings.boto3.resource') as mock_resource:
+        first = DynamoUserSettingsStore()
+        second = DynamoUserSettingsStore()
+        other = DynamoUserSettingsStore(table_name='OtherTable')
+
+    mock_resource.assert_called_once()
+    assert first._table is second._table  # noqa: SLF001
+    table_names = [call.args[0] for call in mock_resource.return_value.Table.call_args_list]
+    assert table_names == ['CompanionMemory', 'OtherTable']
+    assert other._dynamodb is first._dynamodb  # noqa: SLF001
+
+
+@mock_aws
+def test_dynamo_user_settings_store_update_keeps_other_settings() -> None:
+    """Test that updating some settings leaves the user's other stored settings in place."""
+    from companion_memory.job_table import JobTable
+    from companion_memory.user_settings import DynamoUserSettingsStore
+
+    JobTable().create_table_for_testing()
+    store = DynamoUserSettingsStore()
+
+    store.update_user_settings('U123456789', {'timezone': 'UTC', 'name': 'Ada'})
+    store.update_user_settings('U123456789', {'timezone': 'Asia/Tokyo'})
+    store.update_user_settings('U123456789', {})
+
+    assert store.get_user_settings('U123456789') == {'timezone': 'Asia/Tokyo', 'name': 'Ada'}
+
+
+@mock_aws
+def test_dynamo_user_settings_store_iter_all_users() -> None:
+    """Test that only users with a settings item are yielded from the table scan."""
+    from companion_memory.job_table import JobTable
+    from companion_memory.user_settings import DynamoUserSettingsStore
+
+    JobTable().create_table_for_testing()
+    store = DynamoUserSettingsStore()
+    store.update_user_settings('U1', {'timezone': 'UTC'})
+    store.update_user_settings('U2', {'timezone': 'Asia/Tokyo'})
+    # Other records sharing the table are skipped
+    store._table.put_item(Item={'PK': 'user#U3', 'SK': 'log#2025-07-12T00:00:00+00:00'})  # noqa: SLF001
+    store._table.put_item(Item={'PK': 'job', 'SK': 'settings'})  # noqa: SLF001
+
+    assert sorted(store.iter_all_users()) == ['U1', 'U2']
+    assert sorted(store.iter_all_users(total_segments=1)) == ['U1', 'U2']
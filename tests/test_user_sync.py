@@ -93,6 +93,7 @@ def test_sync_user_timezone_from_slack_success() -> None:
     with (
         patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
         patch('companion_memory.user_sync.DynamoUserSettingsStore', return_value=mock_settings_store),
+        patch('companion_memory.summarizer.invalidate_user_timezone') as mock_invalidate,
     ):
         result = sync_user_timezone_from_slack('U123456789')
 
@@ -102,6 +103,32 @@ def test_sync_user_timezone_from_slack_success() -> None:
     # Verify settings store was called with correct data
     mock_settings_store.update_user_settings.assert_called_once_with('U123456789', {'timezone': 'America/New_York'})
 
+    # The synced timezone replaces any cached one
+    mock_invalidate.assert_called_once_with('U123456789')
+
+
+def test_sync_user_timezone_from_slack_skips_write_when_timezone_is_unchanged() -> None:
+    """Test that a timezone matching the stored one is not written again."""
+    from companion_memory.user_sync import sync_user_timezone_from_slack
+
+    mock_slack_client = MagicMock()
+    mock_slack_client.users_info.return_value = {'ok': True, 'user': {'id': 'U123456789', 'tz': 'America/New_York'}}
+
+    mock_settings_store = MagicMock()
+    mock_settings_store.get_user_settings.return_value = {'timezone': 'America/New_York'}
+
+    with (
+        patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
+        patch('companion_memory.user_sync.DynamoUserSettingsStore', return_value=mock_settings_store),
+        patch('companion_memory.summarizer.invalidate_user_timezone') as mock_invalidate,
+    ):
+        result = sync_user_timezone_from_slack('U123456789')
+
+    assert result == 'America/New_York'
+    mock_settings_store.get_user_settings.assert_called_once_with('U123456789')
+    mock_settings_store.update_user_settings.assert_not_called()
+    mock_invalidate.assert_not_called()
+
 
 def test_sync_user_timezone_from_slack_api_failure() -> None:
     """Test sync_user_timezone_from_slack when Slack API returns failure."""
@@ -143,3 +170,53 @@ def test_sync_user_timezone_from_slack_exception() -> None:
 
     # Should return None on exception
     assert result is None
+
+
+def test_sync_user_timezone_from_slack_shares_one_call_between_concurrent_syncs() -> None:
+    """Test that a sync arriving while another runs for the same user waits for its result."""
+    import threading
+
+    from companion_memory.user_sync import sync_user_timezone_from_slack
+
+    entered = threading.Event()
+    release = threading.Event()
+
+    def users_info(**_kwargs: object) -> dict[str, object]:
+        entered.set()
+        release.wait(timeout=5)
+        return {'ok': True, 'user': {'id': 'U123456789', 'tz': 'Asia/Tokyo'}}
+
+    mock_slack_client = MagicMock()
+    mock_slack_client.users_info.side_effect = users_info
+    results: list[str | None] = []
+
+    with (
+        patch('companion_memory.scheduler.get_slack_client', return_value=mock_slack_client),
+        patch('companion_memory.user_sync.DynamoUserSettingsStore'),
+    ):
+        leader = threading.Thread(target=lambda: results.append(sync_user_timezone_from_slack('U123456789')))
+        leader.start()
+        assert entered.wait(timeout=5)
+        # Release the running sync only after this caller has had ample time to start waiting on it
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        results.append(sync_user_timezone_from_slack('U123456789'))
+        leader.join(timeout=5)
+        timer.join()
+
+    assert results == ['Asia/Tokyo', 'Asia/Tokyo']
+    mock_slack_client.users_info.assert_called_once_with(user='U123456789')
+
+
+def test_sync_user_timezone_from_slack_clears_inflight_sync_after_an_interrupt() -> None:
+    """Test that an interrupted sync is re-raised and does not block later syncs."""
+    from companion_memory.user_sync import sync_user_timezone_from_slack
+
+    with patch(
+        'companion_memory.user_sync._fetch_and_store_user_timezone', side_effect=[KeyboardInterrupt, 'UTC']
+    ) as mock_fetch:
+        with pytest.raises(KeyboardInterrupt):
+            sync_user_timezone_from_slack('U123456789')
+        assert sync_user_timezone_from_slack('U123456789') == 'UTC'
+
+    assert mock_fetch.call_count == 2
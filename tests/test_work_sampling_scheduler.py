@@ -34,7 +34,8 @@ def mock_job_table() -> MagicMock:
 def mock_deduplication_index() -> MagicMock:
     """Mock deduplication index fixture."""
     index = MagicMock()
-    index.try_reserve.return_value = True  # Allow scheduling by default
+    # Allow scheduling by default
+    index.try_reserve_many.side_effect = lambda reservations: [True] * len(reservations)
     return index
 
 
@@ -44,8 +45,8 @@ def test_schedule_work_sampling_jobs_single_user(
     mock_deduplication_index: MagicMock,
 ) -> None:
     """Test scheduling work sampling jobs for a single user."""
-    # Mock getting users from user settings store (we need to implement this)
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user1'])
+    # Mock getting users from user settings store
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user1'])
 
     # Fixed time for testing: midnight UTC on July 12, 2025
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
@@ -75,7 +76,7 @@ def test_schedule_work_sampling_jobs_multiple_users(
 ) -> None:
     """Test scheduling work sampling jobs for multiple users."""
     # Mock getting all users
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user1', 'user2', 'user3'])
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user1', 'user2', 'user3'])
 
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
 
@@ -96,7 +97,7 @@ def test_schedule_work_sampling_jobs_timezone_handling(
     mock_deduplication_index: MagicMock,
 ) -> None:
     """Test that jobs are scheduled correctly for different timezones."""
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user1', 'user2'])
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user1', 'user2'])
 
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
 
@@ -136,10 +137,11 @@ def test_schedule_work_sampling_jobs_deduplication(
     mock_deduplication_index: MagicMock,
 ) -> None:
     """Test that deduplication prevents duplicate job scheduling."""
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user1'])
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user1'])
 
     # Make deduplication prevent some jobs
-    mock_deduplication_index.try_reserve.side_effect = [True, False, True, False, True]
+    mock_deduplication_index.try_reserve_many.side_effect = None
+    mock_deduplication_index.try_reserve_many.return_value = [True, False, True, False, True]
 
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
 
@@ -160,7 +162,7 @@ def test_schedule_work_sampling_jobs_deterministic_seeding(
     mock_deduplication_index: MagicMock,
 ) -> None:
     """Test that random scheduling is deterministic with proper seeding."""
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user1'])
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user1'])
 
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
 
@@ -188,6 +190,8 @@ def test_schedule_work_sampling_jobs_deterministic_seeding(
     for job1, job2 in zip(first_run_jobs, second_run_jobs, strict=False):
         assert job1.scheduled_for == job2.scheduled_for
         assert job1.payload == job2.payload
+        assert job1.job_id == job2.job_id
+    assert len({job.job_id for job in first_run_jobs}) == len(first_run_jobs)
 
 
 def test_schedule_work_sampling_jobs_logical_job_ids(
@@ -196,7 +200,7 @@ def test_schedule_work_sampling_jobs_logical_job_ids(
     mock_deduplication_index: MagicMock,
 ) -> None:
     """Test that logical job IDs are correctly formatted for deduplication."""
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user1'])
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user1'])
 
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
 
@@ -207,12 +211,13 @@ def test_schedule_work_sampling_jobs_logical_job_ids(
         deduplication_index=mock_deduplication_index,
     )
 
-    # Check that try_reserve was called with correct logical IDs
-    dedup_calls = mock_deduplication_index.try_reserve.call_args_list
-    assert len(dedup_calls) == 5  # One per slot
+    # Check that the slots were reserved together with correct logical IDs
+    mock_deduplication_index.try_reserve_many.assert_called_once()
+    reservations = mock_deduplication_index.try_reserve_many.call_args[0][0]
+    assert len(reservations) == 5  # One per slot
 
-    for i, call in enumerate(dedup_calls):
-        logical_id = call[0][0]  # First argument to try_reserve
+    for i, reservation in enumerate(reservations):
+        logical_id = reservation[0]
         # At midnight UTC on July 12, user1 in America/New_York is still on July 11
         expected_id = f'work_sampling_prompt:user1:2025-07-11:{i}'
         assert logical_id == expected_id
@@ -224,7 +229,7 @@ def test_schedule_work_sampling_jobs_utc_default_timezone(
     mock_deduplication_index: MagicMock,
 ) -> None:
     """Test that users without timezone setting default to UTC."""
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user4'])  # No timezone
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user4'])  # No timezone
 
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
 
@@ -252,7 +257,7 @@ def test_schedule_work_sampling_jobs_default_now_utc() -> None:
     mock_user_settings_store = MagicMock()
     mock_job_table = MagicMock()
     mock_deduplication_index = MagicMock()
-    mock_user_settings_store.get_all_users = MagicMock(return_value=[])
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=[])
 
     # Call without now_utc parameter
     schedule_work_sampling_jobs(
@@ -284,8 +289,9 @@ def test_schedule_work_sampling_jobs_invalid_timezone() -> None:
     mock_deduplication_index = MagicMock()
 
     # Set up user with invalid timezone
-    mock_user_settings_store.get_all_users = MagicMock(return_value=['user_invalid_tz'])
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user_invalid_tz'])
     mock_user_settings_store.get_user_settings.return_value = {'timezone': 'Invalid/Timezone'}
+    mock_deduplication_index.try_reserve_many.return_value = [True] * 5
 
     test_time = datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC)
 
@@ -300,29 +306,58 @@ def test_schedule_work_sampling_jobs_invalid_timezone() -> None:
     assert mock_job_table.put_job.call_count == 5
 
 
-def test_get_all_users_no_mock_method() -> None:
-    """Test _get_all_users when store doesn't have get_all_users method."""
-    from unittest.mock import patch
-
+def test_get_all_users_reads_every_user_from_the_store() -> None:
+    """Test _get_all_users collects the users the store yields."""
     from companion_memory.work_sampling_scheduler import _get_all_users
 
-    with patch('boto3.resource'):
-        from companion_memory.user_settings import DynamoUserSettingsStore
+    store = MagicMock()
+    store.iter_all_users.return_value = iter(['user1', 'user2'])
 
-        store = DynamoUserSettingsStore()
-        # This store doesn't have get_all_users method
-        users = _get_all_users(store)
-        assert users == []
+    assert _get_all_users(store) == ['user1', 'user2']
 
 
-def test_get_all_users_non_list_return() -> None:
-    """Test _get_all_users when mock method returns non-list."""
-    from unittest.mock import MagicMock
+def test_schedule_work_sampling_jobs_schedules_in_utc(
+    mock_user_settings_store: MagicMock,
+    mock_job_table: MagicMock,
+    mock_deduplication_index: MagicMock,
+) -> None:
+    """Test that jobs for users in other timezones are scheduled, and keyed, in UTC."""
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user3'])
 
-    from companion_memory.work_sampling_scheduler import _get_all_users
+    schedule_work_sampling_jobs(
+        now_utc=datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC),
+        user_settings_store=mock_user_settings_store,
+        job_table=mock_job_table,
+        deduplication_index=mock_deduplication_index,
+    )
 
-    store = MagicMock()
-    store.get_all_users = MagicMock(return_value='not a list')  # Return non-list
+    jobs = [call[0][0] for call in mock_job_table.put_job.call_args_list]
+    assert len(jobs) == 5
+    for job in jobs:
+        assert job.scheduled_for.tzinfo is UTC
+    for reservation in mock_deduplication_index.try_reserve_many.call_args[0][0]:
+        assert '+00:00#' in reservation[3]
+
+
+def test_schedule_work_sampling_jobs_reserves_and_writes_on_calling_thread(
+    mock_user_settings_store: MagicMock,
+    mock_job_table: MagicMock,
+    mock_deduplication_index: MagicMock,
+) -> None:
+    """Test that users are planned concurrently but reserved and written on the caller's thread."""
+    import threading
+
+    mock_user_settings_store.iter_all_users = MagicMock(return_value=['user1', 'user2', 'user3'])
+    write_threads = set()
+    mock_job_table.put_job.side_effect = lambda _job: write_threads.add(threading.get_ident())
 
-    users = _get_all_users(store)
-    assert users == []
+    schedule_work_sampling_jobs(
+        now_utc=datetime(2025, 7, 12, 0, 0, 0, tzinfo=UTC),
+        user_settings_store=mock_user_settings_store,
+        job_table=mock_job_table,
+        deduplication_index=mock_deduplication_index,
+    )
+
+    assert mock_deduplication_index.try_reserve_many.call_count == 3
+    assert mock_job_table.put_job.call_count == 15
+    assert write_threads == {threading.get_ident()}
@@ -20,6 +20,7 @@ def test_wsgi_creates_dynamo_log_store_and_llm_client_for_production() -> None:
         patch('companion_memory.storage.DynamoLogStore') as mock_dynamo_store,
         patch('companion_memory.llm_client.LLMLClient') as mock_llm_client,
         patch('boto3.resource') as mock_boto3,
+        patch('boto3.client'),
     ):
         # Mock instances
         mock_store_instance = MagicMock()
@@ -30,8 +31,33 @@ def test_wsgi_creates_dynamo_log_store_and_llm_client_for_production() -> None:
         mock_boto3.return_value.Table.return_value = mock_table
 
         # Import wsgi module to trigger application creation
-        from companion_memory import wsgi  # noqa: F401
+        from companion_memory import wsgi
 
         # Verify both DynamoLogStore and LLMLClient were instantiated
-        mock_dynamo_store.assert_called_once()
+        mock_dynamo_store.assert_called_once_with(query_segments=4)
         mock_llm_client.assert_called_once()
+
+        # Log writes go straight to the DynamoDB store
+        assert wsgi.log_store is mock_store_instance
+
+
+@pytest.mark.parametrize(('dsn', 'initialized'), [('', False), ('https://key@sentry.example/1', True)])
+def test_wsgi_initializes_sentry_only_with_a_dsn(dsn: str, initialized: bool) -> None:  # noqa: FBT001
+    """Test that Sentry is only initialized when a DSN is configured."""
+    import sys
+
+    sys.modules.pop('companion_memory.wsgi', None)
+
+    with (
+        patch.dict('os.environ', {'SENTRY_DSN': dsn}),
+        patch('sentry_sdk.init') as mock_sentry_init,
+        patch('companion_memory.storage.DynamoLogStore'),
+        patch('companion_memory.llm_client.LLMLClient'),
+        patch('boto3.resource'),
+        patch('boto3.client'),
+    ):
+        import companion_memory.wsgi  # noqa: F401
+
+    assert mock_sentry_init.called is initialized
+    if initialized:
+        assert mock_sentry_init.call_args.kwargs['dsn'] == dsn